@@ -1,3 +1,6 @@
+drop table if exists tombstone;
+drop table if exists item_archive;
+drop table if exists orders_archive;
 drop table if exists item;
 drop table if exists orders;
 drop table if exists status;
@@ -7,6 +10,24 @@ drop table if exists product;
 drop table if exists customer;
 
 CREATE EXTENSION IF NOT EXISTS pgcrypto;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Time-ordered RFC 9562 UUIDv7 (48-bit unix ms + random). Keys generated close
+-- together in time sort together, so inserts append to the right edge of the
+-- primary key index instead of splitting random leaf pages. Must stay
+-- bit-compatible with app.core.ids.uuid7().
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+DECLARE
+    uuid_bytes bytea;
+BEGIN
+    uuid_bytes := substring(
+        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3
+    ) || gen_random_bytes(10);
+    uuid_bytes := set_byte(uuid_bytes, 6, (get_byte(uuid_bytes, 6) & 15) | 112);
+    uuid_bytes := set_byte(uuid_bytes, 8, (get_byte(uuid_bytes, 8) & 63) | 128);
+    RETURN encode(uuid_bytes, 'hex')::uuid;
+END
+$$ LANGUAGE plpgsql VOLATILE;
 
 create table customer (
     customer_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -16,6 +37,14 @@ create table customer (
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_customer_name_id ON customer (customer_name, customer_id);
+CREATE INDEX idx_customer_updated_at_id ON customer (updated_at, customer_id);
+-- Autocomplete: C collation lets one btree serve both the LIKE 'prefix%' range and the ORDER BY
+CREATE INDEX idx_customer_name_prefix ON customer ((lower(customer_name) COLLATE "C"), customer_id);
+-- Expression must match app.core.search.search_document(customer_name, customer_email, customer_phone)
+CREATE INDEX idx_customer_search_trgm ON customer
+    USING gin ((customer_name || ' ' || customer_email || ' ' || customer_phone) gin_trgm_ops);
+
 insert into customer (customer_name, customer_email, customer_phone) VALUES
 ('John Smith', 'john.smith@gmail.com', '+12025550101'),
 ('Emily Johnson', 'emily.johnson@gmail.com', '+12025550102'),
@@ -36,6 +65,11 @@ create table product (
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_product_name_id ON product (product_name, product_id);
+CREATE INDEX idx_product_updated_at_id ON product (updated_at, product_id);
+CREATE INDEX idx_product_name_prefix ON product ((lower(product_name) COLLATE "C"), product_id);
+CREATE INDEX idx_product_search_trgm ON product USING gin (product_name gin_trgm_ops);
+
 insert into product (product_name, product_description, product_quantity) VALUES
 ('Laptop', 'A high-performance laptop suitable for all your computing needs.', 50),
 ('Smartphone', 'A latest-generation smartphone with advanced features.', 100),
@@ -49,13 +83,18 @@ insert into product (product_name, product_description, product_quantity) VALUES
 ('Mouse', 'An ergonomic wireless mouse with precision tracking.', 120);
 
 create table price (
-    price_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    price_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     product_id UUID NOT NULL REFERENCES product(product_id),
     price_amount decimal(10, 2) NOT NULL,
     price_date date NOT NULL,
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_price_date_id ON price (price_date DESC, price_id DESC);
+CREATE INDEX idx_price_updated_at_id ON price (updated_at, price_id);
+-- Current price of a product: newest price_date on or before a day.
+CREATE INDEX idx_price_product_date ON price (product_id, price_date DESC);
+
 INSERT INTO price (
     product_id,
     price_amount,
@@ -98,6 +137,12 @@ create table users (
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_users_name_id ON users (user_name, user_id);
+CREATE INDEX idx_users_updated_at_id ON users (updated_at, user_id);
+-- Expression must match app.core.search.search_document(user_name, user_email, user_phone, user_account)
+CREATE INDEX idx_users_search_trgm ON users
+    USING gin ((user_name || ' ' || user_email || ' ' || user_phone || ' ' || user_account) gin_trgm_ops);
+
 insert into users (user_name, user_email, user_phone, user_account, user_password) VALUES
 ('James Miller', 'james.miller@company.com', '+12025550101', 'james.miller', 'hashed_password_1'),
 ('Olivia Brown', 'olivia.brown@company.com', '+12025550102', 'olivia.brown', 'hashed_password_2'),
@@ -119,25 +164,97 @@ create table status (
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_status_code_id ON status (status_code, status_id);
+CREATE INDEX idx_status_updated_at_id ON status (updated_at, status_id);
+
 insert into status (status_name, status_code) VALUES
 ('Pending', 'PENDING'),
 ('Paid', 'PAID'),
 ('Delivered', 'DELIVERED'),
 ('Cancelled', 'CANCELLED');
 
+-- orders is range-partitioned by calendar month of order_date so date-filtered
+-- listings and dashboards only scan the months they ask for. The partition key
+-- has to be part of the primary key; order_id stays unique on its own because it
+-- is a UUIDv7. Partitions are named orders_YYYY_MM and are created ahead of time
+-- by app.services.partition (see create_orders_partition below); orders_default
+-- catches any order_date outside them, so a lapsed job never rejects inserts.
 create table orders (
-    order_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    order_id UUID NOT NULL DEFAULT uuid_generate_v7(),
     customer_id UUID NOT NULL REFERENCES customer(customer_id),
     user_id UUID NOT NULL REFERENCES users(user_id),
     order_total decimal(10, 2) NOT NULL DEFAULT 0,
     status_id UUID NOT NULL REFERENCES status(status_id),
     order_attachment varchar(255) DEFAULT NULL,
-    order_date timestamp DEFAULT CURRENT_TIMESTAMP,
-    updated_at timestamp DEFAULT CURRENT_TIMESTAMP
-);
+    order_date timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at timestamp DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (order_id, order_date)
+) PARTITION BY RANGE (order_date);
 
 CREATE INDEX idx_orders_order_date ON orders(order_date);
 CREATE INDEX idx_orders_order_date_id ON orders (order_date DESC, order_id DESC);
+CREATE INDEX idx_orders_updated_at_id ON orders (updated_at, order_id);
+-- Filtered order listings keep the (order_date, order_id) keyset order.
+CREATE INDEX idx_orders_customer_date_id ON orders (customer_id, order_date DESC, order_id DESC);
+CREATE INDEX idx_orders_user_date_id ON orders (user_id, order_date DESC, order_id DESC);
+CREATE INDEX idx_orders_status_date_id ON orders (status_id, order_date DESC, order_id DESC);
+
+create table orders_default partition of orders default;
+
+-- Postgres refuses a new partition while orders_default holds rows in its
+-- range, so those rows are moved into it before it is attached. The move is
+-- not a deletion: the tombstone and item triggers skip it.
+create or replace function create_orders_partition(month date)
+returns text as $$
+declare
+    month_start date := date_trunc('month', month)::date;
+    month_end date := (month_start + interval '1 month')::date;
+    partition_name text := 'orders_' || to_char(month_start, 'YYYY_MM');
+begin
+    if to_regclass(partition_name) is not null then
+        return partition_name;
+    end if;
+
+    if not exists (
+        select 1 from orders_default
+        where order_date >= month_start and order_date < month_end
+    ) then
+        execute format(
+            'create table %I partition of orders for values from (%L) to (%L)',
+            partition_name, month_start, month_end
+        );
+        return partition_name;
+    end if;
+
+    execute format(
+        'create table %I (like orders including defaults including constraints)',
+        partition_name
+    );
+    perform set_config('smart_sales.archiving', 'on', true);
+    execute format(
+        'with moved as (
+            delete from orders_default
+            where order_date >= %L and order_date < %L
+            returning *
+        )
+        insert into %I select * from moved',
+        month_start, month_end, partition_name
+    );
+    perform set_config('smart_sales.archiving', 'off', true);
+    execute format(
+        'alter table orders attach partition %I for values from (%L) to (%L)',
+        partition_name, month_start, month_end
+    );
+    return partition_name;
+end;
+$$ language plpgsql;
+
+SELECT create_orders_partition(month::date)
+FROM generate_series(
+    date_trunc('month', CURRENT_DATE) - interval '2 months',
+    date_trunc('month', CURRENT_DATE) + interval '3 months',
+    interval '1 month'
+) AS month;
 
 
 INSERT INTO orders (
@@ -170,8 +287,11 @@ CROSS JOIN (
     LIMIT 4
 ) s;
 
+-- A foreign key into a partitioned table must cover its partition key, so
+-- item -> orders integrity is enforced by the check_item_order/check_order_items
+-- triggers below instead.
 create table item (
-    order_id UUID NOT NULL REFERENCES orders(order_id),
+    order_id UUID NOT NULL,
     product_id UUID NOT NULL REFERENCES product(product_id),
     item_quantity int NOT NULL,
     item_price decimal(10, 2) NOT NULL,
@@ -179,6 +299,11 @@ create table item (
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP
 );
 
+-- GET /items pages over (order_id, product_id), which the primary key already covers.
+-- order_id leads that key, so with UUIDv7 order ids new items append at the index edge too.
+-- Product-side lookups (top products, the product foreign key on delete) need their own.
+CREATE INDEX idx_item_product_id ON item (product_id);
+
 INSERT INTO item (order_id, product_id, item_quantity, item_price)
 SELECT
     o.order_id,
@@ -261,4 +386,126 @@ execute function set_updated_at();
 create trigger trg_item_updated_at
 before update on item
 for each row
-execute function set_updated_at();
\ No newline at end of file
+execute function set_updated_at();
+
+
+-- Stand-in for item.order_id REFERENCES orders(order_id) (NO ACTION).
+create or replace function check_item_order()
+returns trigger as $$
+begin
+    perform 1 from orders where order_id = new.order_id for key share;
+    if not found then
+        raise foreign_key_violation using
+            message = format('order %s does not exist', new.order_id),
+            table = 'item';
+    end if;
+    return new;
+end;
+$$ language plpgsql;
+
+create or replace function check_order_items()
+returns trigger as $$
+begin
+    -- Moved between partitions: the order still exists for its items.
+    if current_setting('smart_sales.archiving', true) = 'on' then
+        return old;
+    end if;
+    if exists (select 1 from item where order_id = old.order_id) then
+        raise foreign_key_violation using
+            message = format('order %s still has items', old.order_id),
+            table = 'orders';
+    end if;
+    return old;
+end;
+$$ language plpgsql;
+
+create trigger trg_item_order
+before insert or update of order_id on item
+for each row
+execute function check_item_order();
+
+create trigger trg_orders_items
+before delete on orders
+for each row
+execute function check_order_items();
+
+
+-- Cold archive: app.services.archive moves DELIVERED/CANCELLED orders past the
+-- retention window, with their items, out of the hot tables. get_order and
+-- get_items_by_order fall back to these on a miss.
+create table orders_archive (
+    order_id UUID PRIMARY KEY,
+    customer_id UUID NOT NULL REFERENCES customer(customer_id),
+    user_id UUID NOT NULL REFERENCES users(user_id),
+    order_total decimal(10, 2) NOT NULL,
+    status_id UUID NOT NULL REFERENCES status(status_id),
+    order_attachment varchar(255) DEFAULT NULL,
+    order_date timestamp NOT NULL,
+    updated_at timestamp,
+    archived_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Items are moved before their orders, so the reference is checked at commit.
+create table item_archive (
+    order_id UUID NOT NULL REFERENCES orders_archive(order_id) DEFERRABLE INITIALLY DEFERRED,
+    product_id UUID NOT NULL REFERENCES product(product_id),
+    item_quantity int NOT NULL,
+    item_price decimal(10, 2) NOT NULL,
+    updated_at timestamp,
+    PRIMARY KEY (order_id, product_id)
+);
+
+
+-- Change feed (GET /changes): deleted rows leave a tombstone behind
+create table tombstone (
+    tombstone_id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    table_name varchar(30) NOT NULL,
+    row_id UUID NOT NULL,
+    deleted_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_tombstone_table_deleted_at_id ON tombstone (table_name, deleted_at, tombstone_id);
+
+create or replace function record_tombstone()
+returns trigger as $$
+begin
+    -- Archived rows are moved, not deleted: sync clients keep them.
+    if current_setting('smart_sales.archiving', true) = 'on' then
+        return old;
+    end if;
+    -- Partitioned tables fire this per partition, so they pass their own name.
+    insert into tombstone (table_name, row_id)
+    values (coalesce(tg_argv[1], tg_table_name), (to_jsonb(old) ->> tg_argv[0])::uuid);
+    return old;
+end;
+$$ language plpgsql;
+
+create trigger trg_customer_tombstone
+after delete on customer
+for each row
+execute function record_tombstone('customer_id');
+
+create trigger trg_product_tombstone
+after delete on product
+for each row
+execute function record_tombstone('product_id');
+
+create trigger trg_price_tombstone
+after delete on price
+for each row
+execute function record_tombstone('price_id');
+
+create trigger trg_users_tombstone
+after delete on users
+for each row
+execute function record_tombstone('user_id');
+
+create trigger trg_status_tombstone
+after delete on status
+for each row
+execute function record_tombstone('status_id');
+
+create trigger trg_orders_tombstone
+after delete on orders
+for each row
+execute function record_tombstone('order_id', 'orders');
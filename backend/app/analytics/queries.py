@@ -0,0 +1,210 @@
+from datetime import date, datetime, timedelta
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+from dateutil.relativedelta import relativedelta
+from app.analytics.snapshot import (
+    ITEMS_TABLE,
+    ORDERS_TABLE,
+    PARTITION_COLUMN,
+    SCHEMAS,
+    SNAPSHOT_URI,
+    get_filesystem,
+)
+from app.analytics.summary import SUMMARY_FILE
+from app.schemas.order import (
+    DashboardSummaryResponse,
+    MonthlyRevenueSummaryResponse,
+    RevenueSummaryResponse,
+    TopProductSummaryResponse,
+    TotalOrdersSummaryResponse,
+)
+
+DAYS_RANGE = 6
+MONTH_RANGE = 11
+NUMBER_OF_PRODUCTS = 5
+# Excluded everywhere, matching the dashboard queries in app.services.order.
+CANCELLED = "CANCELLED"
+
+PARTITIONING = ds.partitioning(
+    pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive"
+)
+
+
+def load_table(
+    table_name: str,
+    columns: list[str],
+    start: date | None = None,
+    end: date | None = None,
+    uri: str = SNAPSHOT_URI,
+) -> pa.Table:
+    fs, root = get_filesystem(uri)
+    path = f"{root}/{table_name}"
+    schema = SCHEMAS[table_name].append(pa.field(PARTITION_COLUMN, pa.string()))
+
+    if fs.get_file_info(path).type == pafs.FileType.NotFound:
+        return schema.empty_table().select(columns)
+
+    dataset = ds.dataset(
+        path, schema=schema, format="parquet", filesystem=fs, partitioning=PARTITIONING
+    )
+
+    condition = ds.field("status_code") != CANCELLED
+    # ISO dates compare correctly as strings, so these prune partitions.
+    if start is not None:
+        condition &= ds.field(PARTITION_COLUMN) >= start.isoformat()
+    if end is not None:
+        condition &= ds.field(PARTITION_COLUMN) <= end.isoformat()
+
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+def _daily(table: pa.Table, aggregation: tuple[str, str]) -> dict[date, float]:
+    grouped = table.group_by(PARTITION_COLUMN).aggregate([aggregation])
+    column = "_".join(aggregation)
+    return {
+        date.fromisoformat(day): total
+        for day, total in zip(
+            grouped[PARTITION_COLUMN].to_pylist(), grouped[column].to_pylist()
+        )
+    }
+
+
+def orders_by_day(start: date, end: date, uri: str = SNAPSHOT_URI) -> dict[date, int]:
+    table = load_table(ORDERS_TABLE, [PARTITION_COLUMN, "order_id"], start, end, uri)
+    return _daily(table, ("order_id", "count"))
+
+
+def revenue_by_day(start: date, end: date, uri: str = SNAPSHOT_URI) -> dict[date, float]:
+    table = load_table(ORDERS_TABLE, [PARTITION_COLUMN, "order_total"], start, end, uri)
+    table = table.set_column(1, "order_total", pc.cast(table["order_total"], pa.float64()))
+    return _daily(table, ("order_total", "sum"))
+
+
+def revenue_by_month(start: date, end: date, uri: str = SNAPSHOT_URI) -> dict[str, float]:
+    table = load_table(ORDERS_TABLE, [PARTITION_COLUMN, "order_total"], start, end, uri)
+    months = pa.table(
+        {
+            "month": pc.utf8_slice_codeunits(table[PARTITION_COLUMN], 0, 7),
+            "order_total": pc.cast(table["order_total"], pa.float64()),
+        }
+    )
+    grouped = months.group_by("month").aggregate([("order_total", "sum")])
+    return dict(
+        zip(grouped["month"].to_pylist(), grouped["order_total_sum"].to_pylist())
+    )
+
+
+def _item_revenue(table: pa.Table) -> pa.Array:
+    return pc.multiply(
+        pc.cast(table["item_price"], pa.float64()),
+        pc.cast(table["item_quantity"], pa.float64()),
+    )
+
+
+def top_products(
+    start: date,
+    end: date,
+    limit: int = NUMBER_OF_PRODUCTS,
+    uri: str = SNAPSHOT_URI,
+) -> list[dict]:
+    table = load_table(
+        ITEMS_TABLE,
+        ["product_id", "product_name", "item_price", "item_quantity"],
+        start,
+        end,
+        uri,
+    )
+    table = table.append_column("revenue", _item_revenue(table))
+    grouped = (
+        table.group_by(["product_id", "product_name"])
+        .aggregate([("revenue", "sum"), ("item_quantity", "sum")])
+        .sort_by([("revenue_sum", "descending")])
+        .slice(0, limit)
+    )
+    return [
+        {
+            "product_id": row["product_id"],
+            "product_name": row["product_name"],
+            "revenue": row["revenue_sum"],
+            "quantity": row["item_quantity_sum"],
+        }
+        for row in grouped.to_pylist()
+    ]
+
+
+def top_customers(
+    start: date,
+    end: date,
+    limit: int = NUMBER_OF_PRODUCTS,
+    uri: str = SNAPSHOT_URI,
+) -> list[dict]:
+    table = load_table(
+        ORDERS_TABLE,
+        ["customer_id", "customer_name", "order_id", "order_total"],
+        start,
+        end,
+        uri,
+    )
+    table = table.set_column(3, "order_total", pc.cast(table["order_total"], pa.float64()))
+    grouped = (
+        table.group_by(["customer_id", "customer_name"])
+        .aggregate([("order_total", "sum"), ("order_id", "count")])
+        .sort_by([("order_total_sum", "descending")])
+        .slice(0, limit)
+    )
+    return [
+        {
+            "customer_id": row["customer_id"],
+            "customer_name": row["customer_name"],
+            "revenue": row["order_total_sum"],
+            "orders": row["order_id_count"],
+        }
+        for row in grouped.to_pylist()
+    ]
+
+
+def dashboard_summary(
+    today: date | None = None, uri: str = SNAPSHOT_URI
+) -> DashboardSummaryResponse:
+    today = today or datetime.now().date()
+    seven_days_ago = today - timedelta(days=DAYS_RANGE)
+    start_month = (today - relativedelta(months=MONTH_RANGE)).replace(day=1)
+
+    orders = orders_by_day(seven_days_ago, today, uri)
+    revenue = revenue_by_day(seven_days_ago, today, uri)
+    monthly = revenue_by_month(start_month, today, uri)
+    products = top_products(seven_days_ago, today, NUMBER_OF_PRODUCTS, uri)
+
+    days = [seven_days_ago + timedelta(days=i) for i in range(DAYS_RANGE + 1)]
+    months = [
+        (start_month + relativedelta(months=i)).strftime("%Y-%m")
+        for i in range(MONTH_RANGE + 1)
+    ]
+
+    return DashboardSummaryResponse(
+        total_orders=[
+            TotalOrdersSummaryResponse(key=day, total=orders.get(day, 0)) for day in days
+        ],
+        total_revenue=[
+            RevenueSummaryResponse(key=day, total=revenue.get(day, 0)) for day in days
+        ],
+        monthly_revenue=[
+            MonthlyRevenueSummaryResponse(key=month, total=monthly.get(month, 0))
+            for month in months
+        ],
+        top_products=[
+            TopProductSummaryResponse(key=product["product_name"], total=product["revenue"])
+            for product in products
+        ],
+    )
+
+
+def write_dashboard_summary(
+    summary: DashboardSummaryResponse, uri: str = SNAPSHOT_URI
+) -> None:
+    fs, root = get_filesystem(uri)
+    fs.create_dir(root, recursive=True)
+    with fs.open_output_stream(f"{root}/{SUMMARY_FILE}") as f:
+        f.write(summary.model_dump_json(by_alias=True).encode())
@@ -0,0 +1,259 @@
+"""Incremental Parquet snapshot of orders and items, partitioned by order day.
+
+    python -m app.analytics.snapshot --uri s3://smart-sales-images/analytics
+"""
+
+import argparse
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from typing import Sequence
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from sqlalchemy import exists, func, or_, select, true
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import ColumnElement, Select
+from app.analytics.summary import SNAPSHOT_URI
+from app.core.logger import logger
+from app.database import SessionLocal
+from app.models import Order, User, Customer, Status, Item, Product
+
+SNAPSHOT_BATCH_SIZE = int(os.getenv("ANALYTICS_SNAPSHOT_BATCH_SIZE", "5000"))
+# Transactions still open when a run starts commit rows with an older
+# updated_at; re-reading this window on the next run picks them up.
+SNAPSHOT_LAG = timedelta(minutes=int(os.getenv("ANALYTICS_SNAPSHOT_LAG_MINUTES", "5")))
+
+ORDERS_TABLE = "orders"
+ITEMS_TABLE = "items"
+PARTITION_COLUMN = "order_day"
+PART_FILE = "part-0.parquet"
+STATE_FILE = "_state.json"
+
+MONEY = pa.decimal128(12, 2)
+TIMESTAMP = pa.timestamp("us")
+
+ORDERS_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("order_date", TIMESTAMP),
+        ("status_code", pa.string()),
+        ("order_total", MONEY),
+        ("customer_id", pa.string()),
+        ("customer_name", pa.string()),
+        ("user_id", pa.string()),
+        ("user_name", pa.string()),
+        ("updated_at", TIMESTAMP),
+    ]
+)
+
+ITEMS_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("order_date", TIMESTAMP),
+        ("status_code", pa.string()),
+        ("customer_id", pa.string()),
+        ("product_id", pa.string()),
+        ("product_name", pa.string()),
+        ("item_quantity", pa.int32()),
+        ("item_price", MONEY),
+        ("updated_at", TIMESTAMP),
+    ]
+)
+
+SCHEMAS = {ORDERS_TABLE: ORDERS_SCHEMA, ITEMS_TABLE: ITEMS_SCHEMA}
+
+
+@dataclass
+class SnapshotResult:
+    watermark: datetime
+    partitions: int = 0
+    orders: int = 0
+    items: int = 0
+
+
+def get_filesystem(uri: str = SNAPSHOT_URI) -> tuple[pafs.FileSystem, str]:
+    if "://" not in uri:
+        uri = os.path.abspath(uri)
+    return pafs.FileSystem.from_uri(uri)
+
+
+def partition_path(root: str, table: str, day: date) -> str:
+    return f"{root}/{table}/{PARTITION_COLUMN}={day.isoformat()}/{PART_FILE}"
+
+
+def _exists(fs: pafs.FileSystem, path: str) -> bool:
+    return fs.get_file_info(path).type != pafs.FileType.NotFound
+
+
+def read_watermark(fs: pafs.FileSystem, root: str) -> datetime | None:
+    path = f"{root}/{STATE_FILE}"
+    if not _exists(fs, path):
+        return None
+    with fs.open_input_stream(path) as f:
+        state = json.loads(f.read())
+    return datetime.fromisoformat(state["watermark"])
+
+
+def write_watermark(fs: pafs.FileSystem, root: str, watermark: datetime) -> None:
+    fs.create_dir(root, recursive=True)
+    with fs.open_output_stream(f"{root}/{STATE_FILE}") as f:
+        f.write(json.dumps({"watermark": watermark.isoformat()}).encode())
+
+
+def _changed_since(since: datetime | None) -> ColumnElement:
+    if since is None:
+        return true()
+    # Aliased so it is not correlated with the outer join on item.
+    changed_item = aliased(Item)
+    item_changed = (
+        exists()
+        .where(changed_item.order_id == Order.order_id, changed_item.updated_at > since)
+        .correlate(Order)
+    )
+    return or_(Order.updated_at > since, item_changed)
+
+
+def _snapshot_statement(since: datetime | None) -> Select:
+    # One row per item (or one item-less row per empty order), ordered so
+    # each order, and each order day, arrives as a contiguous run.
+    return (
+        select(
+            Order.order_id,
+            Order.order_date,
+            Status.status_code,
+            Order.order_total,
+            Order.customer_id,
+            Customer.customer_name,
+            Order.user_id,
+            User.user_name,
+            Order.updated_at,
+            Item.product_id,
+            Product.product_name,
+            Item.item_quantity,
+            Item.item_price,
+            Item.updated_at.label("item_updated_at"),
+        )
+        .select_from(Order)
+        .join(Order.status)
+        .join(Order.customer)
+        .join(Order.user)
+        .outerjoin(Item, Item.order_id == Order.order_id)
+        .outerjoin(Product, Product.product_id == Item.product_id)
+        .where(_changed_since(since))
+        .order_by(Order.order_date, Order.order_id)
+    )
+
+
+def _to_tables(rows: Sequence[Row]) -> tuple[pa.Table, pa.Table]:
+    orders = {name: [] for name in ORDERS_SCHEMA.names}
+    items = {name: [] for name in ITEMS_SCHEMA.names}
+
+    last_order_id = None
+    for row in rows:
+        order_id = str(row.order_id)
+        if order_id != last_order_id:
+            last_order_id = order_id
+            orders["order_id"].append(order_id)
+            orders["order_date"].append(row.order_date)
+            orders["status_code"].append(row.status_code)
+            orders["order_total"].append(row.order_total)
+            orders["customer_id"].append(str(row.customer_id))
+            orders["customer_name"].append(row.customer_name)
+            orders["user_id"].append(str(row.user_id))
+            orders["user_name"].append(row.user_name)
+            orders["updated_at"].append(row.updated_at)
+
+        if row.product_id is None:
+            continue
+        items["order_id"].append(order_id)
+        items["order_date"].append(row.order_date)
+        items["status_code"].append(row.status_code)
+        items["customer_id"].append(str(row.customer_id))
+        items["product_id"].append(str(row.product_id))
+        items["product_name"].append(row.product_name)
+        items["item_quantity"].append(row.item_quantity)
+        items["item_price"].append(row.item_price)
+        items["updated_at"].append(row.item_updated_at)
+
+    return (
+        pa.Table.from_pydict(orders, schema=ORDERS_SCHEMA),
+        pa.Table.from_pydict(items, schema=ITEMS_SCHEMA),
+    )
+
+
+def upsert_partition(
+    fs: pafs.FileSystem,
+    root: str,
+    table_name: str,
+    day: date,
+    changes: pa.Table,
+    order_ids: pa.Array,
+) -> None:
+    # Changed orders replace all of their previous rows, which also drops
+    # items that were removed from an order since the last run.
+    path = partition_path(root, table_name, day)
+    if _exists(fs, path):
+        existing = pq.read_table(path, filesystem=fs, schema=SCHEMAS[table_name])
+        kept = existing.filter(
+            pc.invert(pc.is_in(existing["order_id"], value_set=order_ids))
+        )
+        changes = pa.concat_tables([kept, changes])
+
+    fs.create_dir(path.rsplit("/", 1)[0], recursive=True)
+    pq.write_table(changes.sort_by("order_date"), path, filesystem=fs)
+
+
+def run_snapshot(db: Session, uri: str = SNAPSHOT_URI) -> SnapshotResult:
+    fs, root = get_filesystem(uri)
+    since = read_watermark(fs, root)
+    started_at = db.execute(select(func.localtimestamp())).scalar_one()
+    result = SnapshotResult(watermark=started_at - SNAPSHOT_LAG)
+
+    stmt = _snapshot_statement(since).execution_options(yield_per=SNAPSHOT_BATCH_SIZE)
+    try:
+        for day, rows in groupby(db.execute(stmt), key=lambda row: row.order_date.date()):
+            orders, items = _to_tables(list(rows))
+            order_ids = orders["order_id"].combine_chunks()
+            upsert_partition(fs, root, ORDERS_TABLE, day, orders, order_ids)
+            upsert_partition(fs, root, ITEMS_TABLE, day, items, order_ids)
+
+            result.partitions += 1
+            result.orders += orders.num_rows
+            result.items += items.num_rows
+    finally:
+        db.rollback()
+
+    write_watermark(fs, root, result.watermark)
+    logger.info(
+        "Analytics snapshot written",
+        extra={
+            "since": since.isoformat() if since else None,
+            "watermark": result.watermark.isoformat(),
+            "partitions": result.partitions,
+            "orders": result.orders,
+            "items": result.items,
+        },
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uri", default=SNAPSHOT_URI)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = run_snapshot(db, args.uri)
+    print(
+        f"partitions={result.partitions} orders={result.orders} "
+        f"items={result.items} watermark={result.watermark.isoformat()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
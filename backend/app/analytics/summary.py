@@ -0,0 +1,31 @@
+import os
+from botocore.exceptions import ClientError
+from app.s3_client import get_s3_client
+from app.schemas.order import DashboardSummaryResponse
+
+# No pyarrow here: the API function reads the dashboard the snapshot job
+# precomputed, and only AnalyticsSnapshotFunction packages pyarrow.
+SNAPSHOT_URI = os.getenv("ANALYTICS_SNAPSHOT_URI", "analytics")
+SUMMARY_FILE = "dashboard.json"
+
+
+def read_dashboard_summary(
+    uri: str = SNAPSHOT_URI,
+) -> DashboardSummaryResponse | None:
+    if uri.startswith("s3://"):
+        bucket, _, prefix = uri.removeprefix("s3://").partition("/")
+        key = f"{prefix.rstrip('/')}/{SUMMARY_FILE}".lstrip("/")
+        try:
+            response = get_s3_client().get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        body = response["Body"].read()
+    else:
+        path = os.path.join(uri, SUMMARY_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            body = f.read()
+    return DashboardSummaryResponse.model_validate_json(body)
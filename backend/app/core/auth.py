@@ -0,0 +1,127 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPStatus
+from aws_lambda_powertools.event_handler import Response
+from app.core.logger import logger
+from app.core.response import error
+
+AUTH_TOKEN_TTL_SECONDS = int(os.getenv("AUTH_TOKEN_TTL_SECONDS", "900"))
+# Off until every client logs in; a presented token is always verified.
+# Until then each request without a token is logged ("Unauthenticated
+# request"), so the flip can wait for that log to go quiet.
+AUTH_REQUIRED = os.getenv("AUTH_REQUIRED", "false").lower() == "true"
+
+# (method, resource) pairs reachable without a token.
+PUBLIC_ROUTES = {("POST", "/auth/login")}
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    user_id: uuid.UUID
+    expires_at: int
+
+
+@lru_cache(maxsize=1)
+def signing_key() -> bytes:
+    secret = os.getenv("AUTH_TOKEN_SECRET")
+    if not secret:
+        raise RuntimeError("Missing environment variables: AUTH_TOKEN_SECRET")
+    return secret.encode()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(signing_key(), payload.encode(), hashlib.sha256).digest()
+    return _b64encode(digest)
+
+
+def issue_token(user_id: uuid.UUID, now: float | None = None) -> str:
+    """<base64url JSON claims>.<base64url HMAC-SHA256 of the claims>."""
+    issued_at = int(time.time() if now is None else now)
+    claims = {
+        "sub": str(user_id),
+        "iat": issued_at,
+        "exp": issued_at + AUTH_TOKEN_TTL_SECONDS,
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify_token(token: str, now: float | None = None) -> TokenClaims:
+    payload, _, signature = token.partition(".")
+    if not payload or not hmac.compare_digest(
+        signature.encode(), _sign(payload).encode()
+    ):
+        raise InvalidTokenError("Invalid token")
+
+    try:
+        claims = json.loads(_b64decode(payload))
+        user_id = uuid.UUID(claims["sub"])
+        expires_at = int(claims["exp"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidTokenError("Invalid token")
+
+    if expires_at <= (time.time() if now is None else now):
+        raise InvalidTokenError("Token has expired")
+    return TokenClaims(user_id=user_id, expires_at=expires_at)
+
+
+def bearer_token(headers: dict[str, str] | None) -> str | None:
+    for name, value in (headers or {}).items():
+        if name.lower() == "authorization":
+            scheme, _, token = value.partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+    return None
+
+
+def authenticate(app, next_middleware) -> Response:
+    """Global middleware: an HMAC check per request instead of a bcrypt verify.
+
+    The caller's user id is available to routes as app.context["user_id"].
+    """
+    event = app.current_event
+    if (
+        event.http_method == "OPTIONS"
+        or (event.http_method, event.resource) in PUBLIC_ROUTES
+    ):
+        return next_middleware(app)
+
+    token = bearer_token(event.headers)
+    if token is None:
+        if AUTH_REQUIRED:
+            return error(
+                message="Authentication required",
+                status_code=HTTPStatus.UNAUTHORIZED,
+            )
+        logger.info(
+            "Unauthenticated request",
+            extra={"method": event.http_method, "resource": event.resource},
+        )
+        return next_middleware(app)
+
+    try:
+        claims = verify_token(token)
+    except InvalidTokenError as e:
+        return error(message=str(e), status_code=HTTPStatus.UNAUTHORIZED)
+
+    app.append_context(user_id=claims.user_id)
+    return next_middleware(app)
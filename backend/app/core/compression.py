@@ -0,0 +1,101 @@
+import base64
+import gzip
+import os
+from typing import Any
+
+try:
+    import brotli
+except ImportError:  # gzip alone still covers every browser
+    brotli = None
+
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+GZIP = "gzip"
+BROTLI = "br"
+
+
+def supported_encodings() -> list[str]:
+    # Preference order when the client weights them equally.
+    return [BROTLI, GZIP] if brotli is not None else [GZIP]
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == BROTLI:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _headers(response: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    if "multiValueHeaders" in response:
+        return response["multiValueHeaders"], True
+    return response.setdefault("headers", {}), False
+
+
+def _has_header(headers: dict[str, Any], name: str) -> bool:
+    return any(key.lower() == name.lower() for key in headers)
+
+
+def compress_response(
+    response: dict[str, Any], accept_encoding: str | None
+) -> dict[str, Any]:
+    """Compress a resolved API Gateway proxy response in place.
+
+    Bodies under COMPRESSION_MIN_BYTES are left alone: below about one
+    packet the CPU spent outweighs the bytes saved. The compressed body is
+    base64-encoded, as API Gateway expects for binary payloads.
+    """
+    body = response.get("body")
+    if not isinstance(body, str) or response.get("isBase64Encoded"):
+        return response
+
+    headers, multi_value = _headers(response)
+    if _has_header(headers, "Content-Encoding"):
+        return response
+
+    raw = body.encode()
+    if len(raw) < COMPRESSION_MIN_BYTES:
+        return response
+
+    def set_header(name: str, value: str) -> None:
+        headers[name] = [value] if multi_value else value
+
+    set_header("Vary", "Accept-Encoding")
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    compressed = compress(raw, encoding)
+    if len(compressed) >= len(raw):
+        return response
+
+    set_header("Content-Encoding", encoding)
+    response["body"] = base64.b64encode(compressed).decode()
+    response["isBase64Encoded"] = True
+    return response
@@ -0,0 +1,49 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any
+from app.core.pagination import _to_json
+
+# Browsers keep the payload but must ask before reusing it; a matching
+# ETag turns that into an empty 304.
+CACHE_REVALIDATE = "private, no-cache"
+
+# updated_at is the writing transaction's start time, so a write that commits
+# after a newer one was served can leave max(updated_at) and the count as
+# they were. Aggregate fingerprints get no ETag until their newest version is
+# this old: the same horizon GET /changes holds its tokens back by.
+ETAG_SETTLE = timedelta(seconds=float(os.getenv("CHANGES_LAG_SECONDS", "5")))
+
+
+def compute_etag(*parts: Any) -> str:
+    # Weak: derived from row versions, not from the serialized bytes.
+    raw = json.dumps(
+        [_to_json(part) for part in parts], separators=(",", ":"), default=str
+    )
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:24]}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    if not if_none_match or not etag:
+        return False
+    tags = [_opaque_tag(tag) for tag in if_none_match.split(",")]
+    return "*" in tags or _opaque_tag(etag) in tags
+
+
+def cache_headers(etag: str, cache_control: str = CACHE_REVALIDATE) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def fingerprint_headers(fingerprint: tuple, *parts: Any) -> dict[str, str]:
+    # Aggregate fingerprints end with the database's localtimestamp.
+    *versions, now = fingerprint
+    horizon = now - ETAG_SETTLE
+    if any(isinstance(v, datetime) and v > horizon for v in versions):
+        return {"Cache-Control": CACHE_REVALIDATE}
+    return cache_headers(compute_etag(*parts, *versions))
@@ -0,0 +1,70 @@
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+UUID_VERSION_7 = 7
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit unix milliseconds, then random bits.
+
+    Ids generated in the same millisecond by this process stay ordered via a
+    12-bit counter in rand_a, so consecutive inserts always land at the right
+    edge of the primary key index. Must stay bit-compatible with
+    uuid_generate_v7() in SmartSales.sql.
+    """
+    global _last_timestamp_ms, _last_counter
+
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            counter = int.from_bytes(os.urandom(2)) & (_COUNTER_MAX >> 1)
+        else:
+            timestamp_ms = _last_timestamp_ms
+            counter = _last_counter + 1
+            if counter > _COUNTER_MAX:
+                timestamp_ms += 1
+                counter = 0
+        _last_timestamp_ms = timestamp_ms
+        _last_counter = counter
+
+    return _pack(timestamp_ms, counter, int.from_bytes(os.urandom(8)))
+
+
+def uuid7_at(when: datetime, rng: random.Random) -> uuid.UUID:
+    """UUIDv7 for a given creation time, drawing its random bits from rng.
+
+    For reproducible synthetic data; live ids come from uuid7().
+    """
+    timestamp_ms = int(
+        when.replace(tzinfo=when.tzinfo or timezone.utc).timestamp() * 1000
+    )
+    return _pack(timestamp_ms, rng.getrandbits(_COUNTER_BITS), rng.getrandbits(62))
+
+
+def _pack(timestamp_ms: int, rand_a: int, rand_b: int) -> uuid.UUID:
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | UUID_VERSION_7 << 76
+        | (rand_a & _COUNTER_MAX) << 64
+        | 0b10 << 62
+        | rand_b & ((1 << 62) - 1)
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_timestamp(value: uuid.UUID) -> datetime | None:
+    """Creation time embedded in a UUIDv7, or None for any other version."""
+    if value.version != UUID_VERSION_7:
+        return None
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc)
@@ -0,0 +1,151 @@
+import base64
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    limit: int = DEFAULT_LIMIT
+
+
+def encode_cursor(values: tuple | list) -> str:
+    raw = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+    if not isinstance(values, list) or not values:
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, key: ColumnElement) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return value
+
+    if isinstance(value, python_type):
+        return value
+
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is uuid.UUID:
+            return uuid.UUID(value)
+        if python_type is Decimal:
+            return Decimal(value)
+        if python_type is int:
+            return int(value)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return value
+
+
+def get_paging_flags(
+    has_cursor: bool, is_prev: bool, has_more: bool
+) -> tuple[bool, bool]:
+    if not has_cursor:
+        return False, has_more
+
+    if is_prev:
+        return has_more, True
+
+    return True, has_more
+
+
+def apply_keyset_pagination(
+    stmt: Select,
+    keys: list[ColumnElement],
+    cursor_values: list[Any] | None,
+    is_prev: bool,
+    descending: bool = False,
+) -> Select:
+    # Walking backwards flips the scan direction; the caller reverses the rows.
+    backwards = descending != is_prev
+
+    if cursor_values is not None:
+        if len(cursor_values) != len(keys):
+            raise InvalidCursorError("Invalid cursor")
+        values = [_from_json(value, key) for value, key in zip(cursor_values, keys)]
+        if backwards:
+            stmt = stmt.where(tuple_(*keys) < tuple_(*values))
+        else:
+            stmt = stmt.where(tuple_(*keys) > tuple_(*values))
+
+    if backwards:
+        return stmt.order_by(*[key.desc() for key in keys])
+    return stmt.order_by(*[key.asc() for key in keys])
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    keys: list[ColumnElement],
+    cursor_values: list[Any] | None,
+    direction: str | None,
+    limit: int,
+    descending: bool = False,
+) -> Page:
+    is_prev = cursor_values is not None and direction == "prev"
+
+    stmt = stmt.add_columns(*keys)
+    stmt = apply_keyset_pagination(stmt, keys, cursor_values, is_prev, descending)
+    stmt = stmt.limit(limit + 1)
+
+    rows = db.execute(stmt).all()
+
+    has_more = len(rows) > limit
+    rows = list(rows[:limit])
+
+    if is_prev:
+        rows.reverse()
+
+    has_prev, has_next = get_paging_flags(cursor_values is not None, is_prev, has_more)
+
+    page = Page(items=[row[0] for row in rows], limit=limit)
+    if rows:
+        if has_prev:
+            page.prev_cursor = encode_cursor(tuple(rows[0][1:]))
+        if has_next:
+            page.next_cursor = encode_cursor(tuple(rows[-1][1:]))
+
+    return page
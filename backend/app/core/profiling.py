@@ -0,0 +1,107 @@
+import cProfile
+import os
+import pstats
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterator
+from app.core.logger import logger
+from app.s3_client import put_bytes_object
+
+# "off", "header" (only requests sending PROFILE_HEADER) or "always".
+PROFILE_REQUESTS = os.getenv("PROFILE_REQUESTS", "off").lower()
+PROFILE_HEADER = "x-debug-profile"
+PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "25"))
+PROFILE_TRACEMALLOC_FRAMES = int(os.getenv("PROFILE_TRACEMALLOC_FRAMES", "10"))
+# Full pstats dumps go to the bucket under this prefix; empty keeps logs only.
+PROFILE_S3_PREFIX = os.getenv("PROFILE_S3_PREFIX", "")
+
+
+def should_profile(event: dict) -> bool:
+    if PROFILE_REQUESTS == "always":
+        return True
+    if PROFILE_REQUESTS != "header":
+        return False
+    headers = {
+        name.lower(): value for name, value in (event.get("headers") or {}).items()
+    }
+    return headers.get(PROFILE_HEADER, "").lower() in ("1", "true")
+
+
+def top_functions(stats: pstats.Stats, limit: int) -> list[dict[str, Any]]:
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in rows[:limit]
+    ]
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict[str, Any]]:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    return [
+        {
+            "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def _store_profile(stats: pstats.Stats, request_id: str) -> str:
+    key = f"{PROFILE_S3_PREFIX}/{time.strftime('%Y/%m/%d')}/{request_id}.prof"
+    with tempfile.NamedTemporaryFile(suffix=".prof") as dump:
+        stats.dump_stats(dump.name)
+        put_bytes_object(key, dump.read(), "application/octet-stream")
+    return key
+
+
+@contextmanager
+def profile_request(route: str, request_id: str) -> Iterator[None]:
+    """Runs the block under cProfile and tracemalloc, then logs the results.
+
+    Only meant for a sampled invocation: both slow the request down.
+    """
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        stats = pstats.Stats(profiler)
+        extra = {
+            "route": route,
+            "request_id": request_id,
+            "total_ms": round(stats.total_tt * 1000, 3),
+            "peak_memory_kb": round(peak / 1024, 1),
+            "functions": top_functions(stats, PROFILE_TOP_N),
+            "allocations": top_allocations(snapshot, PROFILE_TOP_N),
+        }
+        if PROFILE_S3_PREFIX:
+            try:
+                extra["profile_key"] = _store_profile(stats, request_id)
+            except Exception as e:
+                # The profile is a diagnostic; never fail the request over it.
+                extra["profile_error"] = str(e)
+        logger.info("Request profile", extra=extra)
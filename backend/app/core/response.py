@@ -1,28 +1,45 @@
 from aws_lambda_powertools.event_handler import Response
 from typing import Any
 from pydantic import ValidationError, BaseModel
+from app.core.tracing import span
+from app.core.server_timing import phase
 
 
 CORS_HEADERS = {
     "Access-Control-Allow-Origin": "http://localhost:5173",
-    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization,If-None-Match",
+    "Access-Control-Expose-Headers": "ETag",
     "Access-Control-Allow-Methods": "GET,POST,PUT,PATCH,DELETE,OPTIONS",
+    # Without it browsers hide Server-Timing from cross-origin callers.
+    "Timing-Allow-Origin": "http://localhost:5173",
 }
 
 
-def success(data: Any = None, status_code: int = 200) -> Response:
-    if isinstance(data, BaseModel):
-        data = data.model_dump(mode="json", by_alias=True)
-    elif isinstance(data, list) and all(isinstance(item, BaseModel) for item in data):
-        data = [item.model_dump(mode="json", by_alias=True) for item in data]
+def success(
+    data: Any = None, status_code: int = 200, headers: dict[str, str] | None = None
+) -> Response:
+    with span("response.serialize"), phase("serialize"):
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json", by_alias=True)
+        elif isinstance(data, list) and all(
+            isinstance(item, BaseModel) for item in data
+        ):
+            data = [item.model_dump(mode="json", by_alias=True) for item in data]
     return Response(
         status_code=status_code,
         content_type="application/json",
-        headers=CORS_HEADERS,
+        headers={**CORS_HEADERS, **(headers or {})},
         body=data,
     )
 
 
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(
+        status_code=304,
+        headers={**CORS_HEADERS, **headers},
+    )
+
+
 def error(message: str, status_code: int = 400, details: Any = None) -> Response:
     return Response(
         status_code=status_code,
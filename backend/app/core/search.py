@@ -0,0 +1,55 @@
+import os
+from sqlalchemy import case, func, literal_column, or_
+from sqlalchemy.sql import ColumnElement
+
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_SUBSTRING = 2
+
+LIKE_ESCAPE = "\\"
+
+AUTOCOMPLETE_CACHE_SIZE = int(os.getenv("AUTOCOMPLETE_CACHE_SIZE", "512"))
+AUTOCOMPLETE_CACHE_TTL = float(os.getenv("AUTOCOMPLETE_CACHE_TTL", "30"))
+
+
+def escape_like(keyword: str) -> str:
+    return (
+        keyword.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def search_document(*columns: ColumnElement) -> ColumnElement:
+    # Must stay in sync with the *_search_trgm expression indexes in SmartSales.sql.
+    document = columns[0]
+    for column in columns[1:]:
+        document = document.op("||")(literal_column("' '")).op("||")(column)
+    return document
+
+
+def matches(columns: list[ColumnElement], keyword: str) -> ColumnElement:
+    pattern = f"%{escape_like(keyword)}%"
+    return search_document(*columns).ilike(pattern, escape=LIKE_ESCAPE)
+
+
+def relevance(columns: list[ColumnElement], keyword: str) -> ColumnElement:
+    lowered = keyword.lower()
+    prefix = f"{escape_like(keyword)}%"
+    return case(
+        (or_(*[func.lower(column) == lowered for column in columns]), RANK_EXACT),
+        (
+            or_(*[column.ilike(prefix, escape=LIKE_ESCAPE) for column in columns]),
+            RANK_PREFIX,
+        ),
+        else_=RANK_SUBSTRING,
+    )
+
+
+def prefix_key(column: ColumnElement) -> ColumnElement:
+    # Must stay in sync with the *_name_prefix indexes in SmartSales.sql.
+    return func.lower(column).collate("C")
+
+
+def starts_with(column: ColumnElement, prefix: str) -> ColumnElement:
+    return prefix_key(column).like(f"{escape_like(prefix.lower())}%")
@@ -0,0 +1,74 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from app.core.sql_metrics import QueryStats
+
+
+@dataclass
+class RequestTiming:
+    queries: QueryStats
+    cold_start_ms: float | None = None
+    started: float = field(default_factory=time.perf_counter)
+    phases: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    # Phases currently running; a nested phase of the same name is not re-added.
+    running: set[str] = field(default_factory=set)
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+@contextmanager
+def track_request(
+    queries: QueryStats, cold_start_ms: float | None = None
+) -> Iterator[RequestTiming]:
+    timing = RequestTiming(queries=queries, cold_start_ms=cold_start_ms)
+    token = _current.set(timing)
+    try:
+        yield timing
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    timing = _current.get()
+    if timing is None or name in timing.running:
+        yield
+        return
+
+    timing.running.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.phases[name] += (time.perf_counter() - started) * 1000
+        timing.running.discard(name)
+
+
+def server_timing_header(timing: RequestTiming) -> str:
+    metrics = [
+        f"{name};dur={duration_ms:.1f}" for name, duration_ms in timing.phases.items()
+    ]
+    queries = timing.queries
+    metrics.append(
+        f'db;dur={queries.db_time_ms:.1f};desc="{queries.statements} queries"'
+    )
+    if timing.cold_start_ms is not None:
+        metrics.append(f"coldstart;dur={timing.cold_start_ms:.1f}")
+    metrics.append(f"total;dur={(time.perf_counter() - timing.started) * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+def add_server_timing(
+    response: dict[str, Any], timing: RequestTiming
+) -> dict[str, Any]:
+    """Call last, after JSON encoding and compression, so "total" covers them."""
+    value = server_timing_header(timing)
+    if "multiValueHeaders" in response:
+        response["multiValueHeaders"]["Server-Timing"] = [value]
+    else:
+        response.setdefault("headers", {})["Server-Timing"] = value
+    return response
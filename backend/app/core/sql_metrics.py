@@ -0,0 +1,115 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.logger import logger
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() == "true"
+
+# Statements EXPLAIN accepts; anything else (COPY, SET, DDL) is logged as is.
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+_START_TIMES = "query_start_times"
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    db_time_ms: float = 0.0
+    slow_statements: int = 0
+
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collects statement count and DB time for everything run inside.
+
+    Scopes nest: an outer scope also sees the statements of inner ones.
+    """
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    # Keep the shape for debugging, never the values (emails, password hashes).
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+def _explain(cursor, statement: str, parameters: Any) -> list[str] | None:
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+    # A fresh DBAPI cursor on the same connection: bypasses these hooks. The
+    # savepoint keeps a failed EXPLAIN from aborting the caller's transaction.
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            explain_cursor.execute(f"EXPLAIN {statement}", parameters)
+            plan = [row[0] for row in explain_cursor.fetchall()]
+        except Exception as e:
+            explain_cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            plan = [f"EXPLAIN failed: {e}"]
+        explain_cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        return plan
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        explain_cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info[_START_TIMES].pop()) * 1000
+    slow = elapsed_ms >= SLOW_QUERY_MS
+
+    for stats in _active.get():
+        stats.statements += 1
+        stats.db_time_ms += elapsed_ms
+        stats.slow_statements += slow
+
+    if slow:
+        extra = {
+            "duration_ms": round(elapsed_ms, 2),
+            "statement": statement,
+            "parameters": redact_parameters(parameters, executemany),
+        }
+        if SLOW_QUERY_EXPLAIN and not executemany:
+            extra["plan"] = _explain(cursor, statement, parameters)
+        logger.warning("Slow SQL statement", extra=extra)
+
+
+def _handle_error(exception_context) -> None:
+    # after_cursor_execute does not fire for failed statements.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_START_TIMES):
+        connection.info[_START_TIMES].pop()
+
+
+def install_query_hooks(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
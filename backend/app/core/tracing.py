@@ -0,0 +1,189 @@
+import functools
+import hashlib
+import inspect
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+from aws_lambda_powertools import Tracer
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SERVICE_NAME = "SmartSalesApi"
+
+# SQL gets its own fingerprinted spans below, so only AWS calls are patched.
+tracer = Tracer(service=SERVICE_NAME, patch_modules=("boto3", "botocore"))
+
+_SQL_SPANS = "trace_sql_spans"
+
+# Bind parameters and expanded IN lists vary per call; the fingerprint must not.
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\?")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+@dataclass
+class Span:
+    name: str
+    depth: int
+    duration_ms: float = 0.0
+    annotations: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass
+class _ActiveSpan:
+    span: Span
+    started: float
+    depth_token: Any
+    subsegment: Any = None
+    subsegment_context: Any = None
+
+
+# Local exporters: every record_spans() scope on the stack receives each span.
+_recorders: ContextVar[tuple[list[Span], ...]] = ContextVar("trace_spans", default=())
+_depth: ContextVar[int] = ContextVar("trace_depth", default=0)
+
+
+@contextmanager
+def record_spans() -> Iterator[list[Span]]:
+    """Collects the spans finished inside, in completion order.
+
+    Lets tests and benchmarks attribute time without an X-Ray daemon.
+    """
+    spans: list[Span] = []
+    token = _recorders.set(_recorders.get() + (spans,))
+    try:
+        yield spans
+    finally:
+        _recorders.reset(token)
+
+
+def _is_active() -> bool:
+    return not tracer.disabled or bool(_recorders.get())
+
+
+def start_span(name: str, **annotations: Any) -> _ActiveSpan:
+    depth = _depth.get()
+    active = _ActiveSpan(
+        span=Span(name=name, depth=depth, annotations=annotations),
+        started=time.perf_counter(),
+        depth_token=_depth.set(depth + 1),
+    )
+    if not tracer.disabled:
+        active.subsegment_context = tracer.provider.in_subsegment(name=f"## {name}")
+        active.subsegment = active.subsegment_context.__enter__()
+        for key, value in annotations.items():
+            active.subsegment.put_annotation(key=key, value=value)
+    return active
+
+
+def end_span(active: _ActiveSpan, error: BaseException | None = None) -> Span:
+    span = active.span
+    span.duration_ms = (time.perf_counter() - active.started) * 1000
+    if error is not None:
+        span.error = type(error).__name__
+    _depth.reset(active.depth_token)
+
+    if active.subsegment_context is not None:
+        active.subsegment_context.__exit__(
+            type(error) if error else None,
+            error,
+            error.__traceback__ if error else None,
+        )
+
+    for spans in _recorders.get():
+        spans.append(span)
+    return span
+
+
+@contextmanager
+def span(name: str, **annotations: Any) -> Iterator[Span | None]:
+    if not _is_active():
+        yield None
+        return
+
+    active = start_span(name, **annotations)
+    try:
+        yield active.span
+    except BaseException as e:
+        end_span(active, e)
+        raise
+    end_span(active)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Nothing listening: skip the span bookkeeping on hot paths.
+            if not _is_active():
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+
+    return decorator
+
+
+def trace_functions(namespace: dict[str, Any]) -> None:
+    """Wraps every public function defined in a module in a span.
+
+    Call at the bottom of the module with globals(); spans are named
+    "<module>.<function>", e.g. "order.get_orders".
+    """
+    module = namespace["__name__"]
+    prefix = module.rsplit(".", 1)[-1]
+    for attr, value in list(namespace.items()):
+        if (
+            attr.startswith("_")
+            or not inspect.isfunction(value)
+            or value.__module__ != module
+            # A span around a generator would only time its creation.
+            or inspect.isgeneratorfunction(value)
+            or getattr(value, "__traced__", False)
+        ):
+            continue
+        namespace[attr] = traced(f"{prefix}.{attr}")(value)
+
+
+def statement_fingerprint(statement: str) -> str:
+    """Stable id for a statement shape, whatever its parameter values."""
+    normalized = _PARAMETER.sub("?", statement)
+    normalized = _PARAMETER_LIST.sub("?", normalized)
+    normalized = " ".join(normalized.split())
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not _is_active():
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    active = start_span(
+        "sql", operation=operation, fingerprint=statement_fingerprint(statement)
+    )
+    if active.subsegment is not None:
+        active.subsegment.put_metadata(key="statement", value=statement)
+    conn.info.setdefault(_SQL_SPANS, []).append(active)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if conn.info.get(_SQL_SPANS):
+        end_span(conn.info[_SQL_SPANS].pop())
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_SQL_SPANS):
+        end_span(connection.info[_SQL_SPANS].pop(), exception_context.original_exception)
+
+
+def install_sql_tracing(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
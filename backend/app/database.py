@@ -1,8 +1,11 @@
 import os
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 from contextlib import contextmanager
+from contextvars import ContextVar
+from app.core.sql_metrics import install_query_hooks
+from app.core.tracing import install_sql_tracing
 
 DB_DRIVER = os.getenv("DB_DRIVER")
 DB_USER = os.getenv("DB_USER")
@@ -30,11 +33,35 @@ if missing:
 DATABASE_URL = f"{DB_DRIVER}://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 engine = create_engine(DATABASE_URL, pool_pre_ping=True, poolclass=NullPool)
+install_query_hooks(engine)
+install_sql_tracing(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+_shared_session: ContextVar[Session | None] = ContextVar("shared_session", default=None)
+
+
 @contextmanager
 def get_db():
+    db = _shared_session.get()
+    if db is not None:
+        yield db
+        return
+
     with SessionLocal() as db:
         yield db
+
+
+@contextmanager
+def shared_session():
+    # NullPool closes the connection whenever a session releases it, so pin
+    # the session to one connection: every get_db() inside this block reuses
+    # it and commits made by handlers no longer reconnect.
+    with engine.connect() as connection:
+        with SessionLocal(bind=connection) as db:
+            token = _shared_session.set(db)
+            try:
+                yield db
+            finally:
+                _shared_session.reset(token)
@@ -0,0 +1,55 @@
+from pydantic import ValidationError
+from http import HTTPStatus
+from app.database import get_db
+from app.core.auth import AUTH_TOKEN_TTL_SECONDS, issue_token
+from app.schemas.base_schema import validate_request
+from app.schemas.auth import LoginRequest, TokenResponse
+from app.services.user import HashingBusyError, authenticate_user
+
+from app.core.response import (
+    success,
+    error,
+    errors_from_validation_error,
+    Response,
+)
+
+
+def login_handler(body: dict | None) -> Response:
+    if body is None:
+        return error(
+            message="Request body is required",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    try:
+        data = validate_request(LoginRequest, body)
+    except ValidationError as e:
+        return error(
+            message="Invalid request body",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        with get_db() as db:
+            user = authenticate_user(db, data.user_account, data.password)
+            if not user:
+                return error(
+                    message="Invalid account or password",
+                    status_code=HTTPStatus.UNAUTHORIZED,
+                )
+
+            response = TokenResponse(
+                access_token=issue_token(user.user_id),
+                expires_in=AUTH_TOKEN_TTL_SECONDS,
+            )
+            return success(response)
+
+    except HashingBusyError as e:
+        return error(message=str(e), status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
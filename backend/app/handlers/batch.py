@@ -0,0 +1,167 @@
+import base64
+import json
+import os
+import time
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+from pydantic import ValidationError
+from aws_lambda_powertools.event_handler.api_gateway import (
+    ApiGatewayResolver,
+    BaseRouter,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from app.core.logger import logger
+from app.database import shared_session
+from app.schemas.base_schema import validate_request
+from app.schemas.batch import (
+    BatchRequest,
+    BatchResponse,
+    BatchSubRequest,
+    BatchSubResponse,
+)
+from app.core.response import (
+    success,
+    error,
+    errors_from_validation_error,
+    Response,
+)
+
+BATCH_TIME_BUDGET_MS = int(os.getenv("BATCH_TIME_BUDGET_MS", "20000"))
+# Head-room left for serialising the batch response before Lambda times out.
+BATCH_TIME_MARGIN_MS = 1000
+
+# Describe the outer request body, not the sub-request being dispatched.
+_DROPPED_HEADERS = {"content-length", "content-type", "accept-encoding"}
+
+
+def _budget_seconds(context: LambdaContext | None) -> float:
+    budget_ms = BATCH_TIME_BUDGET_MS
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if callable(remaining):
+        budget_ms = min(budget_ms, remaining() - BATCH_TIME_MARGIN_MS)
+    return max(budget_ms, 0) / 1000
+
+
+def _build_sub_event(event: dict, sub_request: BatchSubRequest) -> dict[str, Any]:
+    url = urlsplit(sub_request.path)
+    query = dict(parse_qsl(url.query, keep_blank_values=True))
+    query.update(sub_request.query or {})
+
+    headers = {
+        name: value
+        for name, value in (event.get("headers") or {}).items()
+        if name.lower() not in _DROPPED_HEADERS
+    }
+    body = None
+    if sub_request.body is not None:
+        headers["Content-Type"] = "application/json"
+        body = json.dumps(sub_request.body)
+
+    return {
+        **event,
+        "resource": url.path,
+        "path": url.path,
+        "httpMethod": sub_request.method.value,
+        "headers": headers,
+        "multiValueHeaders": {name: [value] for name, value in headers.items()},
+        "queryStringParameters": query or None,
+        "multiValueQueryStringParameters": (
+            {name: [value] for name, value in query.items()} or None
+        ),
+        "pathParameters": None,
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+def _parse_body(result: dict[str, Any]) -> Any:
+    body = result.get("body")
+    if not body:
+        return None
+    if result.get("isBase64Encoded"):
+        body = base64.b64decode(body).decode()
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
+
+
+def _dispatch(
+    resolver: ApiGatewayResolver,
+    event: dict,
+    context: LambdaContext,
+    sub_request: BatchSubRequest,
+) -> BatchSubResponse:
+    try:
+        result = resolver.resolve(_build_sub_event(event, sub_request), context)
+    except Exception:
+        logger.exception(
+            "Batch sub-request failed",
+            extra={"method": sub_request.method.value, "path": sub_request.path},
+        )
+        return BatchSubResponse(
+            id=sub_request.id,
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+            body={"message": "Internal server error", "details": None},
+        )
+
+    return BatchSubResponse(
+        id=sub_request.id,
+        status=result["statusCode"],
+        body=_parse_body(result),
+    )
+
+
+def batch_handler(
+    resolver: ApiGatewayResolver,
+    event: dict,
+    context: LambdaContext,
+    body: dict | None,
+) -> Response:
+    if body is None:
+        return error(
+            message="Request body is required",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    try:
+        data = validate_request(BatchRequest, body)
+    except ValidationError as e:
+        return error(
+            message="Invalid request body",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    deadline = time.monotonic() + _budget_seconds(context)
+    current_event = BaseRouter.current_event
+    responses = []
+
+    try:
+        with shared_session() as db:
+            for sub_request in data.requests:
+                if time.monotonic() >= deadline:
+                    responses.append(
+                        BatchSubResponse(
+                            id=sub_request.id,
+                            status=HTTPStatus.GATEWAY_TIMEOUT,
+                            body={
+                                "message": "Batch time budget exceeded",
+                                "details": None,
+                            },
+                        )
+                    )
+                    continue
+
+                responses.append(_dispatch(resolver, event, context, sub_request))
+                # Handlers commit their own work; end whatever transaction is
+                # left so a failed sub-request cannot poison the next one.
+                if db.in_transaction():
+                    db.rollback()
+    finally:
+        # Nested resolve() calls replace the shared router state; the outer
+        # response is still built from it.
+        BaseRouter.current_event = current_event
+        BaseRouter.lambda_context = context
+
+    return success(data=BatchResponse(responses=responses))
@@ -0,0 +1,75 @@
+from pydantic import BaseModel, ValidationError
+from http import HTTPStatus
+from app.database import get_db
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.change import (
+    ChangeFeedResponse,
+    ChangeQuery,
+    ChangeResource,
+    TombstoneResponse,
+)
+from app.schemas.customer import CustomerResponse
+from app.schemas.product import ProductResponse
+from app.schemas.price import PriceResponse
+from app.schemas.status import StatusResponse
+from app.schemas.user import UserResponse
+from app.schemas.order import OrderResponse
+from app.services.change import get_changes
+from app.core.response import (
+    success,
+    error,
+    errors_from_validation_error,
+    Response,
+)
+
+RESPONSE_MODELS: dict[ChangeResource, type[BaseModel]] = {
+    ChangeResource.CUSTOMERS: CustomerResponse,
+    ChangeResource.PRODUCTS: ProductResponse,
+    ChangeResource.PRICES: PriceResponse,
+    ChangeResource.STATUSES: StatusResponse,
+    ChangeResource.USERS: UserResponse,
+    ChangeResource.ORDERS: OrderResponse,
+}
+
+
+def get_changes_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(ChangeQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        with get_db() as db:
+            change_set = get_changes(db, query.resource, query.since, query.limit)
+            response_model = RESPONSE_MODELS[query.resource]
+            response = ChangeFeedResponse(
+                resource=query.resource,
+                changes=[
+                    response_model.model_validate(row).model_dump(
+                        mode="json", by_alias=True
+                    )
+                    for row in change_set.changes
+                ],
+                deleted=[
+                    TombstoneResponse(id=row.row_id, deleted_at=row.deleted_at)
+                    for row in change_set.deleted
+                ],
+                next_token=change_set.next_token,
+                has_more=change_set.has_more,
+            )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
@@ -1,47 +1,58 @@
 from pydantic import ValidationError
-import re
-from enum import Enum
 from http import HTTPStatus
+import csv
+import io
+import json
 from app.database import get_db
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery, SearchQuery
+from app.schemas.autocomplete import AutocompleteQuery
 from app.schemas.customer import (
     CustomerCreate,
+    CustomerBulkCreate,
+    CustomerImportRow,
+    CustomerImportResult,
+    CustomerImportResponse,
+    ImportStatus,
     CustomerIdPath,
     CustomerEmailQuery,
     CustomerResponse,
+    CustomerPaginationResponse,
+    CustomerAutocompleteResponse,
     CustomerUpdate,
 )
 
 from app.services.customer import (
     create_customer,
+    import_customers,
     get_customer,
     get_all_customers,
+    get_customer_fingerprint,
+    get_customers_fingerprint,
     get_customer_by_email,
     update_customer,
     delete_customer,
-    search_customers_by_email,
-    search_customers_by_phone,
-    search_customers_by_name,
+    search_customers,
+    autocomplete_customers,
     DuplicateEmailError,
 )
 
+from app.core.etag import (
+    cache_headers,
+    compute_etag,
+    etag_matches,
+    fingerprint_headers,
+)
 from app.core.response import (
     success,
     error,
+    not_modified,
     errors_from_validation_error,
     Response,
 )
 
 
-class SearchType(str, Enum):
-    EMAIL = "email"
-    NAME = "name"
-    PHONE = "phone"
-
-
-PHONE_REGEX = re.compile(r"^\+?[1-9]\d{7,14}$")
-UPPERCASE_REGEX = re.compile(r"[A-Z]")
-
-
 def create_customer_handler(body: dict | None) -> Response:
     if body is None:
         return error(
@@ -49,7 +60,7 @@ def create_customer_handler(body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        data = CustomerCreate.model_validate(body)
+        data = validate_request(CustomerCreate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -76,10 +87,102 @@ def create_customer_handler(body: dict | None) -> Response:
         )
 
 
-def get_customer_handler(customer_id: str) -> Response:
+def _import_rows(body: str, content_type: str | None) -> dict:
+    """JSON {"customers": [...]} or CSV with a header row of field names."""
+    if content_type and content_type.split(";")[0].strip().lower() == "text/csv":
+        reader = csv.DictReader(io.StringIO(body.lstrip("\ufeff")), restkey="extra")
+        return {"customers": list(reader)}
+    return json.loads(body)
+
+
+def create_customers_bulk_handler(
+    body: str | None, content_type: str | None = None
+) -> Response:
+    if not body:
+        return error(
+            message="Request body is required",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    try:
+        data = validate_request(CustomerBulkCreate, _import_rows(body, content_type))
+    except (ValueError, csv.Error) as e:
+        details = (
+            errors_from_validation_error(e)
+            if isinstance(e, ValidationError)
+            else str(e)
+        )
+        return error(
+            message="Invalid request body",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=details,
+        )
+
+    results: list[CustomerImportResult] = []
+    valid: dict[int, CustomerImportRow] = {}
+    seen_emails: set[str] = set()
+    for row_number, row in enumerate(data.customers):
+        try:
+            customer = validate_request(CustomerImportRow, row)
+        except ValidationError as e:
+            errors = errors_from_validation_error(e)
+        else:
+            if customer.customer_email not in seen_emails:
+                seen_emails.add(customer.customer_email)
+                valid[row_number] = customer
+                continue
+            errors = [
+                {
+                    "type": "duplicate",
+                    "loc": ["customerEmail"],
+                    "msg": "Email is repeated in the request",
+                    "input": customer.customer_email,
+                }
+            ]
+        results.append(
+            CustomerImportResult(
+                row=row_number, status=ImportStatus.INVALID, errors=errors
+            )
+        )
+
+    try:
+        with get_db() as db:
+            imported = import_customers(db, valid) if valid else []
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
+    results += [
+        CustomerImportResult(
+            row=row.row_number,
+            status=ImportStatus(row.status),
+            customer_id=row.customer_id,
+        )
+        for row in imported
+    ]
+    results.sort(key=lambda result: result.row)
+    counts = {status: 0 for status in ImportStatus}
+    for result in results:
+        counts[result.status] += 1
+
+    response = CustomerImportResponse(
+        created=counts[ImportStatus.CREATED],
+        updated=counts[ImportStatus.UPDATED],
+        unchanged=counts[ImportStatus.UNCHANGED],
+        invalid=counts[ImportStatus.INVALID],
+        results=results,
+    )
+    return success(response)
+
+
+def get_customer_handler(
+    customer_id: str, if_none_match: str | None = None
+) -> Response:
     try:
-        customer_id = CustomerIdPath.model_validate(
-            {"customer_id": customer_id}
+        customer_id = validate_request(
+            CustomerIdPath, {"customer_id": customer_id}
         ).customer_id
     except ValidationError as e:
         return error(
@@ -90,6 +193,17 @@ def get_customer_handler(customer_id: str) -> Response:
 
     try:
         with get_db() as db:
+            fingerprint = get_customer_fingerprint(db, customer_id)
+            if fingerprint is None:
+                return error(
+                    message="Customer not found",
+                    status_code=HTTPStatus.NOT_FOUND,
+                )
+
+            headers = cache_headers(compute_etag(customer_id, *fingerprint))
+            if etag_matches(if_none_match, headers["ETag"]):
+                return not_modified(headers)
+
             customer = get_customer(db, customer_id)
 
             if not customer:
@@ -100,7 +214,7 @@ def get_customer_handler(customer_id: str) -> Response:
 
             response = CustomerResponse.model_validate(customer)
 
-            return success(response)
+            return success(response, headers=headers)
 
     except Exception as e:
         return error(
@@ -110,13 +224,38 @@ def get_customer_handler(customer_id: str) -> Response:
         )
 
 
-def get_all_customers_handler() -> Response:
+def get_all_customers_handler(
+    params: dict[str, str | None], if_none_match: str | None = None
+) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            customers = get_all_customers(db)
-            return success(
-                [CustomerResponse.model_validate(customer) for customer in customers]
+            fingerprint = get_customers_fingerprint(db)
+            headers = fingerprint_headers(fingerprint, query.model_dump())
+            if etag_matches(if_none_match, headers.get("ETag")):
+                return not_modified(headers)
+
+            page = get_all_customers(db, query)
+            response = CustomerPaginationResponse(
+                customers=[
+                    CustomerResponse.model_validate(customer) for customer in page.items
+                ],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
             )
+            return success(response, headers=headers)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -128,8 +267,8 @@ def get_all_customers_handler() -> Response:
 
 def get_customer_by_email_handler(customer_email: str) -> Response:
     try:
-        customer_email = CustomerEmailQuery.model_validate(
-            {"customer_email": customer_email}
+        customer_email = validate_request(
+            CustomerEmailQuery, {"customer_email": customer_email}
         ).customer_email
     except ValidationError as e:
         return error(
@@ -166,8 +305,8 @@ def update_customer_handler(customer_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        customer_id = CustomerIdPath.model_validate(
-            {"customer_id": customer_id}
+        customer_id = validate_request(
+            CustomerIdPath, {"customer_id": customer_id}
         ).customer_id
     except ValidationError as e:
         return error(
@@ -177,7 +316,7 @@ def update_customer_handler(customer_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = CustomerUpdate.model_validate(body)
+        data = validate_request(CustomerUpdate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -217,8 +356,8 @@ def update_customer_handler(customer_id: str, body: dict | None) -> Response:
 
 def delete_customer_handler(customer_id: str) -> Response:
     try:
-        customer_id = CustomerIdPath.model_validate(
-            {"customer_id": customer_id}
+        customer_id = validate_request(
+            CustomerIdPath, {"customer_id": customer_id}
         ).customer_id
     except ValidationError as e:
         return error(
@@ -247,27 +386,55 @@ def delete_customer_handler(customer_id: str) -> Response:
         )
 
 
-def search_customers_handler(query: str) -> Response:
-    if not query or not query.strip():
+def search_customers_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(SearchQuery, params)
+    except ValidationError as e:
         return error(
-            message="Query parameter is required and cannot be empty",
+            message="Invalid query parameters",
             status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
         )
 
     try:
         with get_db() as db:
-            keyword = query.strip()
-            search_type = detect_search_type(keyword)
+            page = search_customers(db, query.query, query)
+            response = CustomerPaginationResponse(
+                customers=[
+                    CustomerResponse.model_validate(customer) for customer in page.items
+                ],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
 
-            if search_type == SearchType.EMAIL:
-                customers = search_customers_by_email(db, keyword)
-            elif search_type == SearchType.PHONE:
-                customers = search_customers_by_phone(db, keyword)
-            else:
-                customers = search_customers_by_name(db, keyword)
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
+
+def autocomplete_customers_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(AutocompleteQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        with get_db() as db:
+            rows = autocomplete_customers(db, query.query, query.limit)
             return success(
-                [CustomerResponse.model_validate(customer) for customer in customers]
+                [CustomerAutocompleteResponse.model_validate(row) for row in rows]
             )
 
     except Exception as e:
@@ -276,14 +443,3 @@ def search_customers_handler(query: str) -> Response:
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             details=str(e),
         )
-
-
-def detect_search_type(keyword: str) -> str:
-    keyword = keyword.strip()
-    if "@" in keyword:
-        return SearchType.EMAIL
-    if PHONE_REGEX.search(keyword):
-        return SearchType.PHONE
-    if UPPERCASE_REGEX.search(keyword) or " " in keyword:
-        return SearchType.NAME
-    return SearchType.EMAIL
@@ -1,7 +1,10 @@
 from pydantic import ValidationError
 from http import HTTPStatus
 from app.database import get_db
-from app.schemas.item import ItemResponse, ItemList
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery
+from app.schemas.item import ItemResponse, ItemList, ItemPaginationResponse
 from app.models.order import WrongStatus
 from app.schemas.product import ProductIdPath
 from app.schemas.order import OrderIdPath
@@ -25,8 +28,8 @@ from app.core.response import (
 
 def get_item_handler(order_id: str, product_id: str) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
-        product_id = ProductIdPath.model_validate({"product_id": product_id}).product_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
+        product_id = validate_request(ProductIdPath, {"product_id": product_id}).product_id
     except ValidationError as e:
         return error(
             message="Invalid id",
@@ -54,11 +57,29 @@ def get_item_handler(order_id: str, product_id: str) -> Response:
         )
 
 
-def get_all_items_handler() -> Response:
+def get_all_items_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            items = get_all_items(db)
-            return success([ItemResponse.model_validate(item) for item in items])
+            page = get_all_items(db, query)
+            response = ItemPaginationResponse(
+                items=[ItemResponse.model_validate(item) for item in page.items],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -70,7 +91,7 @@ def get_all_items_handler() -> Response:
 
 def get_items_by_order_handler(order_id: str) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -101,7 +122,7 @@ def update_item_handler(order_id: str, body: dict) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -110,7 +131,7 @@ def update_item_handler(order_id: str, body: dict) -> Response:
         )
 
     try:
-        data = ItemList.model_validate(body)
+        data = validate_request(ItemList, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -1,10 +1,15 @@
+import os
 from pydantic import ValidationError
 from http import HTTPStatus
 from app.database import get_db
+from app.schemas.base_schema import validate_request
 from app.schemas.order import (
     OrderCreate,
     OrderIdPath,
     OrderResponse,
+    OrderDetailQuery,
+    OrderDetailResponse,
+    OrderInclude,
     OrderUpdateStatus,
     OrderAttachmentResponse,
     OrderAttachmentUploadURLRequest,
@@ -17,18 +22,23 @@ from app.schemas.order import (
     DashboardSummaryResponse,
 )
 
+from app.schemas.price import PriceResponse
+from app.models import Order, Item
 from app.schemas.s3_schema import ViewUrlResponse, UploadUrlResponse, S3KeyParams
 
 from app.services.order import (
     create_order,
     get_order,
+    get_order_fingerprint,
     get_orders,
+    get_orders_fingerprint,
     update_order_status,
     delete_order,
     update_order_attachment_url,
     get_total_orders_in_7_days,
     get_total_revenue_in_7_days,
     get_total_revenue_in_12_months,
+    get_status_by_code,
     NotFoundError,
 )
 
@@ -39,10 +49,14 @@ from app.s3_client import (
 )
 
 from app.services.item import get_top_product_summary
+from app.analytics.summary import read_dashboard_summary
 
+from app.core.logger import logger
+from app.core.etag import etag_matches, fingerprint_headers
 from app.core.response import (
     success,
     error,
+    not_modified,
     errors_from_validation_error,
     Response,
 )
@@ -55,7 +69,7 @@ def create_order_handler(body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        data = OrderCreate.model_validate(body)
+        data = validate_request(OrderCreate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -81,9 +95,46 @@ def create_order_handler(body: dict | None) -> Response:
         )
 
 
-def get_order_handler(order_id: str) -> Response:
+def _order_item_payload(item: Item, include: frozenset[OrderInclude]) -> dict:
+    payload = {
+        "product_id": item.product_id,
+        "item_quantity": item.item_quantity,
+        "item_price": item.item_price,
+        "updated_at": item.updated_at,
+    }
+
+    if OrderInclude.PRODUCTS in include:
+        product = item.product
+        payload["product"] = {
+            "product_id": product.product_id,
+            "product_name": product.product_name,
+            "product_description": product.product_description,
+            "product_quantity": product.product_quantity,
+        }
+        if OrderInclude.PRICES in include:
+            payload["product"]["prices"] = [
+                PriceResponse.model_validate(price) for price in product.prices
+            ]
+
+    return payload
+
+
+def _order_detail_response(
+    order: Order, include: frozenset[OrderInclude]
+) -> OrderDetailResponse:
+    payload = OrderResponse.model_validate(order).model_dump()
+
+    if OrderInclude.ITEMS in include:
+        payload["items"] = [_order_item_payload(item, include) for item in order.items]
+
+    return OrderDetailResponse.model_validate(payload)
+
+
+def get_order_handler(
+    order_id: str, params: dict[str, str | None], if_none_match: str | None = None
+) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -91,17 +142,36 @@ def get_order_handler(order_id: str) -> Response:
             details=errors_from_validation_error(e),
         )
 
+    try:
+        include = validate_request(OrderDetailQuery, params).include
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            order = get_order(db, order_id)
+            fingerprint = get_order_fingerprint(db, order_id, include)
+            if fingerprint is None:
+                return error(
+                    message="Order not found", status_code=HTTPStatus.NOT_FOUND
+                )
+
+            headers = fingerprint_headers(fingerprint, order_id, sorted(include))
+            if etag_matches(if_none_match, headers.get("ETag")):
+                return not_modified(headers)
+
+            order = get_order(db, order_id, include)
             if not order:
                 return error(
                     message="Order not found", status_code=HTTPStatus.NOT_FOUND
                 )
 
-            response = OrderResponse.model_validate(order)
+            response = _order_detail_response(order, include)
 
-            return success(response)
+            return success(response, headers=headers)
 
     except Exception as e:
         return error(
@@ -111,9 +181,11 @@ def get_order_handler(order_id: str) -> Response:
         )
 
 
-def get_orders_handler(params: dict[str, str | None]) -> Response:
+def get_orders_handler(
+    params: dict[str, str | None], if_none_match: str | None = None
+) -> Response:
     try:
-        params = OrderFilterQuery.model_validate(params)
+        params = validate_request(OrderFilterQuery, params)
     except ValidationError as e:
         return error(
             message="Invalid query parameters",
@@ -123,10 +195,20 @@ def get_orders_handler(params: dict[str, str | None]) -> Response:
 
     try:
         with get_db() as db:
-            order_pagination_response = get_orders(db, params)
+            if params.status_code:
+                get_status_by_code(db, params.status_code)
+
+            fingerprint = get_orders_fingerprint(db, params)
+            headers = fingerprint_headers(fingerprint, params.model_dump())
+            if etag_matches(if_none_match, headers.get("ETag")):
+                return not_modified(headers)
+
+            order_pagination_response = get_orders(
+                db, params, total_count=fingerprint[1]
+            )
 
             response = OrderPaginationResponse.model_validate(order_pagination_response)
-            return success(response)
+            return success(response, headers=headers)
     except NotFoundError as e:
         return error(message=str(e), status_code=HTTPStatus.NOT_FOUND)
 
@@ -145,7 +227,7 @@ def update_order_status_handler(order_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -154,7 +236,7 @@ def update_order_status_handler(order_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = OrderUpdateStatus.model_validate(body)
+        data = validate_request(OrderUpdateStatus, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -187,7 +269,7 @@ def update_order_status_handler(order_id: str, body: dict | None) -> Response:
 
 def delete_order_handler(order_id: str) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -227,7 +309,7 @@ def create_order_attachment_upload_url_handler(
         )
 
     try:
-        data = OrderAttachmentUploadURLRequest.model_validate(body)
+        data = validate_request(OrderAttachmentUploadURLRequest, body)
         content_type = data.content_type
     except ValidationError as e:
         return error(
@@ -237,7 +319,7 @@ def create_order_attachment_upload_url_handler(
         )
 
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -272,12 +354,12 @@ def confirm_order_attachment_handler(order_id: str, body: dict | None) -> Respon
             status_code=HTTPStatus.BAD_REQUEST,
         )
 
-    s3_key = S3KeyParams.model_validate(body).s3_key
+    s3_key = validate_request(S3KeyParams, body).s3_key
     if not s3_key:
         return error("s3_key is required", 400)
 
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -307,7 +389,7 @@ def confirm_order_attachment_handler(order_id: str, body: dict | None) -> Respon
 
 def create_order_attachment_get_url_handler(order_id: str) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -343,7 +425,7 @@ def create_order_attachment_get_url_handler(order_id: str) -> Response:
 
 def delete_order_attachment_handler(order_id: str) -> Response:
     try:
-        order_id = OrderIdPath.model_validate({"order_id": order_id}).order_id
+        order_id = validate_request(OrderIdPath, {"order_id": order_id}).order_id
     except ValidationError as e:
         return error(
             message="Invalid order_id",
@@ -353,7 +435,7 @@ def delete_order_attachment_handler(order_id: str) -> Response:
 
     try:
         with get_db() as db:
-            order = get_order(db, order_id)
+            order = get_order(db, order_id, include_archived=False)
             if not order:
                 return error(
                     message="Order not found", status_code=HTTPStatus.NOT_FOUND
@@ -446,7 +528,26 @@ def get_top_product_summary_handler():
         )
 
 
+# "snapshot" serves the summary the analytics snapshot job precomputes after
+# each run instead of aggregating the transactional tables; until the first
+# run has written it, the database answers.
+DASHBOARD_SOURCE = os.getenv("DASHBOARD_SOURCE", "database")
+
+
 def get_dashboard_summary_handler():
+    if DASHBOARD_SOURCE == "snapshot":
+        try:
+            summary = read_dashboard_summary()
+        except Exception as e:
+            return error(
+                message="Internal server error",
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                details=str(e),
+            )
+        if summary is not None:
+            return success(summary)
+        logger.warning("Dashboard snapshot missing, answering from the database")
+
     total_orders_in_7_days = get_total_orders_in_7_days_handler()
     total_revenue_in_7_days = get_total_revenue_in_7_days_handler()
     total_revenue_in_12_months = get_total_revenue_in_12_months_handler()
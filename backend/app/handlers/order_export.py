@@ -0,0 +1,121 @@
+import json
+import os
+import boto3
+from pydantic import ValidationError
+from http import HTTPStatus
+from app.database import get_db
+from app.core.logger import logger
+from app.schemas.base_schema import validate_request
+from app.schemas.order_export import (
+    ExportStatus,
+    OrderExportCreate,
+    OrderExportIdPath,
+    OrderExportManifest,
+    OrderExportResponse,
+)
+from app.services.order_export import create_export, get_export, run_export
+from app.s3_client import AWS_REGION, generate_presigned_get_url
+from app.core.response import (
+    success,
+    error,
+    errors_from_validation_error,
+    Response,
+)
+
+# Name of the worker function; unset (local runs) means export inline.
+ORDER_EXPORT_FUNCTION = os.getenv("ORDER_EXPORT_FUNCTION")
+ORDER_EXPORT_URL_TTL = int(os.getenv("ORDER_EXPORT_URL_TTL", "3600"))
+
+_lambda_client = None
+
+
+def get_lambda_client():
+    global _lambda_client
+    if _lambda_client is None:
+        _lambda_client = boto3.client("lambda", region_name=AWS_REGION)
+    return _lambda_client
+
+
+def _export_response(manifest: OrderExportManifest) -> OrderExportResponse:
+    response = OrderExportResponse.model_validate(manifest.model_dump())
+    if manifest.status == ExportStatus.COMPLETED:
+        response.download_url = generate_presigned_get_url(
+            key=manifest.key, expires_in=ORDER_EXPORT_URL_TTL
+        )
+    return response
+
+
+def _start_export(manifest: OrderExportManifest) -> OrderExportManifest:
+    if ORDER_EXPORT_FUNCTION:
+        get_lambda_client().invoke(
+            FunctionName=ORDER_EXPORT_FUNCTION,
+            InvocationType="Event",
+            Payload=json.dumps({"exportId": str(manifest.export_id)}).encode(),
+        )
+        return manifest
+
+    with get_db() as db:
+        return run_export(db, manifest)
+
+
+def create_order_export_handler(body: dict | None) -> Response:
+    try:
+        data = validate_request(OrderExportCreate, body or {})
+    except ValidationError as e:
+        return error(
+            message="Invalid request body",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        manifest = create_export(data.format, data.filters)
+        manifest = _start_export(manifest)
+        return success(data=_export_response(manifest), status_code=HTTPStatus.ACCEPTED)
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
+
+def get_order_export_handler(export_id: str) -> Response:
+    try:
+        export_id = validate_request(
+            OrderExportIdPath, {"export_id": export_id}
+        ).export_id
+    except ValidationError as e:
+        return error(
+            message="Invalid export_id",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        manifest = get_export(export_id)
+        if manifest is None:
+            return error(message="Export not found", status_code=HTTPStatus.NOT_FOUND)
+
+        return success(data=_export_response(manifest))
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
+
+def run_order_export_handler(export_id: str) -> dict:
+    export_id = validate_request(OrderExportIdPath, {"export_id": export_id}).export_id
+    manifest = get_export(export_id)
+    if manifest is None:
+        logger.warning("Order export not found", extra={"export_id": str(export_id)})
+        return {"exportId": str(export_id), "status": None}
+
+    with get_db() as db:
+        manifest = run_export(db, manifest)
+
+    return {"exportId": str(export_id), "status": manifest.status.value}
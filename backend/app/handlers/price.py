@@ -1,7 +1,16 @@
 from pydantic import ValidationError
 from http import HTTPStatus
 from app.database import get_db
-from app.schemas.price import PriceCreate, PriceIdPath, PriceResponse, PriceUpdate
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery
+from app.schemas.price import (
+    PriceCreate,
+    PriceIdPath,
+    PriceResponse,
+    PricePaginationResponse,
+    PriceUpdate,
+)
 from app.schemas.product import ProductIdPath
 from app.models.price import PriceInThePass
 
@@ -30,7 +39,7 @@ def create_price_handler(body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        data = PriceCreate.model_validate(body)
+        data = validate_request(PriceCreate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -60,7 +69,7 @@ def create_price_handler(body: dict | None) -> Response:
 
 def get_price_handler(price_id: str) -> Response:
     try:
-        price_id = PriceIdPath.model_validate({"price_id": price_id}).price_id
+        price_id = validate_request(PriceIdPath, {"price_id": price_id}).price_id
     except ValidationError as e:
         return error(
             message="Invalid price_id",
@@ -88,11 +97,29 @@ def get_price_handler(price_id: str) -> Response:
         )
 
 
-def get_all_prices_handler() -> Response:
+def get_all_prices_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            prices = get_all_prices(db)
-            return success([PriceResponse.model_validate(price) for price in prices])
+            page = get_all_prices(db, query)
+            response = PricePaginationResponse(
+                prices=[PriceResponse.model_validate(price) for price in page.items],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -104,7 +131,9 @@ def get_all_prices_handler() -> Response:
 
 def get_prices_by_product_handler(product_id: str) -> Response:
     try:
-        product_id = ProductIdPath.model_validate({"product_id": product_id}).product_id
+        product_id = validate_request(
+            ProductIdPath, {"product_id": product_id}
+        ).product_id
     except ValidationError as e:
         return error(
             message="Invalid product_id",
@@ -135,7 +164,7 @@ def update_price_handler(price_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        price_id = PriceIdPath.model_validate({"price_id": price_id}).price_id
+        price_id = validate_request(PriceIdPath, {"price_id": price_id}).price_id
     except ValidationError as e:
         return error(
             message="Invalid price_id",
@@ -144,7 +173,7 @@ def update_price_handler(price_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = PriceUpdate.model_validate(body)
+        data = validate_request(PriceUpdate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -180,7 +209,7 @@ def update_price_handler(price_id: str, body: dict | None) -> Response:
 
 def delete_price_handler(price_id: str) -> Response:
     try:
-        price_id = PriceIdPath.model_validate({"price_id": price_id}).price_id
+        price_id = validate_request(PriceIdPath, {"price_id": price_id}).price_id
     except ValidationError as e:
         return error(
             message="Invalid price_id",
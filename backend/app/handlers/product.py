@@ -1,9 +1,15 @@
 from pydantic import ValidationError
 from http import HTTPStatus
 from app.database import get_db
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery, SearchQuery
+from app.schemas.autocomplete import AutocompleteQuery
 from app.schemas.product import (
     ProductCreate,
     ProductResponse,
+    ProductPaginationResponse,
+    ProductAutocompleteResponse,
     ProductUpdate,
     ProductIdPath,
 )
@@ -12,14 +18,19 @@ from app.services.product import (
     create_product,
     get_product,
     get_all_products,
+    get_product_fingerprint,
+    get_products_fingerprint,
     update_product,
     delete_product,
-    search_products_by_name,
+    search_products,
+    autocomplete_products,
 )
 
+from app.core.etag import etag_matches, fingerprint_headers
 from app.core.response import (
     success,
     error,
+    not_modified,
     errors_from_validation_error,
     Response,
 )
@@ -32,7 +43,7 @@ def create_product_handler(body: dict) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        data = ProductCreate.model_validate(body)
+        data = validate_request(ProductCreate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -56,9 +67,11 @@ def create_product_handler(body: dict) -> Response:
         )
 
 
-def get_product_handler(product_id: str) -> Response:
+def get_product_handler(
+    product_id: str, if_none_match: str | None = None
+) -> Response:
     try:
-        product_id = ProductIdPath.model_validate({"product_id": product_id}).product_id
+        product_id = validate_request(ProductIdPath, {"product_id": product_id}).product_id
     except ValidationError as e:
         return error(
             message="Invalid product_id",
@@ -68,6 +81,17 @@ def get_product_handler(product_id: str) -> Response:
 
     try:
         with get_db() as db:
+            fingerprint = get_product_fingerprint(db, product_id)
+            if fingerprint is None:
+                return error(
+                    message="Product not found",
+                    status_code=HTTPStatus.NOT_FOUND,
+                )
+
+            headers = fingerprint_headers(fingerprint, product_id)
+            if etag_matches(if_none_match, headers.get("ETag")):
+                return not_modified(headers)
+
             product = get_product(db, product_id)
 
             if not product:
@@ -78,7 +102,7 @@ def get_product_handler(product_id: str) -> Response:
 
             response = ProductResponse.model_validate(product)
 
-            return success(response)
+            return success(response, headers=headers)
 
     except Exception as e:
         return error(
@@ -88,13 +112,38 @@ def get_product_handler(product_id: str) -> Response:
         )
 
 
-def get_all_products_handler() -> Response:
+def get_all_products_handler(
+    params: dict[str, str | None], if_none_match: str | None = None
+) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            products = get_all_products(db)
-            return success(
-                [ProductResponse.model_validate(product) for product in products]
+            fingerprint = get_products_fingerprint(db)
+            headers = fingerprint_headers(fingerprint, query.model_dump())
+            if etag_matches(if_none_match, headers.get("ETag")):
+                return not_modified(headers)
+
+            page = get_all_products(db, query)
+            response = ProductPaginationResponse(
+                products=[
+                    ProductResponse.model_validate(product) for product in page.items
+                ],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
             )
+            return success(response, headers=headers)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -111,7 +160,7 @@ def update_product_handler(product_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        product_id = ProductIdPath.model_validate({"product_id": product_id}).product_id
+        product_id = validate_request(ProductIdPath, {"product_id": product_id}).product_id
     except ValidationError as e:
         return error(
             message="Invalid product_id",
@@ -120,7 +169,7 @@ def update_product_handler(product_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = ProductUpdate.model_validate(body)
+        data = validate_request(ProductUpdate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -157,7 +206,7 @@ def update_product_handler(product_id: str, body: dict | None) -> Response:
 
 def delete_product_handler(product_id: str) -> Response:
     try:
-        product_id = ProductIdPath.model_validate({"product_id": product_id}).product_id
+        product_id = validate_request(ProductIdPath, {"product_id": product_id}).product_id
     except ValidationError as e:
         return error(
             message="Invalid product_id",
@@ -185,19 +234,55 @@ def delete_product_handler(product_id: str) -> Response:
         )
 
 
-def search_products_handler(query: str) -> Response:
-    if not query or not query.strip():
+def search_products_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(SearchQuery, params)
+    except ValidationError as e:
         return error(
-            message="Query parameter is required and cannot be empty",
+            message="Invalid query parameters",
             status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
         )
 
     try:
         with get_db() as db:
-            products = search_products_by_name(db, query)
+            page = search_products(db, query.query, query)
+            response = ProductPaginationResponse(
+                products=[
+                    ProductResponse.model_validate(product) for product in page.items
+                ],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
 
+def autocomplete_products_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(AutocompleteQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        with get_db() as db:
+            rows = autocomplete_products(db, query.query, query.limit)
             return success(
-                [ProductResponse.model_validate(product) for product in products]
+                [ProductAutocompleteResponse.model_validate(row) for row in rows]
             )
 
     except Exception as e:
@@ -1,7 +1,15 @@
 from pydantic import ValidationError
 from http import HTTPStatus
 from app.database import get_db
-from app.schemas.status import StatusIdPath, StatusCode, StatusResponse
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery
+from app.schemas.status import (
+    StatusIdPath,
+    StatusCode,
+    StatusResponse,
+    StatusPaginationResponse,
+)
 
 from app.services.status import (
     get_status,
@@ -19,7 +27,7 @@ from app.core.response import (
 
 def get_status_handler(status_id: str) -> Response:
     try:
-        status_id = StatusIdPath.model_validate({"status_id": status_id}).status_id
+        status_id = validate_request(StatusIdPath, {"status_id": status_id}).status_id
     except ValidationError as e:
         return error(
             message="Invalid status_id",
@@ -50,8 +58,8 @@ def get_status_handler(status_id: str) -> Response:
 
 def get_status_by_code_handler(status_code: str) -> Response:
     try:
-        status_code = StatusCode.model_validate(
-            {"status_code": status_code}
+        status_code = validate_request(
+            StatusCode, {"status_code": status_code}
         ).status_code
     except ValidationError as e:
         return error(
@@ -81,13 +89,31 @@ def get_status_by_code_handler(status_code: str) -> Response:
         )
 
 
-def get_all_statuses_handler() -> Response:
+def get_all_statuses_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            statuses = get_all_statuses(db)
-            return success(
-                [StatusResponse.model_validate(status) for status in statuses]
+            page = get_all_statuses(db, query)
+            response = StatusPaginationResponse(
+                statuses=[
+                    StatusResponse.model_validate(status) for status in page.items
+                ],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
             )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
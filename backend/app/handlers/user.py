@@ -1,19 +1,23 @@
 from pydantic import ValidationError
 from http import HTTPStatus
-import re
-from enum import Enum
 from app.database import get_db
+from app.core.pagination import InvalidCursorError
+from app.schemas.base_schema import validate_request
+from app.schemas.pagination import PaginationQuery, SearchQuery
 from app.schemas.user import (
     UserCreate,
+    UserBulkCreate,
     UserIdPath,
     UserEmailQuery,
     UserResponse,
+    UserPaginationResponse,
     UserUpdateInfo,
     UserUpdatePassword,
 )
 
 from app.services.user import (
     create_user,
+    create_users,
     get_user,
     get_all_users,
     get_user_by_account,
@@ -22,12 +26,10 @@ from app.services.user import (
     update_user_password,
     verify_password,
     delete_user,
-    search_users_by_account,
-    search_users_by_email,
-    search_users_by_phone,
-    search_users_by_name,
+    search_users,
     DuplicateAccountError,
     DuplicateEmailError,
+    HashingBusyError,
 )
 
 from app.core.response import (
@@ -38,17 +40,6 @@ from app.core.response import (
 )
 
 
-class SearchType(str, Enum):
-    EMAIL = "email"
-    NAME = "name"
-    PHONE = "phone"
-    ACCOUNT = "account"
-
-
-PHONE_REGEX = re.compile(r"^\+?\d{8,15}$")
-UPPERCASE_REGEX = re.compile(r"[A-Z]")
-
-
 def create_user_handler(body: dict | None) -> Response:
     if body is None:
         return error(
@@ -56,7 +47,7 @@ def create_user_handler(body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        data = UserCreate.model_validate(body)
+        data = validate_request(UserCreate, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -83,6 +74,47 @@ def create_user_handler(body: dict | None) -> Response:
     except DuplicateEmailError as e:
         return error(message=str(e), status_code=HTTPStatus.CONFLICT)
 
+    except HashingBusyError as e:
+        return error(message=str(e), status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
+    except Exception as e:
+        return error(
+            message="Internal server error",
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            details=str(e),
+        )
+
+
+def create_users_bulk_handler(body: dict | None) -> Response:
+    if body is None:
+        return error(
+            message="Request body is required",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    try:
+        data = validate_request(UserBulkCreate, body)
+    except ValidationError as e:
+        return error(
+            message="Invalid request body",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
+    try:
+        with get_db() as db:
+            users = create_users(db, data.users)
+            response = [UserResponse.model_validate(user) for user in users]
+            return success(data=response, status_code=201)
+
+    except DuplicateAccountError as e:
+        return error(message=str(e), status_code=HTTPStatus.CONFLICT)
+
+    except DuplicateEmailError as e:
+        return error(message=str(e), status_code=HTTPStatus.CONFLICT)
+
+    except HashingBusyError as e:
+        return error(message=str(e), status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
     except Exception as e:
         return error(
             message="Internal server error",
@@ -93,7 +125,7 @@ def create_user_handler(body: dict | None) -> Response:
 
 def get_user_handler(user_id: str) -> Response:
     try:
-        user_id = UserIdPath.model_validate({"user_id": user_id}).user_id
+        user_id = validate_request(UserIdPath, {"user_id": user_id}).user_id
     except ValidationError as e:
         return error(
             message="Invalid user_id",
@@ -122,11 +154,29 @@ def get_user_handler(user_id: str) -> Response:
         )
 
 
-def get_all_users_handler() -> Response:
+def get_all_users_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(PaginationQuery, params)
+    except ValidationError as e:
+        return error(
+            message="Invalid query parameters",
+            status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
+        )
+
     try:
         with get_db() as db:
-            users = get_all_users(db)
-            return success([UserResponse.model_validate(user) for user in users])
+            page = get_all_users(db, query)
+            response = UserPaginationResponse(
+                users=[UserResponse.model_validate(user) for user in page.items],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
+
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -159,8 +209,8 @@ def get_user_by_account_handler(user_account: str) -> Response:
 
 def get_user_by_email_handler(user_email: str) -> Response:
     try:
-        user_email = UserEmailQuery.model_validate(
-            {"user_email": user_email}
+        user_email = validate_request(
+            UserEmailQuery, {"user_email": user_email}
         ).user_email
     except ValidationError as e:
         return error(
@@ -196,7 +246,7 @@ def update_user_info_handler(user_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        user_id = UserIdPath.model_validate({"user_id": user_id}).user_id
+        user_id = validate_request(UserIdPath, {"user_id": user_id}).user_id
     except ValidationError as e:
         return error(
             message="Invalid user_id",
@@ -205,7 +255,7 @@ def update_user_info_handler(user_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = UserUpdateInfo.model_validate(body)
+        data = validate_request(UserUpdateInfo, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -245,7 +295,7 @@ def update_user_password_handler(user_id: str, body: dict | None) -> Response:
             status_code=HTTPStatus.BAD_REQUEST,
         )
     try:
-        user_id = UserIdPath.model_validate({"user_id": user_id}).user_id
+        user_id = validate_request(UserIdPath, {"user_id": user_id}).user_id
     except ValidationError as e:
         return error(
             message="Invalid user_id",
@@ -254,7 +304,7 @@ def update_user_password_handler(user_id: str, body: dict | None) -> Response:
         )
 
     try:
-        data = UserUpdatePassword.model_validate(body)
+        data = validate_request(UserUpdatePassword, body)
     except ValidationError as e:
         return error(
             message="Invalid request body",
@@ -276,7 +326,9 @@ def update_user_password_handler(user_id: str, body: dict | None) -> Response:
                     status_code=HTTPStatus.BAD_REQUEST,
                 )
 
-            if verify_password(data.new_password, user.user_password):
+            # The old password was just verified, so a plain comparison
+            # answers this without a second bcrypt round.
+            if data.new_password == data.old_password:
                 return error(
                     message="New password must be different from old password",
                     status_code=HTTPStatus.BAD_REQUEST,
@@ -286,6 +338,9 @@ def update_user_password_handler(user_id: str, body: dict | None) -> Response:
 
             return success(status_code=HTTPStatus.NO_CONTENT)
 
+    except HashingBusyError as e:
+        return error(message=str(e), status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
     except Exception as e:
         return error(
             message="Internal server error",
@@ -296,7 +351,7 @@ def update_user_password_handler(user_id: str, body: dict | None) -> Response:
 
 def delete_user_handler(user_id: str) -> Response:
     try:
-        user_id = UserIdPath.model_validate({"user_id": user_id}).user_id
+        user_id = validate_request(UserIdPath, {"user_id": user_id}).user_id
     except ValidationError as e:
         return error(
             message="Invalid user_id",
@@ -323,28 +378,29 @@ def delete_user_handler(user_id: str) -> Response:
         )
 
 
-def search_users_handler(query: str) -> Response:
-    if not query or not query.strip():
+def search_users_handler(params: dict[str, str | None]) -> Response:
+    try:
+        query = validate_request(SearchQuery, params)
+    except ValidationError as e:
         return error(
-            message="Query parameter is required and cannot be empty",
+            message="Invalid query parameters",
             status_code=HTTPStatus.BAD_REQUEST,
+            details=errors_from_validation_error(e),
         )
 
     try:
         with get_db() as db:
-            keyword = query.strip()
-            search_type = detect_search_type(keyword)
-
-            if search_type == SearchType.EMAIL:
-                users = search_users_by_email(db, keyword)
-            elif search_type == SearchType.PHONE:
-                users = search_users_by_phone(db, keyword)
-            elif search_type == SearchType.NAME:
-                users = search_users_by_name(db, keyword)
-            else:
-                users = search_users_by_account(db, keyword)
+            page = search_users(db, query.query, query)
+            response = UserPaginationResponse(
+                users=[UserResponse.model_validate(user) for user in page.items],
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+                limit=page.limit,
+            )
+            return success(response)
 
-            return success([UserResponse.model_validate(user) for user in users])
+    except InvalidCursorError as e:
+        return error(message=str(e), status_code=HTTPStatus.BAD_REQUEST)
 
     except Exception as e:
         return error(
@@ -352,14 +408,3 @@ def search_users_handler(query: str) -> Response:
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             details=str(e),
         )
-
-
-def detect_search_type(keyword: str) -> str:
-    keyword = keyword.strip()
-    if "@" in keyword:
-        return SearchType.EMAIL
-    if PHONE_REGEX.search(keyword):
-        return SearchType.PHONE
-    if UPPERCASE_REGEX.search(keyword) or " " in keyword:
-        return SearchType.NAME
-    return SearchType.ACCOUNT
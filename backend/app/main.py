@@ -1,8 +1,20 @@
+import json
+import time
+
+# Start of module init, reported once as the Server-Timing "coldstart" phase.
+_init_started = time.perf_counter()
+
 from app.core.logger import logger
+from app.core.compression import compress_response
+from app.core.sql_metrics import track_queries
+from app.core.profiling import profile_request, should_profile
+from app.core.server_timing import add_server_timing, phase, track_request
+from app.core.tracing import SERVICE_NAME, tracer
+from app.core.auth import authenticate
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.shared.json_encoder import Encoder
 from aws_lambda_powertools.metrics import Metrics
 from aws_lambda_powertools.metrics import MetricUnit
-from aws_lambda_powertools import Tracer
 
 
 from app.routes.customer import router as customer_router
@@ -12,11 +24,25 @@ from app.routes.status import router as status_router
 from app.routes.user import router as user_router
 from app.routes.order import router as order_router
 from app.routes.item import router as item_router
+from app.routes.change import router as change_router
+from app.routes.auth import router as auth_router
+from app.handlers.batch import batch_handler
+from app.handlers.order_export import run_order_export_handler
+from app.services.partition import run_maintenance
+from app.services.archive import run_archive
+from app.database import get_db
+from app.schemas.batch import BATCH_PATH
+
+
+def _serialize(body) -> str:
+    # The resolver JSON-encodes bodies after the route returns.
+    with phase("serialize"):
+        return json.dumps(body, separators=(",", ":"), cls=Encoder)
 
-SERVICE_NAME = "SmartSalesApi"
 
-app = APIGatewayRestResolver(debug=True)
-tracer = Tracer(service=SERVICE_NAME)
+# Debug mode prints every raw event, including login passwords and
+# Authorization headers; keep it off regardless of POWERTOOLS_DEV.
+app = APIGatewayRestResolver(debug=False, serializer=_serialize)
 metrics = Metrics(namespace="MyApplication", service=SERVICE_NAME)
 
 # include routers
@@ -27,13 +53,110 @@ app.include_router(status_router)
 app.include_router(user_router)
 app.include_router(order_router)
 app.include_router(item_router)
+app.include_router(change_router)
+app.include_router(auth_router)
+
+app.use(middlewares=[authenticate])
+
+_init_ms: float | None = (time.perf_counter() - _init_started) * 1000
+
+
+# Registered on the resolver itself: sub-requests are dispatched back through
+# every route above.
+@app.post(BATCH_PATH)
+def batch():
+    event = app.current_event.raw_event
+    body = app.current_event.json_body
+    return batch_handler(app, event, app.lambda_context, body)
 
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 @metrics.log_metrics(capture_cold_start_metric=True)
 def lambda_handler(event, context):
-    metrics.add_dimension(name="Path", value="/orders")
+    # The API Gateway resource template (/orders/{order_id}), not the raw path,
+    # keeps the dimension's cardinality bounded.
+    metrics.add_dimension(name="Path", value=event.get("resource") or event["path"])
+    metrics.add_dimension(name="Method", value=event["httpMethod"])
     metrics.add_metric(name="ApiRequest", unit=MetricUnit.Count, value=1)
 
-    return app.resolve(event, context)
+    global _init_ms
+    cold_start_ms, _init_ms = _init_ms, None
+
+    with track_queries() as queries, track_request(queries, cold_start_ms) as timing:
+        if should_profile(event):
+            route = f"{event['httpMethod']} {event.get('resource') or event['path']}"
+            with profile_request(route, context.aws_request_id):
+                response = app.resolve(event, context)
+        else:
+            response = app.resolve(event, context)
+
+        with phase("compress"):
+            response = compress_response(
+                response, app.current_event.headers.get("Accept-Encoding")
+            )
+
+    metrics.add_metric(
+        name="SqlStatements", unit=MetricUnit.Count, value=queries.statements
+    )
+    metrics.add_metric(
+        name="SqlTime", unit=MetricUnit.Milliseconds, value=queries.db_time_ms
+    )
+    if queries.slow_statements:
+        metrics.add_metric(
+            name="SlowSqlStatements",
+            unit=MetricUnit.Count,
+            value=queries.slow_statements,
+        )
+
+    return add_server_timing(response, timing)
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def order_export_handler(event, context):
+    return run_order_export_handler(event["exportId"])
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def analytics_snapshot_handler(event, context):
+    # pyarrow is only packaged with this function; see requirements-analytics.txt.
+    from app.analytics.queries import dashboard_summary, write_dashboard_summary
+    from app.analytics.snapshot import run_snapshot
+
+    with get_db() as db:
+        result = run_snapshot(db)
+    # The API function serves this file; it cannot query the Parquet itself.
+    write_dashboard_summary(dashboard_summary())
+    return {
+        "watermark": result.watermark.isoformat(),
+        "partitions": result.partitions,
+        "orders": result.orders,
+        "items": result.items,
+    }
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def partition_maintenance_handler(event, context):
+    with get_db() as db:
+        result = run_maintenance(db)
+    return {
+        "created": result.created,
+        "detached": result.detached,
+        "kept": result.kept,
+    }
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+def archive_orders_handler(event, context):
+    with get_db() as db:
+        result = run_archive(db)
+    return {
+        "cutoff": result.cutoff.isoformat(),
+        "orders": result.orders,
+        "items": result.items,
+        "batches": result.batches,
+    }
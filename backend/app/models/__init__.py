@@ -5,4 +5,6 @@ from .product import Product
 from .price import Price
 from .user import User
 from .order import Order
-from .item import Item
\ No newline at end of file
+from .item import Item
+from .tombstone import Tombstone
+from .archive import ArchivedOrder, ArchivedItem
\ No newline at end of file
@@ -0,0 +1,67 @@
+from sqlalchemy import (
+    DECIMAL,
+    TIMESTAMP,
+    text,
+    Integer,
+    ForeignKey,
+    PrimaryKeyConstraint,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
+from app.models import Base
+from app.models.order import Order
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+
+class ArchivedOrder(Base):
+    # Mirrors Order so the same schemas and services can read either.
+
+    __tablename__ = "orders_archive"
+
+    order_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    customer_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("customer.customer_id"), nullable=False
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+    )
+    order_total: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
+    status_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("status.status_id"), nullable=False
+    )
+    order_attachment: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    order_date: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP)
+    archived_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    customer = relationship("Customer")
+    user = relationship("User")
+    status = relationship("Status")
+    items = relationship("ArchivedItem", back_populates="order", viewonly=True)
+
+    # Archived orders are always DELIVERED or CANCELLED, so this always raises.
+    ensure_items_can_be_modified = Order.ensure_items_can_be_modified
+
+
+class ArchivedItem(Base):
+    __tablename__ = "item_archive"
+
+    order_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("orders_archive.order_id"), nullable=False
+    )
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("product.product_id"), nullable=False
+    )
+    item_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    item_price: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP)
+
+    order = relationship("ArchivedOrder", back_populates="items")
+    product = relationship("Product")
+
+    __table_args__ = (PrimaryKeyConstraint("order_id", "product_id"),)
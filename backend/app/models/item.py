@@ -29,7 +29,7 @@ class Item(Base):
         TIMESTAMP, server_default=text("CURRENT_TIMESTAMP")
     )
 
-    order = relationship("Order")
+    order = relationship("Order", back_populates="items")
     product = relationship("Product")
 
     __table_args__ = (PrimaryKeyConstraint("order_id", "product_id"),)
@@ -2,6 +2,7 @@ from sqlalchemy import DECIMAL, TIMESTAMP, text, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models import Base
+from app.core.ids import uuid7
 import uuid
 from datetime import datetime
 from decimal import Decimal
@@ -15,7 +16,10 @@ class Order(Base):
     __tablename__ = "orders"
 
     order_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
     )
     customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("customer.customer_id"), nullable=False
@@ -40,6 +44,7 @@ class Order(Base):
     customer = relationship("Customer")
     user = relationship("User")
     status = relationship("Status")
+    items = relationship("Item", back_populates="order", viewonly=True)
 
     def ensure_items_can_be_modified(self):
         if self.status.status_code != "PENDING":
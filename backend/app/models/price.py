@@ -2,6 +2,7 @@ from sqlalchemy import DECIMAL, TIMESTAMP, text, Date, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models import Base
+from app.core.ids import uuid7
 import uuid
 from datetime import datetime, date
 import decimal
@@ -15,7 +16,10 @@ class Price(Base):
     __tablename__ = "price"
 
     price_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
     )
     product_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("product.product_id"), nullable=False
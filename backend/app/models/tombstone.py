@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Identity, String, TIMESTAMP, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from app.models import Base
+import uuid
+from datetime import datetime
+
+
+class Tombstone(Base):
+    __tablename__ = "tombstone"
+
+    tombstone_id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=True), primary_key=True
+    )
+    table_name: Mapped[str] = mapped_column(String(30), nullable=False)
+    row_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
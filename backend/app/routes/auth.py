@@ -0,0 +1,10 @@
+from aws_lambda_powertools.event_handler.router import Router
+from app.handlers.auth import login_handler
+
+router = Router()
+
+
+@router.post("/auth/login")
+def login():
+    body = router.current_event.json_body
+    return login_handler(body)
@@ -0,0 +1,10 @@
+from aws_lambda_powertools.event_handler.router import Router
+from app.handlers.change import get_changes_handler
+
+router = Router()
+
+
+@router.get("/changes")
+def get_changes():
+    params = router.current_event.query_string_parameters or {}
+    return get_changes_handler(params)
@@ -1,10 +1,12 @@
 from aws_lambda_powertools.event_handler.router import Router
 from app.handlers.customer import (
     create_customer_handler,
+    create_customers_bulk_handler,
     get_customer_handler,
     get_all_customers_handler,
     get_customer_by_email_handler,
     search_customers_handler,
+    autocomplete_customers_handler,
     update_customer_handler,
     delete_customer_handler,
 )
@@ -18,9 +20,24 @@ def create_customer():
     return create_customer_handler(body)
 
 
+@router.post("/customers/bulk")
+def create_customers_bulk():
+    event = router.current_event
+    return create_customers_bulk_handler(
+        event.decoded_body, event.headers.get("Content-Type")
+    )
+
+
+@router.get("/customers/autocomplete")
+def autocomplete_customers():
+    params = router.current_event.query_string_parameters or {}
+    return autocomplete_customers_handler(params)
+
+
 @router.get("/customers/<customer_id>")
 def get_customer(customer_id: str):
-    return get_customer_handler(customer_id)
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_customer_handler(customer_id, if_none_match)
 
 
 @router.get("/customers")
@@ -31,9 +48,10 @@ def get_all_customers():
         return get_customer_by_email_handler(params["email"])
 
     if "query" in params:
-        return search_customers_handler(params["query"])
+        return search_customers_handler(params)
 
-    return get_all_customers_handler()
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_all_customers_handler(params, if_none_match)
 
 
 @router.put("/customers/<customer_id>")
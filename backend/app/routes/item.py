@@ -16,7 +16,8 @@ def get_item(order_id: str, product_id: str):
 
 @router.get("/items")
 def get_all_items():
-    return get_all_items_handler()
+    params = router.current_event.query_string_parameters or {}
+    return get_all_items_handler(params)
 
 
 @router.get("/orders/<order_id>/items")
@@ -11,6 +11,10 @@ from app.handlers.order import (
     confirm_order_attachment_handler,
     get_dashboard_summary_handler,
 )
+from app.handlers.order_export import (
+    create_order_export_handler,
+    get_order_export_handler,
+)
 
 router = Router()
 
@@ -21,15 +25,29 @@ def create_order():
     return create_order_handler(body)
 
 
+@router.post("/orders/exports")
+def create_order_export():
+    body = router.current_event.json_body
+    return create_order_export_handler(body)
+
+
+@router.get("/orders/exports/<export_id>")
+def get_order_export(export_id: str):
+    return get_order_export_handler(export_id)
+
+
 @router.get("/orders/<order_id>")
 def get_order(order_id: str):
-    return get_order_handler(order_id)
+    params = router.current_event.query_string_parameters or {}
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_order_handler(order_id, params, if_none_match)
 
 
 @router.get("/orders")
 def get_orders():
     params = router.current_event.query_string_parameters or {}
-    return get_orders_handler(params)
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_orders_handler(params, if_none_match)
 
 
 @router.patch("/orders/<order_id>")
@@ -29,7 +29,7 @@ def get_all_prices():
     if "product_id" in params:
         return get_prices_by_product_handler(params["product_id"])
 
-    return get_all_prices_handler()
+    return get_all_prices_handler(params)
 
 
 @router.put("/prices/<price_id>")
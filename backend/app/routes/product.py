@@ -4,6 +4,7 @@ from app.handlers.product import (
     get_product_handler,
     get_all_products_handler,
     search_products_handler,
+    autocomplete_products_handler,
     update_product_handler,
     delete_product_handler,
 )
@@ -17,9 +18,16 @@ def create_product():
     return create_product_handler(body)
 
 
+@router.get("/products/autocomplete")
+def autocomplete_products():
+    params = router.current_event.query_string_parameters or {}
+    return autocomplete_products_handler(params)
+
+
 @router.get("/products/<product_id>")
 def get_product(product_id: str):
-    return get_product_handler(product_id)
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_product_handler(product_id, if_none_match)
 
 
 @router.get("/products")
@@ -27,9 +35,10 @@ def get_all_products():
     params = router.current_event.query_string_parameters or {}
 
     if "query" in params:
-        return search_products_handler(params["query"])
+        return search_products_handler(params)
 
-    return get_all_products_handler()
+    if_none_match = router.current_event.headers.get("If-None-Match")
+    return get_all_products_handler(params, if_none_match)
 
 
 @router.put("/products/<product_id>")
@@ -20,4 +20,4 @@ def get_all_statuses():
     if "code" in params:
         return get_status_by_code_handler(params["code"])
 
-    return get_all_statuses_handler()
+    return get_all_statuses_handler(params)
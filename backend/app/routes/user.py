@@ -1,6 +1,7 @@
 from aws_lambda_powertools.event_handler.router import Router
 from app.handlers.user import (
     create_user_handler,
+    create_users_bulk_handler,
     get_user_handler,
     get_all_users_handler,
     get_user_by_account_handler,
@@ -20,6 +21,12 @@ def create_user():
     return create_user_handler(body)
 
 
+@router.post("/users/bulk")
+def create_users_bulk():
+    body = router.current_event.json_body
+    return create_users_bulk_handler(body)
+
+
 @router.get("/users/<user_id>")
 def get_user(user_id: str):
     return get_user_handler(user_id)
@@ -36,9 +43,9 @@ def get_all_users():
         return get_user_by_email_handler(params["email"])
 
     if "query" in params:
-        return search_users_handler(params["query"])
+        return search_users_handler(params)
 
-    return get_all_users_handler()
+    return get_all_users_handler(params)
 
 
 @router.patch("/users/<user_id>")
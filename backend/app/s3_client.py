@@ -1,11 +1,17 @@
 import boto3
+import json
 import os
-from typing import Tuple
+from botocore.exceptions import ClientError
+from typing import Any, Tuple
 import uuid
+from app.core.tracing import trace_functions, traced
 
 BUCKET_NAME = os.getenv("AWS_BUCKET_NAME")
 AWS_REGION = os.getenv("AWS_REGION", "ap-southeast-2")
 
+# S3 rejects multipart parts under 5 MiB except for the last one.
+MULTIPART_PART_SIZE = int(os.getenv("S3_MULTIPART_PART_SIZE", str(8 * 1024 * 1024)))
+
 _s3_client = None
 
 
@@ -74,3 +80,125 @@ def delete_file_from_s3(key: str):
         Bucket=BUCKET_NAME,
         Key=key,
     )
+
+
+def put_json_object(key: str, data: Any) -> None:
+    s3 = get_s3_client()
+    s3.put_object(
+        Bucket=BUCKET_NAME,
+        Key=key,
+        Body=json.dumps(data).encode(),
+        ContentType="application/json",
+    )
+
+
+def put_bytes_object(key: str, data: bytes, content_type: str) -> None:
+    s3 = get_s3_client()
+    s3.put_object(
+        Bucket=BUCKET_NAME,
+        Key=key,
+        Body=data,
+        ContentType=content_type,
+    )
+
+
+def get_json_object(key: str) -> Any | None:
+    s3 = get_s3_client()
+    try:
+        response = s3.get_object(Bucket=BUCKET_NAME, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+            return None
+        raise
+    return json.loads(response["Body"].read())
+
+
+class MultipartUpload:
+    # Holds at most one part in memory; aborted if the with block raises.
+
+    def __init__(
+        self,
+        key: str,
+        content_type: str,
+        part_size: int = MULTIPART_PART_SIZE,
+    ):
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._parts: list[dict[str, Any]] = []
+        self._upload_id: str | None = None
+
+    def __enter__(self) -> "MultipartUpload":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.complete()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        self.bytes_written += len(data)
+        if len(self._buffer) >= self.part_size:
+            self._upload_part()
+
+    @traced("s3_client.upload_part")
+    def _upload_part(self) -> None:
+        s3 = get_s3_client()
+        if self._upload_id is None:
+            self._upload_id = s3.create_multipart_upload(
+                Bucket=BUCKET_NAME,
+                Key=self.key,
+                ContentType=self.content_type,
+            )["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = s3.upload_part(
+            Bucket=BUCKET_NAME,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer.clear()
+
+    @traced("s3_client.complete_upload")
+    def complete(self) -> None:
+        s3 = get_s3_client()
+        if self._upload_id is None:
+            # Small exports never filled a part; a plain PUT is cheaper.
+            s3.put_object(
+                Bucket=BUCKET_NAME,
+                Key=self.key,
+                Body=bytes(self._buffer),
+                ContentType=self.content_type,
+            )
+            self._buffer.clear()
+            return
+
+        if self._buffer:
+            self._upload_part()
+        s3.complete_multipart_upload(
+            Bucket=BUCKET_NAME,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    @traced("s3_client.abort_upload")
+    def abort(self) -> None:
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        get_s3_client().abort_multipart_upload(
+            Bucket=BUCKET_NAME,
+            Key=self.key,
+            UploadId=self._upload_id,
+        )
+
+
+trace_functions(globals())
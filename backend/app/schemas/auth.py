@@ -0,0 +1,13 @@
+from typing import Literal
+from app.schemas.base_schema import CamelCaseModel
+
+
+class LoginRequest(CamelCaseModel):
+    user_account: str
+    password: str
+
+
+class TokenResponse(CamelCaseModel):
+    access_token: str
+    token_type: Literal["Bearer"] = "Bearer"
+    expires_in: int
@@ -0,0 +1,20 @@
+from pydantic import Field, field_validator
+from app.schemas.base_schema import CamelCaseModel
+
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 20
+
+
+class AutocompleteQuery(CamelCaseModel):
+    query: str = Field(min_length=1, max_length=50)
+    limit: int = Field(
+        default=DEFAULT_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_AUTOCOMPLETE_LIMIT
+    )
+
+    @field_validator("query")
+    @classmethod
+    def strip_query(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("Query parameter is required and cannot be empty")
+        return v
@@ -1,6 +1,17 @@
+from typing import Any, TypeVar
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
+from app.core.server_timing import phase
 
 
 class CamelCaseModel(BaseModel):
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def validate_request(model: type[ModelT], data: Any) -> ModelT:
+    # Request input only, reported as the "validation" phase of Server-Timing.
+    with phase("validation"):
+        return model.model_validate(data)
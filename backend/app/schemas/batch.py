@@ -0,0 +1,52 @@
+import os
+from enum import Enum
+from typing import Any
+from pydantic import Field, field_validator
+from app.schemas.base_schema import CamelCaseModel
+
+MAX_BATCH_SIZE = int(os.getenv("BATCH_MAX_REQUESTS", "25"))
+BATCH_PATH = "/batch"
+
+
+class BatchMethod(str, Enum):
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    PATCH = "PATCH"
+    DELETE = "DELETE"
+
+
+class BatchSubRequest(CamelCaseModel):
+    id: str | None = Field(default=None, max_length=64)
+    method: BatchMethod
+    path: str = Field(min_length=1, max_length=2048)
+    query: dict[str, str] | None = None
+    body: Any = None
+
+    @field_validator("method", mode="before")
+    @classmethod
+    def upper_method(cls, v: Any) -> Any:
+        return v.upper() if isinstance(v, str) else v
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, v: str) -> str:
+        if not v.startswith("/"):
+            raise ValueError("Path must start with '/'")
+        if v.split("?", 1)[0].rstrip("/") == BATCH_PATH:
+            raise ValueError("Batch requests cannot be nested")
+        return v
+
+
+class BatchRequest(CamelCaseModel):
+    requests: list[BatchSubRequest] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchSubResponse(CamelCaseModel):
+    id: str | None = None
+    status: int
+    body: Any = None
+
+
+class BatchResponse(CamelCaseModel):
+    responses: list[BatchSubResponse]
@@ -0,0 +1,16 @@
+from pydantic import Field
+import uuid
+from decimal import Decimal
+from app.schemas.product import ProductCreate
+from app.schemas.price import PriceCreate
+
+
+class CatalogProductRow(ProductCreate):
+    # Blank inserts a new product; an id upserts that product.
+    product_id: uuid.UUID | None = None
+    product_name: str = Field(min_length=1, max_length=100)
+
+
+class CatalogPriceRow(PriceCreate):
+    # decimal(10, 2): anything wider would fail the whole batch in the database.
+    price_amount: Decimal = Field(gt=0, max_digits=10, decimal_places=2)
@@ -0,0 +1,47 @@
+from pydantic import Field, field_validator
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from app.core.pagination import decode_cursor
+from app.schemas.base_schema import CamelCaseModel
+
+DEFAULT_CHANGES_LIMIT = 100
+MAX_CHANGES_LIMIT = 500
+
+
+class ChangeResource(str, Enum):
+    CUSTOMERS = "customers"
+    PRODUCTS = "products"
+    PRICES = "prices"
+    STATUSES = "statuses"
+    USERS = "users"
+    ORDERS = "orders"
+
+
+class ChangeQuery(CamelCaseModel):
+    resource: ChangeResource
+    since: list[Any] | None = None
+    limit: int = Field(default=DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT)
+
+    @field_validator("since", mode="before")
+    @classmethod
+    def validate_since(cls, v: Any) -> list[Any] | None:
+        if v is None or v == "":
+            return None
+        if isinstance(v, str):
+            return decode_cursor(v)
+        return v
+
+
+class TombstoneResponse(CamelCaseModel):
+    id: uuid.UUID
+    deleted_at: datetime
+
+
+class ChangeFeedResponse(CamelCaseModel):
+    resource: ChangeResource
+    changes: list[Any]
+    deleted: list[TombstoneResponse]
+    next_token: str
+    has_more: bool
@@ -1,8 +1,18 @@
-from pydantic import EmailStr, field_validator, ConfigDict
+from pydantic import EmailStr, Field, field_validator, ConfigDict
+from pydantic.networks import validate_email
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+import os
 import uuid
 from datetime import datetime
 import re
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
+
+# Keeps the per-row results of one request well under the 6 MB Lambda
+# response limit; bigger lists are sent in several requests.
+MAX_IMPORT_ROWS = int(os.getenv("CUSTOMERS_BULK_MAX", "20000"))
 
 
 class CustomerBase(CamelCaseModel):
@@ -25,6 +35,81 @@ class CustomerCreate(CustomerBase):
     pass
 
 
+# RFC 5322 dot-atom local part: accepted as-is by email-validator, so only
+# the domain (IDNA checks, most of the cost) needs the full validator.
+_DOT_ATOM_EMAIL = re.compile(
+    r"([A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*)@(.+)"
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalized_domain(domain: str) -> str | None:
+    try:
+        return validate_email(f"a@{domain}")[1].partition("@")[2]
+    except ValueError:
+        return None
+
+
+class CustomerImportRow(CustomerCreate):
+    """A bulk import row, checked against the column widths so COPY cannot fail."""
+
+    customer_name: str = Field(min_length=1, max_length=50)
+
+    @field_validator("customer_email", mode="wrap")
+    @classmethod
+    def validate_email_by_domain(cls, v: Any, handler) -> str:
+        # Same result as EmailStr, with each domain validated once per
+        # container: an import repeats a handful of domains thousands of times.
+        match = _DOT_ATOM_EMAIL.fullmatch(v) if isinstance(v, str) else None
+        if match and len(v) <= 40:
+            domain = _normalized_domain(match[2])
+            if domain is not None:
+                return f"{match[1]}@{domain}"
+        return handler(v)
+
+    @field_validator("customer_email")
+    @classmethod
+    def validate_email_length(cls, v: str) -> str:
+        if len(v) > 40:
+            raise ValueError("Email must be at most 40 characters")
+        return v
+
+    @field_validator("customer_phone")
+    @classmethod
+    def validate_phone_length(cls, v: str) -> str:
+        if len(v) > 15:
+            raise ValueError("Phone number must be at most 15 characters")
+        return v
+
+
+class CustomerBulkCreate(CamelCaseModel):
+    # Rows are validated one by one so a bad row does not reject the rest.
+    customers: list[dict[str, Any]] = Field(min_length=1, max_length=MAX_IMPORT_ROWS)
+
+
+class ImportStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    INVALID = "invalid"
+
+
+class CustomerImportResult(CamelCaseModel):
+    # Position in the request: JSON array index or CSV data row, from 0.
+    row: int
+    status: ImportStatus
+    customer_id: uuid.UUID | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+class CustomerImportResponse(CamelCaseModel):
+    created: int
+    updated: int
+    unchanged: int
+    invalid: int
+    results: list[CustomerImportResult]
+
+
 class CustomerIdPath(CamelCaseModel):
     customer_id: uuid.UUID
 
@@ -40,6 +125,17 @@ class CustomerResponse(CustomerBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CustomerAutocompleteResponse(CamelCaseModel):
+    customer_id: uuid.UUID
+    customer_name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CustomerPaginationResponse(CursorPaginationResponse):
+    customers: list[CustomerResponse]
+
+
 class CustomerUpdate(CamelCaseModel):
     customer_name: str | None = None
     customer_email: EmailStr | None = None
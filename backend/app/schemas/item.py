@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
 
 
 class ItemBase(CamelCaseModel):
@@ -33,3 +34,7 @@ class ItemResponse(CamelCaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ItemPaginationResponse(CursorPaginationResponse):
+    items: list[ItemResponse]
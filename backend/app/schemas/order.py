@@ -2,9 +2,11 @@ from pydantic import ConfigDict, field_validator, model_validator
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Literal
+from enum import Enum
+from typing import Any, Literal
 from app.schemas.status import StatusCode
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.price import PriceResponse
 
 
 class OrderBase(CamelCaseModel):
@@ -54,6 +56,57 @@ class OrderResponse(CamelCaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class OrderInclude(str, Enum):
+    ITEMS = "items"
+    PRODUCTS = "products"
+    PRICES = "prices"
+
+
+class OrderDetailQuery(CamelCaseModel):
+    include: frozenset[OrderInclude] = frozenset()
+
+    @field_validator("include", mode="before")
+    @classmethod
+    def split_include(cls, v: Any) -> Any:
+        if isinstance(v, str):
+            return {part.strip() for part in v.split(",") if part.strip()}
+        return v
+
+    @model_validator(mode="after")
+    def expand_implied_includes(self):
+        include = set(self.include)
+        if OrderInclude.PRICES in include:
+            include.add(OrderInclude.PRODUCTS)
+        if OrderInclude.PRODUCTS in include:
+            include.add(OrderInclude.ITEMS)
+        self.include = frozenset(include)
+        return self
+
+
+class OrderItemProductResponse(CamelCaseModel):
+    product_id: uuid.UUID
+    product_name: str
+    product_description: str | None
+    product_quantity: int
+    prices: list[PriceResponse] | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderItemResponse(CamelCaseModel):
+    product_id: uuid.UUID
+    item_quantity: int
+    item_price: Decimal
+    updated_at: datetime
+    product: OrderItemProductResponse | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderDetailResponse(OrderResponse):
+    items: list[OrderItemResponse] | None = None
+
+
 class OrderUpdateStatus(StatusCode):
     pass
 
@@ -0,0 +1,65 @@
+from pydantic import Field, field_validator, model_validator
+import uuid
+from datetime import datetime, date
+from enum import Enum
+from app.schemas.base_schema import CamelCaseModel
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ExportStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class OrderExportFilter(CamelCaseModel):
+    user_id: uuid.UUID | None = None
+    customer_id: uuid.UUID | None = None
+    status_code: str | None = None
+    order_date: date | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+    search: str | None = Field(default=None, max_length=100)
+
+    @field_validator("status_code")
+    @classmethod
+    def upper_status_code(cls, v: str | None) -> str | None:
+        return v.upper() if v else v
+
+    @model_validator(mode="after")
+    def validate_date_range(self):
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("dateFrom must be on or before dateTo")
+        return self
+
+
+class OrderExportCreate(CamelCaseModel):
+    format: ExportFormat = ExportFormat.CSV
+    filters: OrderExportFilter = Field(default_factory=OrderExportFilter)
+
+
+class OrderExportIdPath(CamelCaseModel):
+    export_id: uuid.UUID
+
+
+class OrderExportManifest(CamelCaseModel):
+    export_id: uuid.UUID
+    status: ExportStatus
+    format: ExportFormat
+    filters: OrderExportFilter
+    key: str
+    order_count: int = 0
+    item_count: int = 0
+    size_bytes: int = 0
+    error: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
+
+
+class OrderExportResponse(OrderExportManifest):
+    download_url: str | None = None
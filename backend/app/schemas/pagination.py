@@ -0,0 +1,37 @@
+from pydantic import Field, field_validator
+from typing import Any, Literal
+from app.core.pagination import DEFAULT_LIMIT, MAX_LIMIT, decode_cursor
+from app.schemas.base_schema import CamelCaseModel
+
+
+class PaginationQuery(CamelCaseModel):
+    limit: int = Field(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT)
+    cursor: list[Any] | None = None
+    direction: Literal["next", "prev"] = "next"
+
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def validate_cursor(cls, v: Any) -> list[Any] | None:
+        if v is None or v == "":
+            return None
+        if isinstance(v, str):
+            return decode_cursor(v)
+        return v
+
+
+class SearchQuery(PaginationQuery):
+    query: str = Field(min_length=1, max_length=100)
+
+    @field_validator("query")
+    @classmethod
+    def strip_query(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("Query parameter is required and cannot be empty")
+        return v
+
+
+class CursorPaginationResponse(CamelCaseModel):
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    limit: int
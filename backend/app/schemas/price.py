@@ -4,6 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from datetime import date
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
 
 
 class PriceBase(CamelCaseModel):
@@ -32,6 +33,10 @@ class PriceResponse(PriceBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PricePaginationResponse(CursorPaginationResponse):
+    prices: list[PriceResponse]
+
+
 class PriceUpdate(CamelCaseModel):
     product_id: uuid.UUID | None = None
     price_amount: Decimal | None = Field(default=None, gt=0)
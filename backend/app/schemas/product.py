@@ -2,6 +2,7 @@ from pydantic import Field, ConfigDict
 import uuid
 from datetime import datetime
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
 from decimal import Decimal
 
 
@@ -33,6 +34,17 @@ class ProductResponse(ProductBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProductAutocompleteResponse(CamelCaseModel):
+    product_id: uuid.UUID
+    product_name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProductPaginationResponse(CursorPaginationResponse):
+    products: list[ProductResponse]
+
+
 class ProductUpdate(CamelCaseModel):
     product_name: str | None = None
     product_description: str | None = None
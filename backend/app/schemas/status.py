@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 import re
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
 
 
 class StatusBase(CamelCaseModel):
@@ -43,3 +44,7 @@ class StatusResponse(StatusBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class StatusPaginationResponse(CursorPaginationResponse):
+    statuses: list[StatusResponse]
@@ -1,8 +1,18 @@
+import os
 from pydantic import EmailStr, Field, field_validator, ConfigDict
 import uuid
 from datetime import datetime
 import re
 from app.schemas.base_schema import CamelCaseModel
+from app.schemas.pagination import CursorPaginationResponse
+
+# Every password in a bulk request is hashed before the single commit, so a
+# request must fit in the hashing queue (see app.services.user) and, at the
+# configured bcrypt cost, in the function timeout.
+MAX_BULK_USERS = min(
+    int(os.getenv("USERS_BULK_MAX", "16")),
+    int(os.getenv("PASSWORD_HASH_QUEUE", "64")),
+)
 
 
 class UserBase(CamelCaseModel):
@@ -27,6 +37,10 @@ class UserCreate(UserBase):
     pass
 
 
+class UserBulkCreate(CamelCaseModel):
+    users: list[UserCreate] = Field(min_length=1, max_length=MAX_BULK_USERS)
+
+
 class UserIdPath(CamelCaseModel):
     user_id: uuid.UUID
 
@@ -46,6 +60,10 @@ class UserResponse(CamelCaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPaginationResponse(CursorPaginationResponse):
+    users: list[UserResponse]
+
+
 class UserUpdateInfo(CamelCaseModel):
     user_name: str | None = None
     user_email: EmailStr | None = None
@@ -0,0 +1,140 @@
+"""Cold archival of closed orders.
+
+Moves DELIVERED and CANCELLED orders older than the retention window, with
+their items, from the hot orders/item tables into orders_archive and
+item_archive. Each batch is one transaction that deletes the hot rows and
+inserts them into the archive in the same statement, so an order is never
+visible in both places or in neither. get_order and get_items_by_order read
+through to the archive when the hot lookup misses.
+
+    python -m app.services.archive --after-days 400 --batch-size 1000
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+from app.core.logger import logger
+from app.database import SessionLocal
+from app.models import Order, Item, Status, ArchivedOrder, ArchivedItem
+from app.core.tracing import trace_functions
+
+CLOSED_STATUSES = ("DELIVERED", "CANCELLED")
+
+# Longer than the 12-month revenue dashboard window, which only reads hot rows.
+ARCHIVE_AFTER_DAYS = int(os.getenv("ORDERS_ARCHIVE_AFTER_DAYS", "400"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ORDERS_ARCHIVE_BATCH_SIZE", "1000"))
+# Stop starting new batches after this long so a scheduled run always ends
+# cleanly inside its Lambda timeout; the next run picks up where it stopped.
+ARCHIVE_TIME_BUDGET = float(os.getenv("ORDERS_ARCHIVE_TIME_BUDGET_SECONDS", "600"))
+
+# Tells record_tombstone() in SmartSales.sql that these deletes are moves.
+SKIP_TOMBSTONES = text("SET LOCAL smart_sales.archiving = 'on'")
+
+
+@dataclass
+class ArchiveResult:
+    cutoff: datetime
+    orders: int = 0
+    items: int = 0
+    batches: int = 0
+
+
+def _select_batch(cutoff: datetime, batch_size: int):
+    return (
+        select(Order.order_id)
+        .join(Order.status)
+        .where(Status.status_code.in_(CLOSED_STATUSES), Order.order_date < cutoff)
+        .order_by(Order.order_date)
+        .limit(batch_size)
+        .with_for_update(of=Order, skip_locked=True)
+    )
+
+
+def _move(source, target, condition):
+    # DELETE ... RETURNING feeds the INSERT directly, in one statement.
+    columns = [column.name for column in source.__table__.columns]
+    moved = (
+        delete(source)
+        .where(condition)
+        .returning(*[source.__table__.c[name] for name in columns])
+        .cte("moved")
+    )
+    return insert(target).from_select(columns, select(*[moved.c[n] for n in columns]))
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> tuple[int, int]:
+    order_ids = db.execute(_select_batch(cutoff, batch_size)).scalars().all()
+    if not order_ids:
+        db.rollback()
+        return 0, 0
+
+    db.execute(SKIP_TOMBSTONES)
+    # Items first: check_order_items() refuses to delete orders that have any.
+    items = db.execute(_move(Item, ArchivedItem, Item.order_id.in_(order_ids)))
+    orders = db.execute(_move(Order, ArchivedOrder, Order.order_id.in_(order_ids)))
+    db.commit()
+    return orders.rowcount, items.rowcount
+
+
+def run_archive(
+    db: Session,
+    now: datetime | None = None,
+    after_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    time_budget: float = ARCHIVE_TIME_BUDGET,
+) -> ArchiveResult:
+    result = ArchiveResult(cutoff=(now or datetime.now()) - timedelta(days=after_days))
+    deadline = time.monotonic() + time_budget
+
+    while time.monotonic() < deadline:
+        orders, items = archive_batch(db, result.cutoff, batch_size)
+        if not orders:
+            break
+
+        result.orders += orders
+        result.items += items
+        result.batches += 1
+        if orders < batch_size:
+            break
+
+    logger.info(
+        "Closed orders archived",
+        extra={
+            "cutoff": result.cutoff.isoformat(),
+            "orders": result.orders,
+            "items": result.items,
+            "batches": result.batches,
+        },
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--after-days", type=int, default=ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--time-budget", type=float, default=ARCHIVE_TIME_BUDGET)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = run_archive(
+            db,
+            after_days=args.after_days,
+            batch_size=args.batch_size,
+            time_budget=args.time_budget,
+        )
+    print(
+        f"orders={result.orders} items={result.items} batches={result.batches} "
+        f"cutoff={result.cutoff.isoformat()}"
+    )
+
+
+trace_functions(globals())
+
+
+if __name__ == "__main__":
+    main()
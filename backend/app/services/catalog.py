@@ -0,0 +1,297 @@
+"""Bulk catalog import from spreadsheet exports.
+
+Reads a products CSV (product_id, product_name, product_description,
+product_quantity) and/or a prices CSV (product_id, price_amount, price_date)
+and writes them in batches, one transaction per batch. Products are upserted
+by product_id, with a blank id inserting a new product. Prices are inserted
+in one statement per batch that checks every product reference with a single
+join and skips prices already recorded for that product and date, so a
+rerun after a failed batch does not duplicate them.
+
+    python -m app.services.catalog --products products.csv --prices prices.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Date, Integer, Numeric, column, exists, func, insert, select
+from sqlalchemy import literal_column, tuple_, values
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from sqlalchemy.orm import Session
+from app.core.logger import logger
+from app.core.response import errors_from_validation_error
+from app.database import SessionLocal
+from app.models import Price, Product
+from app.schemas.catalog import CatalogPriceRow, CatalogProductRow
+from app.core.tracing import trace_functions
+
+CATALOG_BATCH_SIZE = int(os.getenv("CATALOG_IMPORT_BATCH_SIZE", "1000"))
+
+PRODUCT_COLUMNS = ("product_name", "product_description", "product_quantity")
+
+
+@dataclass
+class RejectedRow:
+    sheet: str
+    # Spreadsheet line: the header is line 1.
+    line: int
+    errors: list[dict[str, Any]]
+
+
+@dataclass
+class CatalogResult:
+    products_created: int = 0
+    products_updated: int = 0
+    products_unchanged: int = 0
+    prices_created: int = 0
+    prices_existing: int = 0
+    batches: int = 0
+    rejected: list[RejectedRow] = field(default_factory=list)
+
+
+# Called after every committed batch with (sheet, rows done, rows total).
+Progress = Callable[[str, int, int, CatalogResult], None]
+
+
+def read_csv(path: str) -> list[dict[str, str | None]]:
+    """Rows keyed by header; empty cells are None so optional fields stay unset."""
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        return [
+            {name: value or None for name, value in row.items()}
+            for row in csv.DictReader(file)
+        ]
+
+
+def _validate(
+    sheet: str,
+    rows: list[dict],
+    model: type[BaseModel],
+    key: Callable[[BaseModel], Any],
+    result: CatalogResult,
+) -> list[tuple[int, BaseModel]]:
+    """Valid rows with their spreadsheet line; the rest go to result.rejected."""
+    valid = []
+    seen = set()
+    for line, row in enumerate(rows, start=2):
+        try:
+            item = model.model_validate(row)
+        except ValidationError as e:
+            result.rejected.append(
+                RejectedRow(sheet, line, errors_from_validation_error(e))
+            )
+            continue
+
+        item_key = key(item)
+        if item_key is not None and item_key in seen:
+            # The same row twice in one statement would conflict with itself.
+            error = {"type": "duplicate", "msg": "Repeated in the file"}
+            result.rejected.append(RejectedRow(sheet, line, [error]))
+            continue
+        seen.add(item_key)
+        valid.append((line, item))
+    return valid
+
+
+def _batches(items: list, batch_size: int) -> Iterator[list]:
+    for start in range(0, len(items), batch_size):
+        yield items[start : start + batch_size]
+
+
+def upsert_products(db: Session, products: list[CatalogProductRow]) -> tuple[int, int]:
+    """Returns (created, updated); rows that would not change are not written."""
+    stmt = pg_insert(Product).values(
+        [
+            {
+                "product_id": product.product_id or uuid.uuid4(),
+                "product_name": product.product_name,
+                "product_description": product.product_description,
+                "product_quantity": product.product_quantity,
+            }
+            for product in products
+        ]
+    )
+    current = [Product.__table__.c[name] for name in PRODUCT_COLUMNS]
+    incoming = [stmt.excluded[name] for name in PRODUCT_COLUMNS]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Product.product_id],
+        set_=dict(zip(PRODUCT_COLUMNS, incoming)),
+        where=tuple_(*current).is_distinct_from(tuple_(*incoming)),
+    ).returning(literal_column("xmax = 0").label("inserted"))
+
+    inserted = db.execute(stmt).scalars().all()
+    created = sum(inserted)
+    return created, len(inserted) - created
+
+
+def insert_prices(db: Session, prices: list[CatalogPriceRow]) -> tuple[int, set[int]]:
+    """Inserts prices whose product exists and whose date is not yet priced.
+
+    Returns (created, indexes into prices whose product_id does not exist).
+    """
+    incoming = values(
+        column("row_index", Integer),
+        column("product_id", UUID(as_uuid=True)),
+        column("price_amount", Numeric(10, 2)),
+        column("price_date", Date),
+        name="incoming",
+    ).data(
+        [
+            (index, price.product_id, price.price_amount, price.price_date)
+            for index, price in enumerate(prices)
+        ]
+    )
+    already_priced = exists().where(
+        Price.product_id == incoming.c.product_id,
+        Price.price_date == incoming.c.price_date,
+    )
+    checked = (
+        select(
+            incoming,
+            Product.product_id.is_not(None).label("known"),
+            already_priced.label("existing"),
+        )
+        .select_from(
+            incoming.outerjoin(Product, Product.product_id == incoming.c.product_id)
+        )
+        .cte("checked")
+    )
+    # include_defaults=False: Price.price_id's Python default would otherwise be
+    # evaluated once and shared by every row; the server default runs per row.
+    created = (
+        insert(Price)
+        .from_select(
+            ["product_id", "price_amount", "price_date"],
+            select(
+                checked.c.product_id, checked.c.price_amount, checked.c.price_date
+            ).where(checked.c.known, ~checked.c.existing),
+            include_defaults=False,
+        )
+        .returning(Price.price_id)
+        .cte("created")
+    )
+    stmt = select(
+        select(func.count()).select_from(created).scalar_subquery(),
+        select(func.array_agg(checked.c.row_index))
+        .where(~checked.c.known)
+        .scalar_subquery(),
+    )
+    created_count, unknown = db.execute(stmt).one()
+    return created_count, set(unknown or ())
+
+
+def import_catalog(
+    db: Session,
+    products: list[dict],
+    prices: list[dict],
+    batch_size: int = CATALOG_BATCH_SIZE,
+    progress: Progress | None = None,
+) -> CatalogResult:
+    """Products first, so prices can reference products from the same import.
+
+    Each batch is committed on its own; invalid rows are reported in
+    result.rejected and never stop the import.
+    """
+    result = CatalogResult()
+
+    valid_products = _validate(
+        "products", products, CatalogProductRow, lambda row: row.product_id, result
+    )
+    done = 0
+    for batch in _batches(valid_products, batch_size):
+        created, updated = upsert_products(db, [product for _, product in batch])
+        db.commit()
+        result.products_created += created
+        result.products_updated += updated
+        result.products_unchanged += len(batch) - created - updated
+        result.batches += 1
+        done += len(batch)
+        if progress:
+            progress("products", done, len(valid_products), result)
+
+    valid_prices = _validate(
+        "prices",
+        prices,
+        CatalogPriceRow,
+        lambda row: (row.product_id, row.price_date),
+        result,
+    )
+    done = 0
+    for batch in _batches(valid_prices, batch_size):
+        created, unknown = insert_prices(db, [price for _, price in batch])
+        db.commit()
+        result.prices_created += created
+        result.prices_existing += len(batch) - created - len(unknown)
+        for index in sorted(unknown):
+            line, price = batch[index]
+            error = {
+                "type": "not_found",
+                "loc": ["product_id"],
+                "msg": "Product with given ID does not exist.",
+                "input": str(price.product_id),
+            }
+            result.rejected.append(RejectedRow("prices", line, [error]))
+        result.batches += 1
+        done += len(batch)
+        if progress:
+            progress("prices", done, len(valid_prices), result)
+
+    logger.info(
+        "Catalog imported",
+        extra={
+            "products_created": result.products_created,
+            "products_updated": result.products_updated,
+            "products_unchanged": result.products_unchanged,
+            "prices_created": result.prices_created,
+            "prices_existing": result.prices_existing,
+            "rejected": len(result.rejected),
+            "batches": result.batches,
+        },
+    )
+    return result
+
+
+def _print_progress(sheet: str, done: int, total: int, result: CatalogResult) -> None:
+    print(f"{sheet}: {done}/{total} rows, {result.batches} batches committed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", help="products CSV")
+    parser.add_argument("--prices", help="prices CSV")
+    parser.add_argument("--batch-size", type=int, default=CATALOG_BATCH_SIZE)
+    args = parser.parse_args()
+    if not args.products and not args.prices:
+        parser.error("at least one of --products or --prices is required")
+
+    products = read_csv(args.products) if args.products else []
+    prices = read_csv(args.prices) if args.prices else []
+    with SessionLocal() as db:
+        result = import_catalog(
+            db, products, prices, args.batch_size, progress=_print_progress
+        )
+
+    for row in result.rejected:
+        messages = "; ".join(error["msg"] for error in row.errors)
+        print(f"rejected {row.sheet} line {row.line}: {messages}", file=sys.stderr)
+    print(
+        f"products created={result.products_created} "
+        f"updated={result.products_updated} "
+        f"unchanged={result.products_unchanged} "
+        f"prices created={result.prices_created} "
+        f"existing={result.prices_existing} "
+        f"rejected={len(result.rejected)} batches={result.batches}"
+    )
+    if result.rejected:
+        sys.exit(1)
+
+
+trace_functions(globals())
+
+
+if __name__ == "__main__":
+    main()
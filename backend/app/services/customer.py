@@ -1,9 +1,81 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select
+from sqlalchemy import select, func, text, Row
 from app.models import Customer
+from app.core.pagination import Page, paginate
+from app.core.cache import TTLCache
+from app.core.search import (
+    AUTOCOMPLETE_CACHE_SIZE,
+    AUTOCOMPLETE_CACHE_TTL,
+    matches,
+    relevance,
+    prefix_key,
+    starts_with,
+)
+from app.schemas.customer import CustomerCreate
+from app.schemas.pagination import PaginationQuery
+from app.core.tracing import span, trace_functions
+import csv
+import io
 import uuid
 
+SEARCH_COLUMNS = [
+    Customer.customer_name,
+    Customer.customer_email,
+    Customer.customer_phone,
+]
+
+autocomplete_cache = TTLCache(AUTOCOMPLETE_CACHE_SIZE, AUTOCOMPLETE_CACHE_TTL)
+
+CREATE_IMPORT_TABLE = text(
+    """
+    CREATE TEMP TABLE customer_import (
+        row_number integer NOT NULL,
+        customer_name varchar(50) NOT NULL,
+        customer_email varchar(40) NOT NULL,
+        customer_phone varchar(15) NOT NULL
+    )
+    """
+)
+
+COPY_IMPORT_ROWS = "COPY customer_import FROM STDIN WITH (FORMAT csv)"
+
+# The CTE sees the table as it was before the INSERT, so rows the upsert
+# skipped still find their existing customer_id through the second join.
+# Unchanged rows are not updated, which leaves updated_at and the change feed
+# alone; sorting by email locks rows in the same order for concurrent imports.
+UPSERT_IMPORT_ROWS = text(
+    """
+    WITH upserted AS (
+        INSERT INTO customer AS c (customer_name, customer_email, customer_phone)
+        SELECT customer_name, customer_email, customer_phone
+        FROM customer_import
+        ORDER BY customer_email
+        ON CONFLICT (customer_email) DO UPDATE
+        SET customer_name = excluded.customer_name,
+            customer_phone = excluded.customer_phone
+        WHERE (c.customer_name, c.customer_phone)
+            IS DISTINCT FROM (excluded.customer_name, excluded.customer_phone)
+        RETURNING c.customer_id, c.customer_email, c.xmax = 0 AS inserted
+    )
+    SELECT
+        i.row_number,
+        coalesce(u.customer_id, c.customer_id) AS customer_id,
+        CASE
+            WHEN u.inserted THEN 'created'
+            WHEN u.inserted IS NOT NULL THEN 'updated'
+            ELSE 'unchanged'
+        END AS status
+    FROM customer_import i
+    LEFT JOIN upserted u ON u.customer_email = i.customer_email
+    LEFT JOIN customer c ON c.customer_email = i.customer_email
+        AND u.customer_id IS NULL
+    ORDER BY i.row_number
+    """
+)
+
+DROP_IMPORT_TABLE = text("DROP TABLE customer_import")
+
 
 class DuplicateEmailError(Exception):
     pass
@@ -25,6 +97,7 @@ def create_customer(
     try:
         db.add(customer)
         db.commit()
+        autocomplete_cache.clear()
         db.refresh(customer)
         return customer
     except IntegrityError:
@@ -32,6 +105,44 @@ def create_customer(
         raise DuplicateEmailError("Email already exists")
 
 
+def import_customers(db: Session, customers: dict[int, CustomerCreate]) -> list[Row]:
+    """Upserts customers by email in a constant number of statements.
+
+    Keys are the caller's row numbers and must carry distinct emails. Returns
+    (row_number, customer_id, status) per row, status being "created",
+    "updated" or "unchanged".
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row_number, customer in customers.items():
+        writer.writerow(
+            (
+                row_number,
+                customer.customer_name,
+                customer.customer_email,
+                customer.customer_phone,
+            )
+        )
+    buffer.seek(0)
+
+    db.execute(CREATE_IMPORT_TABLE)
+    # COPY goes through the driver cursor, so it is not seen by the engine's
+    # statement hooks; the span keeps it visible in traces.
+    with span("sql.copy customer_import"):
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(COPY_IMPORT_ROWS, buffer)
+        finally:
+            cursor.close()
+    rows = db.execute(UPSERT_IMPORT_ROWS).all()
+    db.execute(DROP_IMPORT_TABLE)
+    db.commit()
+
+    if any(row.status != "unchanged" for row in rows):
+        autocomplete_cache.clear()
+    return rows
+
+
 def get_customer(db: Session, customer_id: uuid.UUID) -> Customer | None:
     stmt = select(Customer).where(Customer.customer_id == customer_id)
     return db.execute(stmt).scalar_one_or_none()
@@ -42,9 +153,31 @@ def get_customer_by_email(db: Session, customer_email: str) -> Customer | None:
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_all_customers(db: Session) -> list[Customer]:
+def get_customer_fingerprint(db: Session, customer_id: uuid.UUID) -> tuple | None:
+    stmt = select(Customer.updated_at).where(Customer.customer_id == customer_id)
+    row = db.execute(stmt).one_or_none()
+    return tuple(row) if row else None
+
+
+def get_customers_fingerprint(db: Session) -> tuple:
+    stmt = select(
+        func.max(Customer.updated_at),
+        func.count(Customer.customer_id),
+        func.localtimestamp(),
+    )
+    return tuple(db.execute(stmt).one())
+
+
+def get_all_customers(db: Session, query: PaginationQuery) -> Page[Customer]:
     stmt = select(Customer)
-    return db.execute(stmt).scalars().all()
+    return paginate(
+        db,
+        stmt,
+        [Customer.customer_name, Customer.customer_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
 
 def update_customer(
@@ -70,6 +203,7 @@ def update_customer(
 
     try:
         db.commit()
+        autocomplete_cache.clear()
         db.refresh(customer)
         return customer
     except IntegrityError:
@@ -84,19 +218,44 @@ def delete_customer(db: Session, customer_id: uuid.UUID) -> uuid.UUID | None:
 
     db.delete(customer)
     db.commit()
+    autocomplete_cache.clear()
     return customer_id
 
 
-def search_customers_by_name(db: Session, name_query: str) -> list[Customer]:
-    stmt = select(Customer).where(Customer.customer_name.ilike(f"%{name_query}%"))
-    return db.execute(stmt).scalars().all()
+def search_customers(
+    db: Session, keyword: str, query: PaginationQuery
+) -> Page[Customer]:
+    stmt = select(Customer).where(matches(SEARCH_COLUMNS, keyword))
+    return paginate(
+        db,
+        stmt,
+        [
+            relevance(SEARCH_COLUMNS, keyword),
+            Customer.customer_name,
+            Customer.customer_id,
+        ],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
+
+
+def autocomplete_customers(db: Session, prefix: str, limit: int) -> list[Row]:
+    key = (prefix.lower(), limit)
+    cached = autocomplete_cache.get(key)
+    if cached is not None:
+        return cached
 
+    stmt = (
+        select(Customer.customer_id, Customer.customer_name)
+        .where(starts_with(Customer.customer_name, prefix))
+        .order_by(prefix_key(Customer.customer_name), Customer.customer_id)
+        .limit(limit)
+    )
+    rows = db.execute(stmt).all()
 
-def search_customers_by_email(db: Session, email_query: str) -> list[Customer]:
-    stmt = select(Customer).where(Customer.customer_email.ilike(f"%{email_query}%"))
-    return db.execute(stmt).scalars().all()
+    autocomplete_cache.set(key, rows)
+    return rows
 
 
-def search_customers_by_phone(db: Session, phone_query: str) -> list[Customer]:
-    stmt = select(Customer).where(Customer.customer_phone.ilike(f"%{phone_query}%"))
-    return db.execute(stmt).scalars().all()
+trace_functions(globals())
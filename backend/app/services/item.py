@@ -1,12 +1,18 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, exists, func
+from sqlalchemy import select, exists, func, delete, update, values, column
+from sqlalchemy import Integer
+from sqlalchemy.dialects.postgresql import UUID
 from app.models import Item, Product, Order, Price, Status
+from app.models import ArchivedOrder, ArchivedItem
 from app.schemas.item import ItemBase
+from app.schemas.pagination import PaginationQuery
+from app.core.pagination import Page, paginate
 from app.schemas.order import TopProductSummaryResponse
+from app.core.tracing import trace_functions
 import uuid
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from dataclasses import dataclass
+from collections import defaultdict
 from enum import Enum
 
 DAYS_RANGE = 6
@@ -28,48 +34,6 @@ class NotEnoughError(Exception):
     pass
 
 
-@dataclass
-class CreateItemResult:
-    items: list[Item]
-    total_price: Decimal
-
-
-def _create_item(
-    db: Session, order_id: uuid.UUID, product_id: uuid.UUID, item_quantity: int
-) -> Item:
-
-    item_price = get_price(db, product_id, date.today()).price_amount
-    item = Item(
-        order_id=order_id,
-        product_id=product_id,
-        item_quantity=item_quantity,
-        item_price=item_price,
-    )
-    db.add(item)
-    return item
-
-
-def _create_list_of_item(
-    db: Session, order_id: uuid.UUID, list_items: list[ItemBase]
-) -> CreateItemResult:
-
-    total_price = Decimal(0)
-    product_cache: dict[uuid.UUID, Product] = {}
-    created_items: list[Item] = []
-
-    for item in list_items:
-        if item.product_id not in product_cache:
-            product_cache[item.product_id] = get_product(db, item.product_id)
-        product = product_cache[item.product_id]
-        decrease_product_quantity(product, item.item_quantity)
-        new_item = _create_item(db, order_id, item.product_id, item.item_quantity)
-        total_price += new_item.item_price * new_item.item_quantity
-
-        created_items.append(new_item)
-
-    return CreateItemResult(items=created_items, total_price=total_price)
-
-
 def get_item(
     db: Session, order_item: uuid.UUID, product_item: uuid.UUID
 ) -> Item | None:
@@ -79,18 +43,38 @@ def get_item(
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_items_by_order(db: Session, order_id: uuid.UUID) -> list[Item]:
-    if not order_exists(db, order_id):
-        raise NotFoundError("Order with given ID does not exist.")
+def get_items_by_order(
+    db: Session, order_id: uuid.UUID
+) -> list[Item] | list[ArchivedItem]:
     stmt = (
         select(Item).options(joinedload(Item.product)).where(Item.order_id == order_id)
     )
-    return db.execute(stmt).scalars().all()
+    items = db.execute(stmt).scalars().all()
+    # Only an empty result needs the existence check to tell "no items" from 404.
+    if items or order_exists(db, order_id):
+        return items
 
-
-def get_all_items(db: Session) -> list[Item]:
-    stmt = select(Item)
-    return db.execute(stmt).scalars().all()
+    stmt = (
+        select(ArchivedItem)
+        .options(joinedload(ArchivedItem.product))
+        .where(ArchivedItem.order_id == order_id)
+    )
+    items = db.execute(stmt).scalars().all()
+    if not items and not order_exists(db, order_id, ArchivedOrder):
+        raise NotFoundError("Order with given ID does not exist.")
+    return items
+
+
+def get_all_items(db: Session, query: PaginationQuery) -> Page[Item]:
+    stmt = select(Item).options(joinedload(Item.product))
+    return paginate(
+        db,
+        stmt,
+        [Item.order_id, Item.product_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
 
 def update_list_of_item(
@@ -100,83 +84,134 @@ def update_list_of_item(
     order.ensure_items_can_be_modified()
 
     try:
-        _delete_list_of_item(db, order_id)
-
-        result = _create_list_of_item(db, order_id, list_items)
+        # A fixed number of statements whatever the list length: one price
+        # lookup, one delete, one stock update, one insert and one reload.
+        prices = get_current_prices(
+            db, [item.product_id for item in list_items], date.today()
+        )
 
-        order.order_total = result.total_price
+        stock_changes: defaultdict[uuid.UUID, int] = defaultdict(int)
+        for product_id, item_quantity in _delete_items(db, order_id):
+            stock_changes[product_id] += item_quantity
+        for item in list_items:
+            stock_changes[item.product_id] -= item.item_quantity
+        apply_stock_changes(db, stock_changes)
+
+        items = [
+            Item(
+                order_id=order_id,
+                product_id=item.product_id,
+                item_quantity=item.item_quantity,
+                item_price=prices[item.product_id],
+            )
+            for item in list_items
+        ]
+        db.add_all(items)
+        order.order_total = sum(
+            (item.item_price * item.item_quantity for item in items), Decimal(0)
+        )
         db.commit()
-        for item in result.items:
-            db.refresh(item)
 
-        return result.items
+        # Reloads the items expired by commit, with their products, in one
+        # round trip; the refreshed objects are the ones in `items`.
+        stmt = (
+            select(Item)
+            .options(joinedload(Item.product))
+            .where(Item.order_id == order_id)
+            .execution_options(populate_existing=True)
+        )
+        db.execute(stmt).scalars().all()
+        return items
     except Exception:
         db.rollback()
         raise
 
 
-def _delete_list_of_item(db: Session, order_id: uuid.UUID) -> None:
-
-    list_items = get_items_by_order(db, order_id)
-    product_cache: dict[uuid.UUID, Product] = {}
-
-    for item in list_items:
-        if item.product_id not in product_cache:
-            product_cache[item.product_id] = get_product(db, item.product_id)
-        product = product_cache[item.product_id]
-        increase_product_quantity(product, item.item_quantity)
-        db.delete(item)
-
-
-def get_product(db: Session, product_id: uuid.UUID) -> Product:
-    product = db.get(Product, product_id)
-    if not product:
-        raise NotFoundError("Product with given ID does not exist.")
-    return product
+def _delete_items(db: Session, order_id: uuid.UUID) -> list[tuple[uuid.UUID, int]]:
+    stmt = (
+        delete(Item)
+        .where(Item.order_id == order_id)
+        .returning(Item.product_id, Item.item_quantity)
+    )
+    return db.execute(stmt).all()
 
 
-def get_order(db: Session, order_id: uuid.UUID) -> Order:
-    order = db.get(Order, order_id)
+def get_order(db: Session, order_id: uuid.UUID) -> Order | ArchivedOrder:
+    # An archived order is closed, so callers get WrongStatus rather than 404.
+    stmt = (
+        select(Order)
+        .options(joinedload(Order.status))
+        .where(Order.order_id == order_id)
+    )
+    order = db.execute(stmt).scalar_one_or_none() or db.get(ArchivedOrder, order_id)
     if not order:
         raise NotFoundError("Order with given ID does not exist.")
     return order
 
 
-def order_exists(db: Session, order_id: uuid.UUID) -> bool:
-    stmt = select(exists().where(Order.order_id == order_id))
+def order_exists(
+    db: Session,
+    order_id: uuid.UUID,
+    model: type[Order | ArchivedOrder] = Order,
+) -> bool:
+    stmt = select(exists().where(model.order_id == order_id))
     return db.execute(stmt).scalar()
 
 
-def get_price(db: Session, product_id: uuid.UUID, price_date: date) -> Price:
-    stmt = (
-        select(Price)
-        .where(Price.product_id == product_id, Price.price_date <= price_date)
+def get_current_prices(
+    db: Session, product_ids: list[uuid.UUID], price_date: date
+) -> dict[uuid.UUID, Decimal]:
+    # Latest price on or before price_date for each product, in one query.
+    price_amount = (
+        select(Price.price_amount)
+        .where(Price.product_id == Product.product_id, Price.price_date <= price_date)
         .order_by(Price.price_date.desc())
         .limit(1)
+        .correlate(Product)
+        .scalar_subquery()
     )
-    price = db.execute(stmt).scalar_one_or_none()
-    if not price:
-        raise NotFoundError("Price for given product and date does not exist.")
-    return price
-
-
-def decrease_product_quantity(product: Product, amount: int) -> None:
-    if amount <= 0:
-        raise ValueError("Amount must be greater than 0")
-
-    if product.product_quantity < amount:
-        raise NotEnoughError(
-            f"Product with ID: {product.product_id} does not have sufficient quantity."
+    stmt = select(Product.product_id, price_amount).where(
+        Product.product_id.in_(set(product_ids))
+    )
+    prices = dict(db.execute(stmt).all())
+
+    for product_id in product_ids:
+        if product_id not in prices:
+            raise NotFoundError("Product with given ID does not exist.")
+        if prices[product_id] is None:
+            raise NotFoundError("Price for given product and date does not exist.")
+    return prices
+
+
+def apply_stock_changes(db: Session, changes: dict[uuid.UUID, int]) -> None:
+    # One UPDATE; a row that would go negative is filtered out by the WHERE,
+    # so an id missing from RETURNING means NotEnoughError.
+    changes = {product_id: delta for product_id, delta in changes.items() if delta}
+    if not changes:
+        return
+
+    deltas = values(
+        column("product_id", UUID(as_uuid=True)),
+        column("delta", Integer),
+        name="deltas",
+    ).data(list(changes.items()))
+    stmt = (
+        update(Product)
+        .where(
+            Product.product_id == deltas.c.product_id,
+            Product.product_quantity + deltas.c.delta >= 0,
         )
+        .values(product_quantity=Product.product_quantity + deltas.c.delta)
+        .returning(Product.product_id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = set(db.execute(stmt).scalars())
 
-    product.product_quantity -= amount
-
-
-def increase_product_quantity(product: Product, amount: int) -> None:
-    if amount <= 0:
-        raise ValueError("Amount must be greater than 0")
-
-    product.product_quantity += amount
+    for product_id in changes:
+        if product_id not in updated:
+            raise NotEnoughError(
+                f"Product with ID: {product_id} does not have sufficient quantity."
+            )
 
 
 def get_top_product_summary(db: Session) -> TopProductSummaryResponse:
@@ -204,3 +239,6 @@ def get_top_product_summary(db: Session) -> TopProductSummaryResponse:
     )
 
     return [{"key": row.key, "total": float(row.total)} for row in results]
+
+
+trace_functions(globals())
@@ -1,17 +1,21 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, exists, func, and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import select, exists, func, or_
 from sqlalchemy.sql import Select
-from app.models import Order, User, Customer, Status
+from app.models import Order, User, Customer, Status, Item, Product, Price
+from app.models import ArchivedOrder, ArchivedItem
 import uuid
 from datetime import datetime, timedelta
 from app.core.logger import logger
+from app.core.pagination import apply_keyset_pagination
 from app.schemas.order import (
     OrderFilterQuery,
+    OrderInclude,
     OrderPaginationResponse,
     TotalOrdersSummaryResponse,
     RevenueSummaryResponse,
     MonthlyRevenueSummaryResponse,
 )
+from app.core.tracing import trace_functions
 from dateutil.relativedelta import relativedelta
 from enum import Enum
 
@@ -31,6 +35,15 @@ class NotFoundError(Exception):
     pass
 
 
+# Hot tables first; closed orders moved by app.services.archive are only read
+# when the hot lookup misses.
+ORDER_SOURCES = ((Order, Item), (ArchivedOrder, ArchivedItem))
+
+
+def _order_sources(include_archived: bool) -> tuple:
+    return ORDER_SOURCES if include_archived else ORDER_SOURCES[:1]
+
+
 def create_order(db: Session, customer_id: uuid.UUID, user_id: uuid.UUID) -> Order:
 
     customer = get_customer(db, customer_id)
@@ -48,9 +61,117 @@ def create_order(db: Session, customer_id: uuid.UUID, user_id: uuid.UUID) -> Ord
     return order
 
 
-def get_order(db: Session, order_id: uuid.UUID) -> Order | None:
-    stmt = select(Order).where(Order.order_id == order_id)
-    return db.execute(stmt).scalar_one_or_none()
+def get_order(
+    db: Session,
+    order_id: uuid.UUID,
+    include: frozenset[str] = frozenset(),
+    include_archived: bool = True,
+) -> Order | ArchivedOrder | None:
+    for order_model, item_model in _order_sources(include_archived):
+        stmt = (
+            select(order_model)
+            .options(
+                joinedload(order_model.status),
+                joinedload(order_model.customer),
+                joinedload(order_model.user),
+            )
+            .where(order_model.order_id == order_id)
+        )
+
+        if OrderInclude.ITEMS in include:
+            loader = selectinload(order_model.items)
+            if OrderInclude.PRODUCTS in include:
+                loader = loader.joinedload(item_model.product)
+            if OrderInclude.PRICES in include:
+                loader = loader.joinedload(Product.prices)
+            stmt = stmt.options(loader)
+
+        order = db.execute(stmt).scalar_one_or_none()
+        if order is not None:
+            return order
+
+    return None
+
+
+def get_order_fingerprint(
+    db: Session, order_id: uuid.UUID, include: frozenset[str] = frozenset()
+) -> tuple | None:
+    for order_model, item_model in ORDER_SOURCES:
+        row = db.execute(
+            _order_fingerprint_statement(order_model, item_model, order_id, include)
+        ).one_or_none()
+        if row:
+            return tuple(row)
+
+    return None
+
+
+def _order_fingerprint_statement(
+    order_model: type[Order | ArchivedOrder],
+    item_model: type[Item | ArchivedItem],
+    order_id: uuid.UUID,
+    include: frozenset[str],
+) -> Select:
+    # Every row embedded in the detail response contributes its version.
+    columns = [
+        order_model.updated_at,
+        Status.updated_at,
+        Customer.updated_at,
+        User.updated_at,
+    ]
+
+    if OrderInclude.ITEMS in include:
+        items = (
+            select(item_model.product_id, item_model.updated_at)
+            .where(item_model.order_id == order_id)
+            .subquery()
+        )
+        columns += [
+            select(func.max(items.c.updated_at)).scalar_subquery(),
+            select(func.count()).select_from(items).scalar_subquery(),
+        ]
+        if OrderInclude.PRODUCTS in include:
+            columns.append(
+                select(func.max(Product.updated_at))
+                .join(items, items.c.product_id == Product.product_id)
+                .scalar_subquery()
+            )
+        if OrderInclude.PRICES in include:
+            prices = (
+                select(Price.updated_at)
+                .join(items, items.c.product_id == Price.product_id)
+                .subquery()
+            )
+            columns += [
+                select(func.max(prices.c.updated_at)).scalar_subquery(),
+                select(func.count()).select_from(prices).scalar_subquery(),
+            ]
+
+    return (
+        select(*columns, func.localtimestamp())
+        .select_from(order_model)
+        .join(order_model.status)
+        .join(order_model.customer)
+        .join(order_model.user)
+        .where(order_model.order_id == order_id)
+    )
+
+
+def get_orders_fingerprint(db: Session, query: OrderFilterQuery) -> tuple:
+    # (max updated_at, filtered count, status/customer/user maxima, now);
+    # callers reuse the count as get_orders' total_count.
+    stmt = select(func.max(Order.updated_at), func.count(Order.order_id))
+    stmt = _apply_filters(stmt, db, query)
+    # Embedded status, customer and user rows: the newest version of each
+    # table is one index probe on the *_updated_at_id indexes.
+    stmt = stmt.add_columns(
+        *[
+            select(func.max(model.updated_at)).correlate(None).scalar_subquery()
+            for model in (Status, Customer, User)
+        ],
+        func.localtimestamp(),
+    )
+    return tuple(db.execute(stmt).one())
 
 
 def _apply_filters(stmt: Select, db: Session, query: OrderFilterQuery) -> Select:
@@ -61,13 +182,21 @@ def _apply_filters(stmt: Select, db: Session, query: OrderFilterQuery) -> Select
         stmt = stmt.where(Order.customer_id == query.customer_id)
 
     if query.status_code:
-        status = get_status_by_code(db, query.status_code)
-        stmt = stmt.where(Order.status_id == status.status_id)
+        # Inlined rather than looked up: every filtered statement stays one
+        # round trip. Handlers validate the code once via get_status_by_code.
+        status_id = (
+            select(Status.status_id)
+            .where(Status.status_code == query.status_code)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(Order.status_id == status_id)
 
     if query.order_date:
+        # Half-open range on the bare partition key so the planner prunes
+        # orders down to the one monthly partition holding that day.
         start = datetime.combine(query.order_date, datetime.min.time())
-        end = datetime.combine(query.order_date, datetime.max.time())
-        stmt = stmt.where(Order.order_date >= start, Order.order_date <= end)
+        end = start + timedelta(days=1)
+        stmt = stmt.where(Order.order_date >= start, Order.order_date < end)
 
     if query.search:
         stmt = (
@@ -101,26 +230,13 @@ def _apply_cursor_pagination(
     stmt: Select, query: OrderFilterQuery, is_prev: bool
 ) -> Select:
     if query.cursor_date:
-        if is_prev:
-            stmt = stmt.where(
-                or_(
-                    Order.order_date > query.cursor_date,
-                    and_(
-                        Order.order_date == query.cursor_date,
-                        Order.order_id > query.cursor_id,
-                    ),
-                )
-            ).order_by(Order.order_date.asc(), Order.order_id.asc())
-        else:
-            stmt = stmt.where(
-                or_(
-                    Order.order_date < query.cursor_date,
-                    and_(
-                        Order.order_date == query.cursor_date,
-                        Order.order_id < query.cursor_id,
-                    ),
-                )
-            ).order_by(Order.order_date.desc(), Order.order_id.desc())
+        stmt = apply_keyset_pagination(
+            stmt,
+            [Order.order_date, Order.order_id],
+            [query.cursor_date, query.cursor_id],
+            is_prev,
+            descending=True,
+        )
 
     return stmt
 
@@ -155,6 +271,7 @@ LIMIT = 20
 def get_orders(
     db: Session,
     query: OrderFilterQuery,
+    total_count: int | None = None,
 ) -> OrderPaginationResponse:
 
     limit = LIMIT
@@ -200,7 +317,8 @@ def get_orders(
             next_cursor_date = orders[-1].order_date
             next_cursor_id = orders[-1].order_id
 
-    total_count = _count_orders(db, query)
+    if total_count is None:
+        total_count = _count_orders(db, query)
     total_pages = (total_count + limit - 1) // limit
 
     order_pagination_response = OrderPaginationResponse(
@@ -220,7 +338,7 @@ def get_orders(
 def update_order_status(
     db: Session, order_id: uuid.UUID, status_code: str
 ) -> Order | None:
-    order = get_order(db, order_id)
+    order = get_order(db, order_id, include_archived=False)
     if not order:
         return None
 
@@ -247,7 +365,7 @@ def update_order_status(
 
 
 def delete_order(db: Session, order_id: uuid.UUID) -> uuid.UUID | None:
-    order = get_order(db, order_id)
+    order = get_order(db, order_id, include_archived=False)
     if not order:
         return None
 
@@ -306,7 +424,7 @@ def customer_exists(db: Session, customer_id: uuid.UUID) -> bool:
 def update_order_attachment_url(
     db: Session, order_id: uuid.UUID, attachment_url: str
 ) -> Order | None:
-    order = get_order(db, order_id)
+    order = get_order(db, order_id, include_archived=False)
     if not order:
         return None
 
@@ -409,3 +527,6 @@ def get_total_revenue_in_12_months(db: Session) -> list[MonthlyRevenueSummaryRes
         )
 
     return final_result
+
+
+trace_functions(globals())
@@ -0,0 +1,241 @@
+import csv
+import io
+import json
+import os
+import uuid
+from datetime import datetime, time
+from itertools import groupby
+from typing import Iterable, Iterator
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from app.core.logger import logger
+from app.models import Order, User, Customer, Status, Item, Product
+from app.s3_client import (
+    MULTIPART_PART_SIZE,
+    MultipartUpload,
+    get_json_object,
+    put_json_object,
+)
+from app.schemas.order_export import (
+    ExportFormat,
+    ExportStatus,
+    OrderExportFilter,
+    OrderExportManifest,
+)
+from app.services.order import _apply_filters
+from app.core.tracing import trace_functions
+
+# Rows fetched per round trip from the server-side cursor.
+EXPORT_BATCH_SIZE = int(os.getenv("ORDER_EXPORT_BATCH_SIZE", "2000"))
+EXPORT_PREFIX = "exports/orders"
+# Encoded CSV bytes handed to the upload at a time; a quarter part keeps the
+# CSV buffer small next to the part MultipartUpload is assembling.
+CSV_FLUSH_BYTES = MULTIPART_PART_SIZE // 4
+
+CONTENT_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+CSV_COLUMNS = [
+    "order_id",
+    "order_date",
+    "status_code",
+    "order_total",
+    "customer_id",
+    "customer_name",
+    "customer_email",
+    "user_id",
+    "user_name",
+    "product_id",
+    "product_name",
+    "item_quantity",
+    "item_price",
+]
+
+ORDER_COLUMNS = CSV_COLUMNS[:9]
+ITEM_COLUMNS = CSV_COLUMNS[9:]
+
+
+def manifest_key(export_id: uuid.UUID) -> str:
+    return f"{EXPORT_PREFIX}/{export_id}.json"
+
+
+def export_key(export_id: uuid.UUID, export_format: ExportFormat) -> str:
+    return f"{EXPORT_PREFIX}/{export_id}.{export_format.value}"
+
+
+def _export_statement(db: Session, filters: OrderExportFilter) -> Select:
+    # Filters select order ids only, so the search joins in _apply_filters
+    # never collide with the joins of the export itself.
+    order_ids = _apply_filters(select(Order.order_id), db, filters)
+    if filters.date_from:
+        order_ids = order_ids.where(
+            Order.order_date >= datetime.combine(filters.date_from, time.min)
+        )
+    if filters.date_to:
+        order_ids = order_ids.where(
+            Order.order_date <= datetime.combine(filters.date_to, time.max)
+        )
+
+    return (
+        select(
+            Order.order_id,
+            Order.order_date,
+            Status.status_code,
+            Order.order_total,
+            Customer.customer_id,
+            Customer.customer_name,
+            Customer.customer_email,
+            User.user_id,
+            User.user_name,
+            Item.product_id,
+            Product.product_name,
+            Item.item_quantity,
+            Item.item_price,
+        )
+        .select_from(Order)
+        .join(Order.status)
+        .join(Order.customer)
+        .join(Order.user)
+        .outerjoin(Item, Item.order_id == Order.order_id)
+        .outerjoin(Product, Product.product_id == Item.product_id)
+        .where(Order.order_id.in_(order_ids))
+        .order_by(Order.order_date, Order.order_id, Item.product_id)
+    )
+
+
+def stream_export_rows(db: Session, filters: OrderExportFilter) -> Iterator[Row]:
+    stmt = _export_statement(db, filters).execution_options(
+        yield_per=EXPORT_BATCH_SIZE
+    )
+    yield from db.execute(stmt)
+
+
+def _json_value(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # UUID and Decimal; strings keep money values exact.
+    return str(value)
+
+
+def write_csv(rows: Iterable[Row], out: MultipartUpload) -> tuple[int, int]:
+    buffer = io.BytesIO()
+    writer = csv.writer(
+        io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    )
+    writer.writerow(CSV_COLUMNS)
+
+    order_count = item_count = 0
+    last_order_id = None
+    for row in rows:
+        writer.writerow(row)
+        if row.order_id != last_order_id:
+            order_count += 1
+            last_order_id = row.order_id
+        if row.product_id is not None:
+            item_count += 1
+
+        if buffer.tell() >= CSV_FLUSH_BYTES:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+    out.write(buffer.getvalue())
+    return order_count, item_count
+
+
+def write_ndjson(rows: Iterable[Row], out: MultipartUpload) -> tuple[int, int]:
+    order_count = item_count = 0
+    lines = []
+    # Rows arrive ordered by order_id, so grouping only holds one order at a time.
+    for _, order_rows in groupby(rows, key=lambda row: row.order_id):
+        order_rows = list(order_rows)
+        head = order_rows[0]
+        document = {
+            column: _json_value(getattr(head, column)) for column in ORDER_COLUMNS
+        }
+        document["items"] = [
+            {column: _json_value(getattr(row, column)) for column in ITEM_COLUMNS}
+            for row in order_rows
+            if row.product_id is not None
+        ]
+        lines.append(json.dumps(document))
+        order_count += 1
+        item_count += len(document["items"])
+
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            out.write(("\n".join(lines) + "\n").encode())
+            lines.clear()
+
+    if lines:
+        out.write(("\n".join(lines) + "\n").encode())
+    return order_count, item_count
+
+
+WRITERS = {
+    ExportFormat.CSV: write_csv,
+    ExportFormat.NDJSON: write_ndjson,
+}
+
+
+def save_export(manifest: OrderExportManifest) -> None:
+    put_json_object(
+        manifest_key(manifest.export_id),
+        manifest.model_dump(mode="json", by_alias=True),
+    )
+
+
+def get_export(export_id: uuid.UUID) -> OrderExportManifest | None:
+    data = get_json_object(manifest_key(export_id))
+    if data is None:
+        return None
+    return OrderExportManifest.model_validate(data)
+
+
+def create_export(
+    export_format: ExportFormat, filters: OrderExportFilter
+) -> OrderExportManifest:
+    export_id = uuid.uuid4()
+    manifest = OrderExportManifest(
+        export_id=export_id,
+        status=ExportStatus.PENDING,
+        format=export_format,
+        filters=filters,
+        key=export_key(export_id, export_format),
+        created_at=datetime.now(),
+    )
+    save_export(manifest)
+    return manifest
+
+
+def run_export(db: Session, manifest: OrderExportManifest) -> OrderExportManifest:
+    manifest.status = ExportStatus.RUNNING
+    save_export(manifest)
+
+    try:
+        with MultipartUpload(manifest.key, CONTENT_TYPES[manifest.format]) as out:
+            rows = stream_export_rows(db, manifest.filters)
+            order_count, item_count = WRITERS[manifest.format](rows, out)
+    except Exception as e:
+        logger.exception("Order export failed", extra={"export_id": str(manifest.export_id)})
+        manifest.status = ExportStatus.FAILED
+        manifest.error = str(e)
+    else:
+        manifest.status = ExportStatus.COMPLETED
+        manifest.order_count = order_count
+        manifest.item_count = item_count
+        manifest.size_bytes = out.bytes_written
+    finally:
+        db.rollback()
+
+    manifest.completed_at = datetime.now()
+    save_export(manifest)
+    return manifest
+
+
+trace_functions(globals())
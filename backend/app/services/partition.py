@@ -0,0 +1,166 @@
+"""Monthly partition maintenance for the orders table.
+
+Creates the partitions for the current month and the next few months ahead
+of time; anything outside them lands in orders_default. Partitions aged past
+the retention window are detached once app.services.archive has emptied
+them, so no order disappears from get_order; one still holding orders is
+kept and reported.
+
+    python -m app.services.partition --months-ahead 3 --retain-months 24
+"""
+
+import argparse
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from app.core.logger import logger
+from app.database import SessionLocal
+from app.core.tracing import trace_functions
+
+PARTITIONED_TABLE = "orders"
+PARTITION_NAME = re.compile(r"^orders_(\d{4})_(\d{2})$")
+
+PARTITION_MONTHS_AHEAD = int(os.getenv("ORDERS_PARTITION_MONTHS_AHEAD", "3"))
+# 0 keeps every partition attached.
+PARTITION_RETAIN_MONTHS = int(os.getenv("ORDERS_PARTITION_RETAIN_MONTHS", "0"))
+
+LIST_PARTITIONS = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = :table
+    ORDER BY child.relname
+    """
+)
+
+CREATE_PARTITION = text("SELECT create_orders_partition(:month)")
+
+# DETACH takes an ACCESS EXCLUSIVE lock on orders, and CONCURRENTLY is not
+# allowed next to a default partition. Give up quickly instead of queueing
+# every order query behind it; the next daily run retries.
+DETACH_LOCK_TIMEOUT = text("SET LOCAL lock_timeout = '5s'")
+
+
+@dataclass
+class MaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    # Past retention but still holding orders, or locked by other work.
+    kept: list[str] = field(default_factory=list)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITIONED_TABLE}_{month:%Y_%m}"
+
+
+def partition_month(name: str) -> date | None:
+    match = PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def list_partitions(db: Session) -> list[str]:
+    return list(db.execute(LIST_PARTITIONS, {"table": PARTITIONED_TABLE}).scalars())
+
+
+def months_to_create(today: date, months_ahead: int) -> list[date]:
+    current = month_start(today)
+    return [current + relativedelta(months=i) for i in range(months_ahead + 1)]
+
+
+def partitions_to_detach(
+    partitions: list[str], today: date, retain_months: int
+) -> list[str]:
+    if retain_months <= 0:
+        return []
+
+    cutoff = month_start(today) - relativedelta(months=retain_months)
+    return [
+        name
+        for name in partitions
+        if (month := partition_month(name)) is not None and month < cutoff
+    ]
+
+
+def run_maintenance(
+    db: Session,
+    today: date | None = None,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    retain_months: int = PARTITION_RETAIN_MONTHS,
+) -> MaintenanceResult:
+    today = today or date.today()
+    result = MaintenanceResult()
+
+    existing = set(list_partitions(db))
+    for month in months_to_create(today, months_ahead):
+        if partition_name(month) not in existing:
+            result.created.append(
+                db.execute(CREATE_PARTITION, {"month": month}).scalar_one()
+            )
+
+    db.commit()
+
+    for name in partitions_to_detach(sorted(existing), today, retain_months):
+        if detach_partition(db, name):
+            result.detached.append(name)
+        else:
+            result.kept.append(name)
+
+    logger.info(
+        "Orders partitions maintained",
+        extra={
+            "partitions_created": result.created,
+            "partitions_detached": result.detached,
+            "partitions_kept": result.kept,
+        },
+    )
+    return result
+
+
+def detach_partition(db: Session, name: str) -> bool:
+    # Names come from pg_class and match PARTITION_NAME, so quoting is safe.
+    try:
+        db.execute(DETACH_LOCK_TIMEOUT)
+        # Blocks new rows while checking that archival has emptied it.
+        db.execute(text(f'LOCK TABLE "{name}" IN SHARE MODE'))
+        if db.execute(text(f'SELECT EXISTS (SELECT 1 FROM "{name}")')).scalar_one():
+            db.rollback()
+            return False
+        db.execute(text(f'ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION "{name}"'))
+        db.commit()
+    except OperationalError:
+        db.rollback()
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--months-ahead", type=int, default=PARTITION_MONTHS_AHEAD)
+    parser.add_argument("--retain-months", type=int, default=PARTITION_RETAIN_MONTHS)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = run_maintenance(
+            db, months_ahead=args.months_ahead, retain_months=args.retain_months
+        )
+    print(f"created={result.created} detached={result.detached} kept={result.kept}")
+
+
+trace_functions(globals())
+
+
+if __name__ == "__main__":
+    main()
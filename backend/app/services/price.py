@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select, exists
 from app.models import Price, Product
+from app.core.pagination import Page, paginate
+from app.schemas.pagination import PaginationQuery
+from app.core.tracing import trace_functions
 import uuid
 from datetime import date
 from decimal import Decimal
@@ -41,9 +44,17 @@ def get_prices_by_product(db: Session, product_id: uuid.UUID) -> list[Price]:
     return db.execute(stmt).scalars().all()
 
 
-def get_all_prices(db: Session) -> list[Price]:
+def get_all_prices(db: Session, query: PaginationQuery) -> Page[Price]:
     stmt = select(Price)
-    return db.execute(stmt).scalars().all()
+    return paginate(
+        db,
+        stmt,
+        [Price.price_date, Price.price_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+        descending=True,
+    )
 
 
 def update_price(
@@ -88,3 +99,6 @@ def delete_price(db: Session, price_id: uuid.UUID) -> uuid.UUID | None:
 def product_exists(db: Session, product_id: uuid.UUID) -> bool:
     stmt = select(exists().where(Product.product_id == product_id))
     return db.execute(stmt).scalar_one()
+
+
+trace_functions(globals())
@@ -1,8 +1,24 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select
-from app.models import Product
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, func, Row
+from app.models import Product, Price
+from app.core.pagination import Page, paginate
+from app.core.cache import TTLCache
+from app.core.search import (
+    AUTOCOMPLETE_CACHE_SIZE,
+    AUTOCOMPLETE_CACHE_TTL,
+    matches,
+    relevance,
+    prefix_key,
+    starts_with,
+)
+from app.schemas.pagination import PaginationQuery
+from app.core.tracing import trace_functions
 import uuid
 
+SEARCH_COLUMNS = [Product.product_name]
+
+autocomplete_cache = TTLCache(AUTOCOMPLETE_CACHE_SIZE, AUTOCOMPLETE_CACHE_TTL)
+
 
 def create_product(
     db: Session, product_name: str, product_description: str, product_quantity: int
@@ -15,6 +31,7 @@ def create_product(
 
     db.add(product)
     db.commit()
+    autocomplete_cache.clear()
     db.refresh(product)
     return product
 
@@ -24,9 +41,44 @@ def get_product(db: Session, product_id: uuid.UUID) -> Product | None:
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_all_products(db: Session) -> list[Product]:
-    stmt = select(Product)
-    return db.execute(stmt).scalars().all()
+def get_product_fingerprint(db: Session, product_id: uuid.UUID) -> tuple | None:
+    # Prices are embedded in the response but do not touch product.updated_at.
+    stmt = (
+        select(
+            Product.updated_at,
+            func.max(Price.updated_at),
+            func.count(Price.price_id),
+            func.localtimestamp(),
+        )
+        .outerjoin(Price, Price.product_id == Product.product_id)
+        .where(Product.product_id == product_id)
+        .group_by(Product.product_id)
+    )
+    row = db.execute(stmt).one_or_none()
+    return tuple(row) if row else None
+
+
+def get_products_fingerprint(db: Session) -> tuple:
+    stmt = select(
+        func.max(Product.updated_at),
+        func.count(Product.product_id),
+        select(func.max(Price.updated_at)).scalar_subquery(),
+        select(func.count(Price.price_id)).scalar_subquery(),
+        func.localtimestamp(),
+    )
+    return tuple(db.execute(stmt).one())
+
+
+def get_all_products(db: Session, query: PaginationQuery) -> Page[Product]:
+    stmt = select(Product).options(selectinload(Product.prices))
+    return paginate(
+        db,
+        stmt,
+        [Product.product_name, Product.product_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
 
 def update_product(
@@ -49,6 +101,7 @@ def update_product(
 
     db.add(product)
     db.commit()
+    autocomplete_cache.clear()
     db.refresh(product)
     return product
 
@@ -60,20 +113,48 @@ def delete_product(db: Session, product_id: uuid.UUID) -> uuid.UUID | None:
 
     db.delete(product)
     db.commit()
+    autocomplete_cache.clear()
     return product_id
 
 
-
-def search_products_by_name(db: Session, name_query: str) -> list[Product]:
+def search_products(db: Session, keyword: str, query: PaginationQuery) -> Page[Product]:
     stmt = (
         select(Product)
-        .where(Product.product_name.ilike(f"%{name_query}%"))
-        .options(joinedload(Product.prices))
+        .where(matches(SEARCH_COLUMNS, keyword))
+        .options(selectinload(Product.prices))
     )
 
-    products = db.execute(stmt).unique().scalars().all()
+    page = paginate(
+        db,
+        stmt,
+        [relevance(SEARCH_COLUMNS, keyword), Product.product_name, Product.product_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
-    for p in products:
+    for p in page.items:
         p.prices = p.prices[:1]
 
-    return products
+    return page
+
+
+def autocomplete_products(db: Session, prefix: str, limit: int) -> list[Row]:
+    key = (prefix.lower(), limit)
+    cached = autocomplete_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stmt = (
+        select(Product.product_id, Product.product_name)
+        .where(starts_with(Product.product_name, prefix))
+        .order_by(prefix_key(Product.product_name), Product.product_id)
+        .limit(limit)
+    )
+    rows = db.execute(stmt).all()
+
+    autocomplete_cache.set(key, rows)
+    return rows
+
+
+trace_functions(globals())
@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.models import Status
+from app.core.pagination import Page, paginate
+from app.schemas.pagination import PaginationQuery
+from app.core.tracing import trace_functions
 import uuid
 
 
@@ -14,6 +17,16 @@ def get_status_by_code(db: Session, status_code: str) -> Status | None:
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_all_statuses(db: Session) -> list[Status]:
+def get_all_statuses(db: Session, query: PaginationQuery) -> Page[Status]:
     stmt = select(Status)
-    return db.execute(stmt).scalars().all()
+    return paginate(
+        db,
+        stmt,
+        [Status.status_code, Status.status_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
+
+
+trace_functions(globals())
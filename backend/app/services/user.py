@@ -2,9 +2,25 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
 from app.models import User
+from app.core.pagination import Page, paginate
+from app.core.search import matches, relevance
+from app.schemas.pagination import PaginationQuery
+from app.schemas.user import UserCreate
+from app.core.tracing import trace_functions
+import os
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from passlib.context import CryptContext
 
+SEARCH_COLUMNS = [
+    User.user_name,
+    User.user_email,
+    User.user_phone,
+    User.user_account,
+]
+
 
 class DuplicateEmailError(Exception):
     pass
@@ -14,15 +30,102 @@ class DuplicateAccountError(Exception):
     pass
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+class HashingBusyError(Exception):
+    pass
+
+
+# Hashes below the current cost are upgraded on the next successful login.
+BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+
+
+# bcrypt releases the GIL, so more workers only help when the function has
+# more than one vCPU (Lambda: one per 1,769 MB; os.cpu_count() overstates
+# smaller sizes). At most the running hashes plus PASSWORD_HASH_QUEUE waiting
+# ones are admitted; callers beyond that wait up to PASSWORD_HASH_WAIT_SECONDS
+# for slots and are then refused, so a burst cannot pin the container.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "1"))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "64"))
+PASSWORD_HASH_WAIT_SECONDS = float(os.getenv("PASSWORD_HASH_WAIT_SECONDS", "5"))
+
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+_hash_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+            )
+        return _hash_executor
+
+
+def _submit_all(fn, arguments: list[tuple]) -> list[Future]:
+    deadline = time.monotonic() + PASSWORD_HASH_WAIT_SECONDS
+    acquired = 0
+    try:
+        for _ in arguments:
+            timeout = max(deadline - time.monotonic(), 0)
+            if not _hash_slots.acquire(timeout=timeout):
+                raise HashingBusyError("Password hashing is at capacity, retry later")
+            acquired += 1
+    except HashingBusyError:
+        for _ in range(acquired):
+            _hash_slots.release()
+        raise
+
+    futures = []
+    for args in arguments:
+        future = _executor().submit(fn, *args)
+        future.add_done_callback(lambda _: _hash_slots.release())
+        futures.append(future)
+    return futures
+
+
+def _run_hashing(fn, *args):
+    return _submit_all(fn, [args])[0].result()
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _run_hashing(pwd_context.hash, password)
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hashes a batch in parallel on the bounded pool, in input order."""
+    futures = _submit_all(pwd_context.hash, [(password,) for password in passwords])
+    return [future.result() for future in futures]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _run_hashing(pwd_context.verify, plain_password, hashed_password)
+
+
+def authenticate_user(db: Session, user_account: str, password: str) -> User | None:
+    user = get_user_by_account(db, user_account)
+    if not user:
+        # Same bcrypt cost as a real check, so timing does not reveal accounts.
+        _run_hashing(pwd_context.dummy_verify)
+        return None
+
+    valid, new_hash = _run_hashing(
+        pwd_context.verify_and_update, password, user.user_password
+    )
+    if not valid:
+        return None
+
+    if new_hash:
+        user.user_password = new_hash
+        db.commit()
+    return user
 
 
 def create_user(
@@ -48,22 +151,73 @@ def create_user(
     )
 
     db.add(user)
+    _commit(db)
+    db.refresh(user)
+    return user
+
+
+def create_users(db: Session, users: list[UserCreate]) -> list[User]:
+    """Creates every user or none; passwords are hashed in parallel."""
+    accounts = [user.user_account for user in users]
+    emails = [user.user_email for user in users]
+    if len(set(accounts)) != len(accounts):
+        raise DuplicateAccountError("Account is repeated in the request")
+    if len(set(emails)) != len(emails):
+        raise DuplicateEmailError("Email is repeated in the request")
+
+    stmt = select(User.user_account).where(User.user_account.in_(accounts))
+    if existing := db.execute(stmt).scalars().first():
+        raise DuplicateAccountError(f"Account already exists: {existing}")
+    stmt = select(User.user_email).where(User.user_email.in_(emails))
+    if existing := db.execute(stmt).scalars().first():
+        raise DuplicateEmailError(f"Email already exists: {existing}")
+
+    hashes = hash_passwords([user.user_password for user in users])
+    created = [
+        User(
+            user_name=user.user_name,
+            user_email=user.user_email,
+            user_phone=user.user_phone,
+            user_account=user.user_account,
+            user_password=password_hash,
+        )
+        for user, password_hash in zip(users, hashes)
+    ]
+    db.add_all(created)
+    try:
+        # Read the server-generated ids before the commit expires the rows;
+        # afterwards each user.user_id would load its row on its own.
+        db.flush()
+    except IntegrityError as e:
+        _raise_duplicate(db, e)
+    user_ids = [user.user_id for user in created]
+    _commit(db)
+
+    # One reload for all the expired rows instead of a refresh per user.
+    stmt = select(User).where(User.user_id.in_(user_ids))
+    db.execute(stmt).scalars().all()
+    return created
+
+
+def _commit(db: Session) -> None:
     try:
         db.commit()
     except IntegrityError as e:
-        db.rollback()
+        _raise_duplicate(db, e)
 
-        error_msg = str(e.orig)
 
-        if "users_user_account_key" in error_msg:
-            raise DuplicateAccountError("Account already exists")
+def _raise_duplicate(db: Session, e: IntegrityError) -> None:
+    db.rollback()
 
-        if "users_user_email_key" in error_msg:
-            raise DuplicateEmailError("Email already exists")
+    error_msg = str(e.orig)
 
-        raise
-    db.refresh(user)
-    return user
+    if "users_user_account_key" in error_msg:
+        raise DuplicateAccountError("Account already exists")
+
+    if "users_user_email_key" in error_msg:
+        raise DuplicateEmailError("Email already exists")
+
+    raise e
 
 
 def get_user(db: Session, user_id: uuid.UUID) -> User | None:
@@ -81,9 +235,16 @@ def get_user_by_email(db: Session, user_email: str) -> User | None:
     return db.execute(stmt).scalar_one_or_none()
 
 
-def get_all_users(db: Session) -> list[User]:
+def get_all_users(db: Session, query: PaginationQuery) -> Page[User]:
     stmt = select(User)
-    return db.execute(stmt).scalars().all()
+    return paginate(
+        db,
+        stmt,
+        [User.user_name, User.user_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
 
 def update_user_info(
@@ -108,20 +269,7 @@ def update_user_info(
         user.user_phone = user_phone
 
     db.add(user)
-    try:
-        db.commit()
-    except IntegrityError as e:
-        db.rollback()
-
-        error_msg = str(e.orig)
-
-        if "users_user_account_key" in error_msg:
-            raise DuplicateAccountError("Account already exists")
-
-        if "users_user_email_key" in error_msg:
-            raise DuplicateEmailError("Email already exists")
-
-        raise
+    _commit(db)
     db.refresh(user)
     return user
 
@@ -146,21 +294,16 @@ def delete_user(db: Session, user_id: uuid.UUID) -> uuid.UUID | None:
     return user_id
 
 
-def search_users_by_account(db: Session, account_query: str) -> list[User]:
-    stmt = select(User).where(User.user_account.ilike(f"%{account_query}%"))
-    return db.execute(stmt).scalars().all()
-
-
-def search_users_by_name(db: Session, name_query: str) -> list[User]:
-    stmt = select(User).where(User.user_name.ilike(f"%{name_query}%"))
-    return db.execute(stmt).scalars().all()
-
-
-def search_users_by_email(db: Session, email_query: str) -> list[User]:
-    stmt = select(User).where(User.user_email.ilike(f"%{email_query}%"))
-    return db.execute(stmt).scalars().all()
+def search_users(db: Session, keyword: str, query: PaginationQuery) -> Page[User]:
+    stmt = select(User).where(matches(SEARCH_COLUMNS, keyword))
+    return paginate(
+        db,
+        stmt,
+        [relevance(SEARCH_COLUMNS, keyword), User.user_name, User.user_id],
+        query.cursor,
+        query.direction,
+        query.limit,
+    )
 
 
-def search_users_by_phone(db: Session, phone_query: str) -> list[User]:
-    stmt = select(User).where(User.user_phone.ilike(f"%{phone_query}%"))
-    return db.execute(stmt).scalars().all()
+trace_functions(globals())
@@ -0,0 +1,98 @@
+"""Autocomplete latency against the 10 ms target.
+
+Seeds synthetic customers and products inside a rolled-back transaction and
+times /customers/autocomplete and /products/autocomplete service calls for
+1-4 character prefixes, once straight from the database and once through the
+warm in-container cache. Requires the usual DB_* environment variables.
+
+    python -m benchmarks.autocomplete_benchmark --customers 1000000 --products 50000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.core.cache import TTLCache
+from app.database import SessionLocal
+from app.services import customer as customer_service
+from app.services import product as product_service
+from benchmarks.search_benchmark import SEED_CUSTOMERS
+
+TARGET_MS = 10.0
+
+SEED_PRODUCTS = text(
+    """
+    INSERT INTO product (product_name, product_description, product_quantity)
+    SELECT
+        (ARRAY['Laptop','Smartphone','Headphones','Smartwatch','Tablet','Camera','Printer','Monitor'])[1 + i % 8]
+            || ' ' || i,
+        NULL,
+        100
+    FROM generate_series(1, :size) AS i
+    """
+)
+
+PREFIXES = ["s", "sa", "sar", "sara", "mon", "lap", "zzz"]
+
+
+def _percentile(timings: list[float], pct: float) -> float:
+    timings = sorted(timings)
+    return timings[max(0, int(len(timings) * pct) - 1)]
+
+
+def _measure(label: str, fn, repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    p99 = _percentile(timings, 0.99)
+    verdict = "ok" if p99 <= TARGET_MS else "SLOW"
+    print(
+        f"  {label:<32} p50={statistics.median(timings):7.3f}ms "
+        f"p95={_percentile(timings, 0.95):7.3f}ms p99={p99:7.3f}ms {verdict}"
+    )
+
+
+def run(customers: int, products: int, repeat: int, limit: int) -> None:
+    with SessionLocal() as db:
+        db.execute(SEED_CUSTOMERS, {"size": customers})
+        db.execute(SEED_PRODUCTS, {"size": products})
+        db.execute(text("ANALYZE customer"))
+        db.execute(text("ANALYZE product"))
+        print(f"customers={customers} products={products} limit={limit}")
+
+        for service, fn in [
+            (customer_service, customer_service.autocomplete_customers),
+            (product_service, product_service.autocomplete_products),
+        ]:
+            name = fn.__name__
+            for prefix in PREFIXES:
+                service.autocomplete_cache = TTLCache(0, 0)
+                _measure(f"{name}/db/{prefix}", lambda: fn(db, prefix, limit), repeat)
+
+                service.autocomplete_cache = TTLCache(512, 60)
+                fn(db, prefix, limit)
+                _measure(
+                    f"{name}/cache/{prefix}", lambda: fn(db, prefix, limit), repeat
+                )
+
+        db.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--customers", type=int, default=1_000_000)
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    run(args.customers, args.products, args.repeat, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""CPU cost versus bytes saved when compressing typical list pages.
+
+Builds synthetic GET /orders, /items and /prices pages in the exact JSON
+shape success() emits and times every gzip level and brotli quality worth
+considering. No database is needed.
+
+    python -m benchmarks.compression_benchmark --sizes 20 100 --repeat 200
+"""
+
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.core import compression
+
+NAMES = ["John Smith", "Emily Johnson", "Michael Brown", "Sarah Wilson"]
+PRODUCTS = ["Laptop", "Smartphone", "Headphones", "Smartwatch", "Tablet"]
+STATUSES = ["PENDING", "PAID", "DELIVERED", "CANCELLED"]
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (
+        datetime(2025, 1, 1) + timedelta(minutes=rng.randint(0, 500_000))
+    ).isoformat()
+
+
+def _order(rng: random.Random) -> dict:
+    name = rng.choice(NAMES)
+    status = rng.choice(STATUSES)
+    return {
+        "orderId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "orderTotal": f"{rng.uniform(10, 5000):.2f}",
+        "orderDate": _timestamp(rng),
+        "orderAttachment": None,
+        "updatedAt": _timestamp(rng),
+        "status": {
+            "statusId": str(uuid.UUID(int=rng.getrandbits(128))),
+            "statusName": status.title(),
+            "statusCode": status,
+        },
+        "customer": {
+            "customerId": str(uuid.UUID(int=rng.getrandbits(128))),
+            "customerName": name,
+            "customerEmail": name.lower().replace(" ", ".") + "@gmail.com",
+            "customerPhone": f"+1202555{rng.randint(0, 9999):04d}",
+        },
+        "user": {
+            "userId": str(uuid.UUID(int=rng.getrandbits(128))),
+            "userName": "Admin",
+            "userEmail": "admin@smartsales.com",
+            "userPhone": "+12025550100",
+            "userAccount": "admin",
+            "updatedAt": _timestamp(rng),
+        },
+    }
+
+
+def _item(rng: random.Random) -> dict:
+    return {
+        "orderId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "productId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "itemQuantity": rng.randint(1, 10),
+        "itemPrice": f"{rng.uniform(5, 1500):.2f}",
+        "updatedAt": _timestamp(rng),
+    }
+
+
+def _price(rng: random.Random) -> dict:
+    return {
+        "priceId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "productId": str(uuid.UUID(int=rng.getrandbits(128))),
+        "priceAmount": f"{rng.uniform(5, 1500):.2f}",
+        "priceDate": _timestamp(rng)[:10],
+        "updatedAt": _timestamp(rng),
+    }
+
+
+PAGES = {"orders": _order, "items": _item, "prices": _price}
+
+
+def _codecs() -> list[tuple[str, callable]]:
+    codecs = [
+        (f"gzip-{level}", lambda data, level=level: gzip.compress(data, level, mtime=0))
+        for level in (1, 6, 9)
+    ]
+    if compression.brotli is not None:
+        codecs += [
+            (
+                f"br-{quality}",
+                lambda data, quality=quality: compression.brotli.compress(
+                    data, quality=quality
+                ),
+            )
+            for quality in (1, 5, 11)
+        ]
+    return codecs
+
+
+def run(sizes: list[int], repeat: int) -> None:
+    rng = random.Random(42)
+    for name, factory in PAGES.items():
+        for size in sizes:
+            body = json.dumps(
+                {name: [factory(rng) for _ in range(size)], "nextCursor": None}
+            ).encode()
+            print(f"{name} x{size}: {len(body)} bytes")
+
+            for label, codec in _codecs():
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    compressed = codec(body)
+                    timings.append((time.perf_counter() - start) * 1000)
+                saved = 1 - len(compressed) / len(body)
+                print(
+                    f"  {label:<8} {len(compressed):>8} bytes  saved={saved:6.1%}  "
+                    f"p50={statistics.median(timings):7.3f}ms"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Rows/sec of POST /customers/bulk, end to end through the handler.
+
+Imports N synthetic customers as JSON and as CSV, then re-imports the same
+rows so the no-op upsert path is timed too. Everything runs inside a
+transaction that is rolled back. Requires the usual DB_* environment
+variables and a schema loaded from SmartSales.sql.
+
+    python -m benchmarks.customer_import_benchmark --rows 20000
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+from app import database
+from app.handlers.customer import create_customers_bulk_handler
+
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "icloud.com", "example.com"]
+NAMES = ["John Smith", "Emily Johnson", "Michael Brown", "Sarah Wilson"]
+
+
+def _rows(size: int, rng: random.Random) -> list[dict]:
+    run_id = uuid.uuid4().hex[:8]
+    return [
+        {
+            "customerName": rng.choice(NAMES),
+            "customerEmail": f"{run_id}.{i}@{rng.choice(DOMAINS)}",
+            "customerPhone": f"+1202555{rng.randint(0, 9999):04d}",
+        }
+        for i in range(size)
+    ]
+
+
+def _csv(rows: list[dict]) -> str:
+    lines = ["customerName,customerEmail,customerPhone"]
+    lines += [",".join(row.values()) for row in rows]
+    return "\n".join(lines)
+
+
+def _time(label: str, size: int, body: str, content_type: str | None) -> None:
+    start = time.perf_counter()
+    response = create_customers_bulk_handler(body, content_type)
+    elapsed = time.perf_counter() - start
+    summary = {
+        key: response.body[key]
+        for key in ("created", "updated", "unchanged", "invalid")
+    }
+    print(f"  {label:<16} {size / elapsed:10.0f} rows/s  {elapsed:7.3f}s  {summary}")
+
+
+def run(size: int) -> None:
+    rng = random.Random(42)
+    json_rows, csv_rows = _rows(size, rng), _rows(size, rng)
+
+    with database.engine.connect() as connection:
+        transaction = connection.begin()
+        session = database.SessionLocal(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        token = database._shared_session.set(session)
+        try:
+            print(f"rows={size}")
+            json_body = json.dumps({"customers": json_rows})
+            _time("json", size, json_body, None)
+            _time("csv", size, _csv(csv_rows), "text/csv")
+            _time("json re-import", size, json_body, None)
+        finally:
+            database._shared_session.reset(token)
+            session.close()
+            transaction.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""bcrypt hashes/sec per cost factor and hashing pool size.
+
+Hashes through app.services.user.hash_passwords, the same bounded pool the
+bulk user endpoint uses, so the numbers include the pool overhead. Pick
+PASSWORD_BCRYPT_ROUNDS and PASSWORD_HASH_WORKERS from the output. No
+database is needed.
+
+    python -m benchmarks.hash_benchmark --rounds 10 12 --workers 1 2 --count 16
+
+Lambda's CPU share scales with memory (one vCPU per 1,769 MB), so numbers
+from a dev machine overstate what the API function gets. For the deployed
+figures, run lambda_handler in a function with the API function's
+MemorySize, invoked with {"rounds": [12], "workers": [1, 2], "count": 16}.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from app.services import user as user_service
+
+
+def run(rounds: list[int], workers: list[int], count: int) -> list[str]:
+    lines = [f"cpu_count={os.cpu_count()}"]
+    passwords = [f"password-{i}" for i in range(count)]
+    for cost in rounds:
+        user_service.pwd_context = CryptContext(
+            schemes=["bcrypt"], bcrypt__rounds=cost, bcrypt__min_rounds=cost
+        )
+        for size in workers:
+            user_service._hash_executor = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="bcrypt"
+            )
+            start = time.perf_counter()
+            user_service.hash_passwords(passwords)
+            elapsed = time.perf_counter() - start
+            user_service._hash_executor.shutdown()
+            lines.append(
+                f"rounds={cost:<3} workers={size:<3} "
+                f"{count / elapsed:8.1f} hashes/s  "
+                f"{elapsed / count * 1000:8.1f}ms per hash"
+            )
+    return lines
+
+
+def lambda_handler(event, context) -> list[str]:
+    return run(
+        event.get("rounds", [12]), event.get("workers", [1]), event.get("count", 16)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--count", type=int, default=16)
+    args = parser.parse_args()
+
+    for line in run(args.rounds, args.workers, args.count):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+"""End-to-end handler latency under concurrent load.
+
+Builds API Gateway REST proxy events for every Api route declared in
+template.yaml, filling path parameters with ids sampled from the database,
+and invokes app.main.lambda_handler in-process from a thread or process pool
+against the configured Postgres. Reports p50/p95/p99 latency, throughput and
+SQL statements per request for each route, optionally writes the results as
+JSON and compares them with a previous run. Write routes are only replayed
+with --include-writes because they commit. Requires the usual DB_* environment
+variables; a database loaded with benchmarks.synthetic_data gives realistic
+numbers.
+
+    python -m benchmarks.load_harness --requests 200 --workers 8 --output run.json
+    python -m benchmarks.load_harness --baseline run.json --routes "GET /orders"
+"""
+
+import os
+
+# The harness measures the handler, not X-Ray, EMF or log shipping.
+os.environ.setdefault("POWERTOOLS_TRACE_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_METRICS_DISABLED", "true")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "WARNING")
+
+import argparse
+import itertools
+import json
+import random
+import re
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import text
+
+from app.core.sql_metrics import track_queries
+from app.core.tracing import record_spans
+from app.database import SessionLocal
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "template.yaml"
+API_EVENT = re.compile(
+    r"^ +(?P<name>\w+):\n +Type: Api\n +Properties:\n"
+    r"(?: +RestApiId: .*\n)? +Path: (?P<path>\S+)\n +Method: (?P<method>\w+)",
+    re.MULTILINE,
+)
+PATH_PARAM = re.compile(r"{(\w+)}")
+
+SAMPLE_SIZE = 200
+HOT_SPOTS = 3
+# Routes that need S3 or an async worker rather than just the database.
+UNSUPPORTED = {
+    ("GET", "/orders/{order_id}/attachment/upload-url"),
+    ("GET", "/orders/{order_id}/attachment/view-url"),
+    ("PUT", "/orders/{order_id}/attachment"),
+    ("DELETE", "/orders/{order_id}/attachment"),
+    ("POST", "/orders/exports"),
+    ("GET", "/orders/exports/{export_id}"),
+}
+
+
+@dataclass
+class Route:
+    name: str
+    method: str
+    path: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+@dataclass
+class Sample:
+    label: str
+    elapsed_ms: float
+    status_code: int
+    queries: int
+    # Total ms per span name (service function, "sql", s3_client call, ...).
+    spans: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class RouteResult:
+    label: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_rps: float
+    queries_per_request: float
+    status_codes: dict[str, int] = field(default_factory=dict)
+    # Mean ms per request of the slowest span names.
+    hot_spots: dict[str, float] = field(default_factory=dict)
+
+
+def load_routes(template: Path = TEMPLATE) -> list[Route]:
+    routes = []
+    for match in API_EVENT.finditer(template.read_text()):
+        routes.append(Route(match["name"], match["method"].upper(), match["path"]))
+    return routes
+
+
+@dataclass
+class Fixtures:
+    """Ids and keywords sampled from the database to fill in requests."""
+
+    ids: dict[str, list[str]]
+    items: list[tuple[str, str]]
+    keywords: list[str]
+    order_dates: list[str]
+
+    @classmethod
+    def sample(cls, size: int = SAMPLE_SIZE) -> "Fixtures":
+        sources = {
+            "customer_id": "SELECT customer_id FROM customer",
+            "product_id": "SELECT product_id FROM product",
+            "price_id": "SELECT price_id FROM price",
+            "user_id": "SELECT user_id FROM users",
+            "status_id": "SELECT status_id FROM status",
+            "order_id": "SELECT order_id FROM orders",
+        }
+        with SessionLocal() as db:
+            ids = {
+                name: [
+                    str(value)
+                    for value in db.execute(
+                        text(f"{sql} ORDER BY random() LIMIT :size"), {"size": size}
+                    ).scalars()
+                ]
+                for name, sql in sources.items()
+            }
+            items = [
+                (str(order_id), str(product_id))
+                for order_id, product_id in db.execute(
+                    text(
+                        "SELECT order_id, product_id FROM item "
+                        "ORDER BY random() LIMIT :size"
+                    ),
+                    {"size": size},
+                )
+            ]
+            keywords = [
+                name.split()[0]
+                for name in db.execute(
+                    text(
+                        "SELECT customer_name FROM customer "
+                        "ORDER BY random() LIMIT :size"
+                    ),
+                    {"size": size},
+                ).scalars()
+            ]
+            db.rollback()
+
+        today = date.today()
+        order_dates = [str(today - timedelta(days=days)) for days in range(0, 60, 3)]
+        return cls(ids, items, keywords or ["a"], order_dates)
+
+
+QueryFactory = Callable[[random.Random, Fixtures], dict[str, str]]
+
+# Realistic query strings per read route; routes not listed send none.
+QUERIES: dict[tuple[str, str], list[QueryFactory]] = {
+    ("GET", "/customers"): [
+        lambda rng, fx: {},
+        lambda rng, fx: {"query": rng.choice(fx.keywords)},
+    ],
+    ("GET", "/customers/autocomplete"): [
+        lambda rng, fx: {"query": rng.choice(fx.keywords)[:3]},
+    ],
+    ("GET", "/products"): [
+        lambda rng, fx: {},
+        lambda rng, fx: {"query": "pro"},
+    ],
+    ("GET", "/products/autocomplete"): [lambda rng, fx: {"query": "lap"}],
+    ("GET", "/orders"): [
+        lambda rng, fx: {},
+        lambda rng, fx: {"orderDate": rng.choice(fx.order_dates)},
+        lambda rng, fx: {"customerId": rng.choice(fx.ids["customer_id"])},
+        lambda rng, fx: {"statusCode": "PAID"},
+    ],
+    ("GET", "/changes"): [
+        lambda rng, fx: {
+            "resource": rng.choice(["orders", "customers"]),
+            "limit": "100",
+        }
+    ],
+}
+
+BodyFactory = Callable[[random.Random, Fixtures], dict]
+
+# Bodies for write routes replayed with --include-writes.
+BODIES: dict[tuple[str, str], BodyFactory] = {
+    ("POST", "/customers"): lambda rng, fx: {
+        "customerName": f"Load Test {uuid.uuid4().hex[:8]}",
+        "customerEmail": f"load.{uuid.uuid4().hex[:12]}@example.com",
+        "customerPhone": f"+1{rng.randrange(2_000_000_000, 9_999_999_999)}",
+    },
+    ("POST", "/orders"): lambda rng, fx: {
+        "customerId": rng.choice(fx.ids["customer_id"]),
+        "userId": rng.choice(fx.ids["user_id"]),
+    },
+    ("POST", "/batch"): lambda rng, fx: {
+        "requests": [
+            {"method": "GET", "path": f"/customers/{customer_id}"}
+            for customer_id in rng.sample(
+                fx.ids["customer_id"], min(5, len(fx.ids["customer_id"]))
+            )
+        ]
+    },
+}
+
+
+def build_event(route: Route, fixtures: Fixtures, rng: random.Random) -> dict | None:
+    key = (route.method, route.path)
+    if key in UNSUPPORTED:
+        return None
+
+    body = None
+    if route.method != "GET":
+        if key not in BODIES:
+            return None
+        body = json.dumps(BODIES[key](rng, fixtures))
+
+    params = {}
+    names = PATH_PARAM.findall(route.path)
+    if names == ["order_id", "product_id"] and fixtures.items:
+        params = dict(zip(names, rng.choice(fixtures.items)))
+    else:
+        for name in names:
+            pool = fixtures.ids.get(name)
+            if not pool:
+                return None
+            params[name] = rng.choice(pool)
+
+    path = PATH_PARAM.sub(lambda m: params[m.group(1)], route.path)
+    query = rng.choice(QUERIES.get(key, [lambda rng, fx: {}]))(rng, fixtures)
+    headers = {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, br",
+        "Host": "localhost",
+        "User-Agent": "smart-sales-load-test",
+    }
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+
+    request_id = str(uuid.uuid4())
+    return {
+        "resource": route.path,
+        "path": path,
+        "httpMethod": route.method,
+        "headers": headers,
+        "multiValueHeaders": {name: [value] for name, value in headers.items()},
+        "queryStringParameters": query or None,
+        "multiValueQueryStringParameters": (
+            {name: [value] for name, value in query.items()} or None
+        ),
+        "pathParameters": params or None,
+        "stageVariables": None,
+        "requestContext": {
+            "resourcePath": route.path,
+            "httpMethod": route.method,
+            "path": f"/Prod{path}",
+            "stage": "Prod",
+            "requestId": request_id,
+            "identity": {"sourceIp": "127.0.0.1"},
+        },
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+class LambdaContext:
+    function_name = "SmartSalesFunction"
+    function_version = "$LATEST"
+    memory_limit_in_mb = 1024
+    invoked_function_arn = (
+        "arn:aws:lambda:us-east-1:000000000000:function:SmartSalesFunction"
+    )
+
+    def __init__(self, timeout_ms: int = 30_000):
+        self.aws_request_id = str(uuid.uuid4())
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
+
+
+def invoke(label: str, api_event: dict) -> Sample:
+    from app.main import lambda_handler
+
+    with track_queries() as queries, record_spans() as spans:
+        start = time.perf_counter()
+        response = lambda_handler(api_event, LambdaContext())
+        elapsed = (time.perf_counter() - start) * 1000
+
+    span_totals: dict[str, float] = defaultdict(float)
+    for span in spans:
+        span_totals[span.name] += span.duration_ms
+    return Sample(
+        label, elapsed, response["statusCode"], queries.statements, dict(span_totals)
+    )
+
+
+def _invoke_chunk(chunk: list[tuple[str, dict]]) -> list[Sample]:
+    return [invoke(label, api_event) for label, api_event in chunk]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[max(0, int(len(values) * pct + 0.5) - 1)]
+
+
+def summarize(samples: list[Sample], wall_seconds: float) -> list[RouteResult]:
+    by_label: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_label[sample.label].append(sample)
+
+    results = []
+    for label, group in sorted(by_label.items()):
+        timings = [sample.elapsed_ms for sample in group]
+        codes: dict[str, int] = defaultdict(int)
+        span_totals: dict[str, float] = defaultdict(float)
+        for sample in group:
+            codes[str(sample.status_code)] += 1
+            for name, duration_ms in sample.spans.items():
+                span_totals[name] += duration_ms
+        hot_spots = sorted(span_totals.items(), key=lambda kv: kv[1], reverse=True)
+        results.append(
+            RouteResult(
+                label=label,
+                requests=len(group),
+                errors=sum(1 for sample in group if sample.status_code >= 500),
+                p50_ms=round(statistics.median(timings), 3),
+                p95_ms=round(_percentile(timings, 0.95), 3),
+                p99_ms=round(_percentile(timings, 0.99), 3),
+                mean_ms=round(statistics.fmean(timings), 3),
+                # Routes are interleaved, so this is each route's share of
+                # the run's overall throughput.
+                throughput_rps=round(len(group) / wall_seconds, 2),
+                queries_per_request=round(
+                    statistics.fmean(sample.queries for sample in group), 2
+                ),
+                status_codes=dict(codes),
+                hot_spots={
+                    name: round(total / len(group), 3)
+                    for name, total in hot_spots[:HOT_SPOTS]
+                },
+            )
+        )
+    return results
+
+
+def run(
+    routes: list[Route],
+    requests: int,
+    workers: int,
+    mode: str,
+    warmup: int,
+    seed: int,
+) -> tuple[list[RouteResult], dict]:
+    rng = random.Random(seed)
+    fixtures = Fixtures.sample()
+
+    planned: list[tuple[str, dict]] = []
+    skipped = []
+    for route in routes:
+        if build_event(route, fixtures, random.Random(seed)) is None:
+            skipped.append(route.label)
+            continue
+
+        # Warm imports, caches and the connection path outside the timings.
+        for _ in range(warmup):
+            invoke(route.label, build_event(route, fixtures, rng))
+        planned += [
+            (route.label, build_event(route, fixtures, rng)) for _ in range(requests)
+        ]
+
+    rng.shuffle(planned)
+    chunk_size = max(1, len(planned) // (workers * 8))
+    chunks = [planned[i : i + chunk_size] for i in range(0, len(planned), chunk_size)]
+
+    pool_class = ProcessPoolExecutor if mode == "process" else ThreadPoolExecutor
+    start = time.perf_counter()
+    with pool_class(max_workers=workers) as pool:
+        samples = list(itertools.chain.from_iterable(pool.map(_invoke_chunk, chunks)))
+    wall_seconds = time.perf_counter() - start
+
+    summary = {
+        "requests": len(samples),
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(samples) / wall_seconds, 2),
+        "workers": workers,
+        "mode": mode,
+        "seed": seed,
+        "skipped_routes": skipped,
+    }
+    return summarize(samples, wall_seconds), summary
+
+
+def compare(results: list[RouteResult], baseline_path: Path, tolerance: float) -> bool:
+    baseline = {
+        route["label"]: route
+        for route in json.loads(baseline_path.read_text())["routes"]
+    }
+    ok = True
+    print(f"\nvs {baseline_path} (tolerance {tolerance:.0%})")
+    for result in results:
+        before = baseline.get(result.label)
+        if not before:
+            continue
+        change = (result.p95_ms - before["p95_ms"]) / max(before["p95_ms"], 1e-9)
+        regressed = change > tolerance
+        queries_grew = result.queries_per_request > before["queries_per_request"]
+        ok = ok and not regressed and not queries_grew
+        flag = "REGRESSED" if regressed or queries_grew else "ok"
+        print(
+            f"  {result.label:<46} p95 {before['p95_ms']:8.2f} -> "
+            f"{result.p95_ms:8.2f}ms ({change:+.0%}) queries "
+            f"{before['queries_per_request']:.1f} -> "
+            f"{result.queries_per_request:.1f} {flag}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=200, help="per route")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread")
+    parser.add_argument("--warmup", type=int, default=3, help="per route")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--routes", help="regex over 'METHOD /path'")
+    parser.add_argument("--include-writes", action="store_true")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    routes = load_routes()
+    if not args.include_writes:
+        routes = [route for route in routes if route.method == "GET"]
+    if args.routes:
+        routes = [route for route in routes if re.search(args.routes, route.label)]
+
+    results, summary = run(
+        routes, args.requests, args.workers, args.mode, args.warmup, args.seed
+    )
+
+    print(
+        f"{summary['requests']} requests in {summary['wall_seconds']}s "
+        f"({summary['throughput_rps']} req/s, {args.workers} {args.mode} workers)"
+    )
+    for result in results:
+        print(
+            f"  {result.label:<46} p50={result.p50_ms:8.2f} p95={result.p95_ms:8.2f} "
+            f"p99={result.p99_ms:8.2f}ms {result.throughput_rps:8.1f} req/s "
+            f"queries={result.queries_per_request:5.1f} errors={result.errors}"
+        )
+        if result.hot_spots:
+            print(
+                "    hot: "
+                + ", ".join(
+                    f"{name} {ms:.2f}ms" for name, ms in result.hot_spots.items()
+                )
+            )
+    for label in summary["skipped_routes"]:
+        print(f"  {label:<46} skipped")
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {"summary": summary, "routes": [asdict(r) for r in results]}, indent=2
+            )
+        )
+
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
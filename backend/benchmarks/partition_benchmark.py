@@ -0,0 +1,184 @@
+"""Partition pruning on the monthly orders partitions.
+
+Seeds N synthetic orders spread over the last M months inside a transaction
+that is rolled back, then runs the date-filtered order service calls while
+capturing the SQL they emit, and EXPLAINs each statement to check the plan
+only touches the partitions the date range covers. Exits non-zero when a
+query scans partitions outside its range. Requires the usual DB_* environment
+variables and a schema loaded from SmartSales.sql.
+
+    python -m benchmarks.partition_benchmark --orders 5000000 --months 24
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, engine
+from app.schemas.order import OrderFilterQuery
+from app.services import order as order_service
+from app.services.partition import PARTITION_NAME, month_start, partition_name
+
+CREATE_PARTITIONS = text(
+    """
+    SELECT create_orders_partition(month::date)
+    FROM generate_series(CAST(:first AS date), CAST(:last AS date), interval '1 month')
+        AS month
+    """
+)
+
+SEED_ORDERS = text(
+    """
+    INSERT INTO orders (customer_id, user_id, status_id, order_total, order_date)
+    SELECT
+        (SELECT customer_id FROM customer LIMIT 1),
+        (SELECT user_id FROM users LIMIT 1),
+        (SELECT status_id FROM status WHERE status_code = 'PAID'),
+        (i % 1000)::decimal,
+        CAST(:first AS timestamp) + random() * (now() - CAST(:first AS timestamp))
+    FROM generate_series(1, :size) AS i
+    """
+)
+
+
+@contextmanager
+def capture_statements():
+    statements: list[tuple[str, object]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def scanned_partitions(db: Session, statement: str, parameters) -> set[str]:
+    connection = db.connection()
+    cursor = connection.connection.cursor()
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    found = set()
+
+    def walk(node: dict) -> None:
+        relation = node.get("Relation Name")
+        if relation and PARTITION_NAME.match(relation):
+            found.add(relation)
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return found
+
+
+def expected_partitions(first: date, last: date) -> set[str]:
+    names = set()
+    month = month_start(first)
+    while month <= last:
+        names.add(partition_name(month))
+        month += relativedelta(months=1)
+    return names
+
+
+def check(db: Session, label: str, fn, first: date, last: date) -> bool:
+    with capture_statements() as statements:
+        start = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - start) * 1000
+
+    expected = expected_partitions(first, last)
+    ok = True
+    for statement, parameters in statements:
+        if "orders" not in statement:
+            continue
+        scanned = scanned_partitions(db, statement, parameters)
+        pruned = scanned <= expected
+        ok = ok and pruned
+        print(
+            f"  {label:<28} {elapsed:9.2f}ms scanned={len(scanned):>3} "
+            f"expected<={len(expected):>3} {'ok' if pruned else 'NOT PRUNED'}"
+        )
+        if not pruned:
+            print(f"    extra partitions: {sorted(scanned - expected)}")
+    return ok
+
+
+def run(orders: int, months: int) -> bool:
+    today = date.today()
+    first = month_start(today) - relativedelta(months=months - 1)
+
+    with SessionLocal() as db:
+        db.execute(CREATE_PARTITIONS, {"first": first, "last": month_start(today)})
+        db.execute(SEED_ORDERS, {"first": first, "size": orders})
+        db.execute(text("ANALYZE orders"))
+        print(f"orders={orders} months={months}")
+
+        seven_days_ago = today - timedelta(days=order_service.DAYS_RANGE)
+        twelve_months_ago = month_start(today) - relativedelta(
+            months=order_service.MONTH_RANGE
+        )
+        one_day = today - timedelta(days=40)
+
+        results = [
+            check(
+                db,
+                "orders_in_7_days",
+                lambda: order_service.get_total_orders_in_7_days(db),
+                seven_days_ago,
+                today,
+            ),
+            check(
+                db,
+                "revenue_in_7_days",
+                lambda: order_service.get_total_revenue_in_7_days(db),
+                seven_days_ago,
+                today,
+            ),
+            check(
+                db,
+                "revenue_in_12_months",
+                lambda: order_service.get_total_revenue_in_12_months(db),
+                twelve_months_ago,
+                today,
+            ),
+            check(
+                db,
+                "get_orders/order_date",
+                lambda: order_service.get_orders(
+                    db, OrderFilterQuery(order_date=one_day)
+                ),
+                one_day,
+                one_day,
+            ),
+        ]
+
+        db.rollback()
+
+    return all(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=5_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    args = parser.parse_args()
+
+    if not run(args.orders, args.months):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Customer search latency at scale.
+
+Seeds N synthetic customers inside a transaction that is rolled back at the
+end, then times the ranked, paginated search against the legacy unbounded
+single-column ILIKE. Requires the usual DB_* environment variables.
+
+    python -m benchmarks.search_benchmark --sizes 100000 1000000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import select, text
+
+from app.database import SessionLocal
+from app.models import Customer
+from app.schemas.pagination import PaginationQuery
+from app.services.customer import search_customers
+
+SEED_CUSTOMERS = text(
+    """
+    INSERT INTO customer (customer_name, customer_email, customer_phone)
+    SELECT
+        (ARRAY['John','Emily','Michael','Sarah','David','Laura','Robert','Sophia'])[1 + i % 8]
+            || ' ' ||
+        (ARRAY['Smith','Johnson','Brown','Wilson','Miller','Davis','Garcia','Taylor'])[1 + (i / 8) % 8]
+            || ' ' || i,
+        'bench.customer' || i || '@example.com',
+        '+1202' || lpad(i::text, 8, '0')
+    FROM generate_series(1, :size) AS i
+    """
+)
+
+KEYWORDS = {
+    "exact_email": "bench.customer4242@example.com",
+    "prefix_name": "Sarah",
+    "substring_name": "ilson",
+    "phone": "+120200004",
+    "no_match": "zzzzzz",
+}
+
+
+def _time(fn, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float], rows: int) -> None:
+    timings = sorted(timings)
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"  {label:<28} p50={statistics.median(timings):8.2f}ms "
+        f"p95={p95:8.2f}ms rows={rows}"
+    )
+
+
+def run(size: int, repeat: int, limit: int) -> None:
+    with SessionLocal() as db:
+        db.execute(SEED_CUSTOMERS, {"size": size})
+        db.execute(text("ANALYZE customer"))
+        print(f"customers={size}")
+
+        query = PaginationQuery(limit=limit)
+        for name, keyword in KEYWORDS.items():
+            rows = len(search_customers(db, keyword, query).items)
+            _report(
+                f"ranked/{name}",
+                _time(lambda: search_customers(db, keyword, query), repeat),
+                rows,
+            )
+
+            legacy = select(Customer).where(
+                Customer.customer_name.ilike(f"%{keyword}%")
+            )
+            rows = len(db.execute(legacy).scalars().all())
+            _report(
+                f"legacy/{name}",
+                _time(lambda: db.execute(legacy).scalars().all(), repeat),
+                rows,
+            )
+
+        db.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.repeat, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""Deterministic synthetic data at production volume.
+
+Bulk-loads customers, products with a price history, users, orders and items
+with COPY, so get_orders, the search filters and the dashboards can be
+measured on realistic volumes. The same --seed always produces the same rows:
+product popularity and customer activity follow Zipf distributions (a few
+hot products and heavy customers), orders are spread evenly over the last
+--days days with time-ordered UUIDv7 ids, older orders are closed
+(DELIVERED/CANCELLED) and item prices come from the price in effect on the
+order date. Requires the usual DB_* environment variables and a schema
+loaded from SmartSales.sql.
+
+    python -m benchmarks.synthetic_data --customers 1000000 --products 50000 \\
+        --orders 10000000 --items-per-order 4 --truncate
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import random
+import time
+import uuid
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from dateutil.relativedelta import relativedelta
+
+from app.core.ids import uuid7_at
+from app.database import engine
+from app.services.user import hash_password
+
+COPY_BUFFER_SIZE = 1 << 20
+
+FIRST_NAMES = ["John", "Emily", "Michael", "Sarah", "David", "Laura", "Robert"]
+FIRST_NAMES += ["Sophia", "Daniel", "Olivia", "James", "Mia", "Lucas", "Ava"]
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Wilson", "Miller", "Davis", "Garcia"]
+LAST_NAMES += ["Taylor", "Martinez", "Anderson", "Thomas", "Moore", "Lee", "Clark"]
+PRODUCT_ADJECTIVES = ["Wireless", "Smart", "Portable", "Compact", "Pro", "Ultra"]
+PRODUCT_NOUNS = ["Laptop", "Smartphone", "Headphones", "Smartwatch", "Tablet"]
+PRODUCT_NOUNS += ["Camera", "Printer", "Monitor", "Keyboard", "Mouse", "Speaker"]
+
+# Orders younger than this are still in flight; older ones are closed.
+OPEN_ORDER_DAYS = 14
+OPEN_STATUS_WEIGHTS = {"PENDING": 30, "PAID": 40, "DELIVERED": 25, "CANCELLED": 5}
+CLOSED_STATUS_WEIGHTS = {"DELIVERED": 92, "CANCELLED": 8}
+
+
+@dataclass
+class Config:
+    seed: int
+    customers: int
+    products: int
+    users: int
+    orders: int
+    items_per_order: float
+    max_items_per_order: int
+    price_history: int
+    days: int
+    customer_skew: float
+    product_skew: float
+
+
+class CopySource(io.TextIOBase):
+    """File-like CSV view over a row iterator, for cursor.copy_expert()."""
+
+    def __init__(self, rows: Iterable[tuple], batch_size: int = 5000):
+        self._rows = iter(rows)
+        self._batch_size = batch_size
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> str:
+        out = io.StringIO()
+        csv.writer(out).writerows(itertools.islice(self._rows, self._batch_size))
+        return out.getvalue()
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = self._fill()
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class ZipfSampler:
+    """Draws indexes 0..n-1 with P(i) proportional to 1 / (i + 1) ** skew."""
+
+    def __init__(self, n: int, skew: float):
+        self._cumulative = list(
+            itertools.accumulate(1 / (rank**skew) for rank in range(1, n + 1))
+        )
+        self._total = self._cumulative[-1]
+
+    def __call__(self, rng: random.Random) -> int:
+        return bisect_right(self._cumulative, rng.random() * self._total)
+
+
+def _copy(cursor, table: str, columns: list[str], rows: Iterable[tuple]) -> int:
+    start = time.perf_counter()
+    counted = _Counter(rows)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        CopySource(counted),
+        size=COPY_BUFFER_SIZE,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {table:<10} {counted.count:>12,} rows {counted.count / elapsed:>12,.0f}/s"
+    )
+    return counted.count
+
+
+class _Counter:
+    def __init__(self, rows: Iterable[tuple]):
+        self._rows = iter(rows)
+        self.count = 0
+
+    def __iter__(self) -> Iterator[tuple]:
+        for row in self._rows:
+            self.count += 1
+            yield row
+
+
+def _uuid4(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _weighted(weights: dict[str, int]) -> tuple[list[str], list[int]]:
+    return list(weights), list(itertools.accumulate(weights.values()))
+
+
+class Generator:
+    def __init__(self, config: Config, now: datetime):
+        self.config = config
+        self.end = now.replace(microsecond=0)
+        self.start = self.end - timedelta(days=config.days)
+
+        rng = random.Random(f"{config.seed}:ids")
+        self.customer_ids = [_uuid4(rng) for _ in range(config.customers)]
+        self.product_ids = [_uuid4(rng) for _ in range(config.products)]
+        self.user_ids = [_uuid4(rng) for _ in range(config.users)]
+
+        self.pick_customer = ZipfSampler(config.customers, config.customer_skew)
+        self.pick_product = ZipfSampler(config.products, config.product_skew)
+
+        # Every product shares one evenly spaced price grid starting at
+        # self.start, so any order date has a price in effect.
+        step = (self.end - self.start) / config.price_history
+        self.price_dates = [
+            (self.start + step * i).date() for i in range(config.price_history)
+        ]
+        self.prices = self._price_history()
+
+    def _price_history(self) -> list[list[Decimal]]:
+        rng = random.Random(f"{self.config.seed}:prices")
+        history = []
+        for _ in self.product_ids:
+            amount = rng.uniform(5, 2000)
+            amounts = []
+            for _ in self.price_dates:
+                amounts.append(Decimal(f"{amount:.2f}"))
+                amount *= rng.uniform(0.92, 1.12)
+            history.append(amounts)
+        return history
+
+    def customers(self) -> Iterator[tuple]:
+        rng = random.Random(f"{self.config.seed}:customers")
+        for i, customer_id in enumerate(self.customer_ids):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+            yield customer_id, name, f"synthetic.c{i}@example.com", f"+1{2020000000 + i}"
+
+    def products(self) -> Iterator[tuple]:
+        rng = random.Random(f"{self.config.seed}:products")
+        for i, product_id in enumerate(self.product_ids):
+            name = f"{rng.choice(PRODUCT_ADJECTIVES)} {rng.choice(PRODUCT_NOUNS)} {i}"
+            yield product_id, name, f"Synthetic product {i}", rng.randint(0, 10_000)
+
+    def price_rows(self) -> Iterator[tuple]:
+        rng = random.Random(f"{self.config.seed}:price-ids")
+        for product_id, amounts in zip(self.product_ids, self.prices):
+            for price_date, amount in zip(self.price_dates, amounts):
+                when = datetime.combine(price_date, datetime.min.time())
+                yield uuid7_at(when, rng), product_id, amount, price_date
+
+    def users(self, password_hash: str) -> Iterator[tuple]:
+        for i, user_id in enumerate(self.user_ids):
+            yield (
+                user_id,
+                f"Synthetic User {i}",
+                f"synthetic.u{i}@company.com",
+                f"+1{3030000000 + i}",
+                f"synthetic.user{i}",
+                password_hash,
+            )
+
+    def orders_with_items(
+        self, status_ids: dict[str, uuid.UUID]
+    ) -> Iterator[tuple[tuple, list[tuple]]]:
+        """(order row, item rows), in order_date order.
+
+        Re-running with the same config yields identical rows, which lets
+        orders and items be streamed through COPY in two passes.
+        """
+        config = self.config
+        rng = random.Random(f"{config.seed}:orders")
+        span = self.end - self.start
+        open_since = self.end - timedelta(days=OPEN_ORDER_DAYS)
+        open_statuses = _weighted(OPEN_STATUS_WEIGHTS)
+        closed_statuses = _weighted(CLOSED_STATUS_WEIGHTS)
+        extra_items = max(config.items_per_order - 1, 0)
+
+        for i in range(config.orders):
+            order_date = self.start + span * ((i + rng.random()) / config.orders)
+            order_id = uuid7_at(order_date, rng)
+
+            codes, weights = (
+                open_statuses if order_date >= open_since else closed_statuses
+            )
+            status = rng.choices(codes, cum_weights=weights)[0]
+
+            count = 1
+            if extra_items:
+                count += int(rng.expovariate(1 / extra_items))
+            count = min(count, config.max_items_per_order, config.products)
+
+            price_index = bisect_right(self.price_dates, order_date.date()) - 1
+            products: set[int] = set()
+            while len(products) < count:
+                products.add(self.pick_product(rng))
+
+            items = []
+            total = Decimal(0)
+            for product in sorted(products):
+                quantity = rng.randint(1, 5)
+                price = self.prices[product][price_index]
+                total += price * quantity
+                items.append(
+                    (order_id, self.product_ids[product], quantity, price, order_date)
+                )
+
+            order = (
+                order_id,
+                self.customer_ids[self.pick_customer(rng)],
+                self.user_ids[rng.randrange(config.users)],
+                total,
+                status_ids[status],
+                order_date,
+                order_date,
+            )
+            yield order, items
+
+
+def _create_partitions(cursor, start: datetime, end: datetime) -> None:
+    month = start.date().replace(day=1)
+    while month <= end.date():
+        cursor.execute("SELECT create_orders_partition(%s)", (month,))
+        month += relativedelta(months=1)
+
+
+def run(config: Config, until: datetime, truncate: bool, skip_triggers: bool) -> None:
+    generator = Generator(config, until)
+    print(
+        f"seed={config.seed} customers={config.customers} products={config.products} "
+        f"orders={config.orders} from {generator.start:%Y-%m-%d}"
+    )
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if skip_triggers:
+            # Skips the item -> orders integrity triggers and FK checks; the
+            # generator only emits consistent rows. Needs superuser.
+            cursor.execute("SET session_replication_role = replica")
+        if truncate:
+            cursor.execute(
+                "TRUNCATE item, orders, item_archive, orders_archive, price, "
+                "product, customer, tombstone"
+            )
+            cursor.execute("DELETE FROM users WHERE user_account LIKE 'synthetic.%'")
+
+        cursor.execute("SELECT status_code, status_id FROM status")
+        status_ids = {code: uuid.UUID(str(status_id)) for code, status_id in cursor}
+        _create_partitions(cursor, generator.start, generator.end)
+
+        _copy(
+            cursor,
+            "customer",
+            ["customer_id", "customer_name", "customer_email", "customer_phone"],
+            generator.customers(),
+        )
+        _copy(
+            cursor,
+            "product",
+            ["product_id", "product_name", "product_description", "product_quantity"],
+            generator.products(),
+        )
+        _copy(
+            cursor,
+            "price",
+            ["price_id", "product_id", "price_amount", "price_date"],
+            generator.price_rows(),
+        )
+        _copy(
+            cursor,
+            "users",
+            [
+                "user_id",
+                "user_name",
+                "user_email",
+                "user_phone",
+                "user_account",
+                "user_password",
+            ],
+            generator.users(hash_password("synthetic")),
+        )
+        _copy(
+            cursor,
+            "orders",
+            [
+                "order_id",
+                "customer_id",
+                "user_id",
+                "order_total",
+                "status_id",
+                "order_date",
+                "updated_at",
+            ],
+            (order for order, _ in generator.orders_with_items(status_ids)),
+        )
+        _copy(
+            cursor,
+            "item",
+            ["order_id", "product_id", "item_quantity", "item_price", "updated_at"],
+            (
+                item
+                for _, items in generator.orders_with_items(status_ids)
+                for item in items
+            ),
+        )
+        connection.commit()
+
+        connection.set_session(autocommit=True)
+        for table in ["customer", "product", "price", "users", "orders", "item"]:
+            cursor.execute(f"ANALYZE {table}")
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--customers", type=int, default=1_000_000)
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=10_000_000)
+    parser.add_argument("--items-per-order", type=float, default=4.0)
+    parser.add_argument("--max-items-per-order", type=int, default=20)
+    parser.add_argument("--price-history", type=int, default=12)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--customer-skew", type=float, default=0.8)
+    parser.add_argument("--product-skew", type=float, default=1.1)
+    # Rows only depend on --seed and --until; pin --until to reproduce a load.
+    parser.add_argument(
+        "--until", type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD"
+    )
+    parser.add_argument("--truncate", action="store_true")
+    parser.add_argument("--skip-triggers", action="store_true")
+    args = parser.parse_args()
+
+    config = Config(
+        seed=args.seed,
+        customers=args.customers,
+        products=args.products,
+        users=args.users,
+        orders=args.orders,
+        items_per_order=args.items_per_order,
+        max_items_per_order=args.max_items_per_order,
+        price_history=args.price_history,
+        days=args.days,
+        customer_skew=args.customer_skew,
+        product_skew=args.product_skew,
+    )
+    until = datetime.combine(args.until, datetime.min.time())
+    run(config, until, args.truncate, args.skip_triggers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bulk insert rate and primary key index size: UUIDv4 vs UUIDv7.
+
+Creates two temporary order-shaped tables, one keyed by gen_random_uuid() and
+one by uuid_generate_v7(), bulk-inserts the same number of rows into each in
+batches and reports rows/s plus the size of each primary key index. Runs
+inside a transaction that is rolled back. Requires the usual DB_* environment
+variables and a schema loaded from SmartSales.sql.
+
+    python -m benchmarks.uuid_benchmark --rows 1000000 --batch 10000
+"""
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.database import SessionLocal
+
+GENERATORS = {
+    "v4": "gen_random_uuid()",
+    "v7": "uuid_generate_v7()",
+}
+
+CREATE_TABLE = """
+    CREATE TEMP TABLE bench_orders_{name} (
+        order_id UUID PRIMARY KEY DEFAULT {generator},
+        customer_id UUID NOT NULL,
+        order_total decimal(10, 2) NOT NULL DEFAULT 0,
+        order_date timestamp DEFAULT CURRENT_TIMESTAMP
+    ) ON COMMIT DROP
+"""
+
+INSERT_BATCH = """
+    INSERT INTO bench_orders_{name} (customer_id, order_total)
+    SELECT gen_random_uuid(), (i % 1000)::decimal
+    FROM generate_series(1, :size) AS i
+"""
+
+INDEX_SIZE = text(
+    """
+    SELECT pg_relation_size(indexrelid), pg_size_pretty(pg_relation_size(indexrelid))
+    FROM pg_index
+    WHERE indrelid = CAST(:table AS regclass) AND indisprimary
+    """
+)
+
+
+def run(rows: int, batch: int) -> None:
+    with SessionLocal() as db:
+        print(f"rows={rows} batch={batch}")
+        for name, generator in GENERATORS.items():
+            db.execute(text(CREATE_TABLE.format(name=name, generator=generator)))
+            insert = text(INSERT_BATCH.format(name=name))
+
+            start = time.perf_counter()
+            inserted = 0
+            while inserted < rows:
+                size = min(batch, rows - inserted)
+                db.execute(insert, {"size": size})
+                inserted += size
+            elapsed = time.perf_counter() - start
+
+            size_bytes, size_pretty = db.execute(
+                INDEX_SIZE, {"table": f"bench_orders_{name}"}
+            ).one()
+            print(
+                f"  {name}  {rows / elapsed:12,.0f} rows/s  "
+                f"pk_index={size_pretty:>10} ({size_bytes / rows:.1f} B/row)"
+            )
+
+        db.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    run(args.rows, args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import re
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+import uuid
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import OperationalError
+from app import database
+from app.models import Customer, Item, Order, Price, Product, Status, User
+
+SAVEPOINT_STATEMENT = re.compile(r"(RELEASE |ROLLBACK TO )?SAVEPOINT ", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def connection():
+    # Runs against the DB_* database (a local SmartSales.sql); skipped when
+    # no Postgres is reachable so the unit suite still runs anywhere.
+    try:
+        connection = database.engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"Postgres is not reachable: {e}")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def db(connection):
+    """A real session shared with every handler via get_db().
+
+    Handler commits only release a savepoint; the outer transaction is
+    rolled back afterwards, so tests never leave rows behind.
+    """
+    transaction = connection.begin()
+    session = database.SessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    token = database._shared_session.set(session)
+    try:
+        yield session
+    finally:
+        database._shared_session.reset(token)
+        session.close()
+        transaction.rollback()
+
+
+@contextmanager
+def query_budget(max_statements: int):
+    """Fails when the block runs more than max_statements SQL statements."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # Savepoints come from the db fixture's rollback wrapper; a real
+        # request commits its transaction without any statement of its own.
+        if not SAVEPOINT_STATEMENT.match(statement):
+            statements.append(statement)
+
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+
+    assert (
+        len(statements) <= max_statements
+    ), f"{len(statements)} statements, budget {max_statements}:\n" + "\n---\n".join(
+        statements
+    )
+
+
+@pytest.fixture(name="query_budget")
+def query_budget_fixture():
+    return query_budget
+
+
+@pytest.fixture
+def make_order(db):
+    def make(item_count: int) -> tuple[uuid.UUID, list[uuid.UUID]]:
+        suffix = uuid.uuid4().hex[:12]
+        customer = Customer(
+            customer_name="Query Budget",
+            customer_email=f"{suffix}@example.com",
+            customer_phone="0400000000",
+        )
+        user = User(
+            user_name="Query Budget",
+            user_email=f"{suffix}@example.com",
+            user_phone="0400000000",
+            user_account=f"budget-{suffix}",
+            user_password="x",
+        )
+        products = [
+            Product(product_name=f"Product {i}", product_quantity=100)
+            for i in range(item_count)
+        ]
+        db.add_all([customer, user, *products])
+        db.flush()
+        db.add_all(
+            Price(
+                product_id=product.product_id,
+                price_amount=Decimal("2.50"),
+                price_date=date.today(),
+            )
+            for product in products
+        )
+
+        pending = db.execute(
+            select(Status).where(Status.status_code == "PENDING")
+        ).scalar_one()
+        order = Order(
+            customer_id=customer.customer_id,
+            user_id=user.user_id,
+            status_id=pending.status_id,
+            order_total=Decimal("2.50") * item_count,
+        )
+        db.add(order)
+        db.flush()
+        db.add_all(
+            Item(
+                order_id=order.order_id,
+                product_id=product.product_id,
+                item_quantity=1,
+                item_price=Decimal("2.50"),
+            )
+            for product in products
+        )
+        db.commit()
+        # Start each measured request from a cold identity map.
+        db.expunge_all()
+        return order.order_id, [product.product_id for product in products]
+
+    return make
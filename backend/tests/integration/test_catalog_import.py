@@ -0,0 +1,60 @@
+import uuid
+from datetime import date, timedelta
+from sqlalchemy import select
+from app.models import Price, Product
+from app.services.catalog import import_catalog
+
+
+def test_products_upsert_and_prices_reference_them(db, query_budget):
+    existing = Product(product_name="Old Name", product_quantity=1)
+    db.add(existing)
+    db.commit()
+    new_id = uuid.uuid4()
+    next_week = date.today() + timedelta(days=7)
+    products = [
+        {
+            "product_id": str(existing.product_id),
+            "product_name": "New Name",
+            "product_quantity": "5",
+        },
+        {"product_id": str(new_id), "product_name": "Catalog", "product_quantity": "2"},
+    ]
+    prices = [
+        {
+            "product_id": str(product_id),
+            "price_amount": "9.99",
+            "price_date": next_week.isoformat(),
+        }
+        for product_id in (existing.product_id, new_id, uuid.uuid4())
+    ]
+
+    # One upsert and one price statement per batch, whatever the row count.
+    with query_budget(2):
+        result = import_catalog(db, products, prices)
+
+    assert (result.products_created, result.products_updated) == (1, 1)
+    assert result.prices_created == 2
+    assert [row.line for row in result.rejected] == [4]
+
+    db.expire_all()
+    assert db.get(Product, existing.product_id).product_name == "New Name"
+    stmt = select(Price).where(Price.product_id.in_([existing.product_id, new_id]))
+    assert len(db.execute(stmt).scalars().all()) == 2
+
+
+def test_rerun_does_not_duplicate_prices(db):
+    product = Product(product_name="Rerun", product_quantity=1)
+    db.add(product)
+    db.commit()
+    prices = [
+        {
+            "product_id": str(product.product_id),
+            "price_amount": "9.99",
+            "price_date": (date.today() + timedelta(days=1)).isoformat(),
+        }
+    ]
+
+    import_catalog(db, [], prices)
+    result = import_catalog(db, [], prices)
+
+    assert (result.prices_created, result.prices_existing) == (0, 1)
@@ -0,0 +1,84 @@
+import json
+import uuid
+import pytest
+from app.handlers.customer import create_customers_bulk_handler
+from app.models import Customer
+
+
+def _row(email: str, name: str = "Bulk Import", phone: str = "+61400000000"):
+    return {"customerName": name, "customerEmail": email, "customerPhone": phone}
+
+
+@pytest.fixture
+def existing(db):
+    suffix = uuid.uuid4().hex[:12]
+    customer = Customer(
+        customer_name="Bulk Import",
+        customer_email=f"{suffix}-old@example.com",
+        customer_phone="+61400000000",
+    )
+    changed = Customer(
+        customer_name="Old Name",
+        customer_email=f"{suffix}-changed@example.com",
+        customer_phone="+61400000000",
+    )
+    db.add_all([customer, changed])
+    db.commit()
+    return customer, changed
+
+
+def test_rows_are_created_updated_or_left_alone(db, existing):
+    unchanged, changed = existing
+    new_email = f"{uuid.uuid4().hex[:12]}@example.com"
+    body = {
+        "customers": [
+            _row(new_email),
+            _row(unchanged.customer_email),
+            _row(changed.customer_email, name="New Name"),
+            _row("not-an-email"),
+            _row(new_email, name="Repeated"),
+        ]
+    }
+
+    response = create_customers_bulk_handler(json.dumps(body))
+
+    assert response.status_code == 200
+    results = response.body["results"]
+    assert [result["status"] for result in results] == [
+        "created",
+        "unchanged",
+        "updated",
+        "invalid",
+        "invalid",
+    ]
+    assert results[1]["customerId"] == str(unchanged.customer_id)
+    assert results[2]["customerId"] == str(changed.customer_id)
+    assert results[4]["errors"][0]["type"] == "duplicate"
+    assert (response.body["created"], response.body["invalid"]) == (1, 2)
+
+    db.expire_all()
+    assert db.get(Customer, changed.customer_id).customer_name == "New Name"
+
+
+def test_csv_body(db):
+    emails = [f"{uuid.uuid4().hex[:12]}@example.com" for _ in range(3)]
+    body = "customer_name,customer_email,customer_phone\n" + "".join(
+        f"CSV Import,{email},61400000000\n" for email in emails
+    )
+
+    response = create_customers_bulk_handler(body, "text/csv; charset=utf-8")
+
+    assert response.status_code == 200
+    assert response.body["created"] == 3
+
+
+@pytest.mark.parametrize("size", [1, 1000])
+def test_statement_count_does_not_grow_with_rows(db, query_budget, size):
+    suffix = uuid.uuid4().hex[:8]
+    body = {"customers": [_row(f"{suffix}-{i}@example.com") for i in range(size)]}
+
+    # CREATE TEMP TABLE, the upsert and DROP; COPY bypasses the engine hooks.
+    with query_budget(3):
+        response = create_customers_bulk_handler(json.dumps(body))
+
+    assert response.body["created"] == size
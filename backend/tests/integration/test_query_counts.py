@@ -0,0 +1,60 @@
+import pytest
+from app.handlers.item import get_items_by_order_handler, update_item_handler
+from app.handlers.order import get_order_handler, get_orders_handler
+
+
+def test_get_orders_budget(make_order, query_budget):
+    make_order(3)
+
+    with query_budget(2):
+        response = get_orders_handler({})
+
+    assert response.status_code == 200
+
+
+def test_get_orders_status_filter_budget(make_order, query_budget):
+    make_order(3)
+
+    # One extra statement validates statusCode so an unknown code is a 404.
+    with query_budget(3):
+        response = get_orders_handler({"statusCode": "PENDING"})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("item_count", [1, 10])
+def test_get_order_budget(make_order, query_budget, item_count):
+    order_id, _ = make_order(item_count)
+
+    with query_budget(3):
+        response = get_order_handler(str(order_id), {"include": "items,products"})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("item_count", [1, 10])
+def test_get_items_by_order_budget(make_order, query_budget, item_count):
+    order_id, _ = make_order(item_count)
+
+    with query_budget(1):
+        response = get_items_by_order_handler(str(order_id))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("item_count", [1, 10])
+def test_update_items_budget_does_not_grow_with_items(
+    db, make_order, query_budget, item_count
+):
+    order_id, product_ids = make_order(item_count)
+    body = {
+        "listItem": [
+            {"productId": str(product_id), "itemQuantity": 2}
+            for product_id in product_ids
+        ]
+    }
+
+    with query_budget(7):
+        response = update_item_handler(str(order_id), body)
+
+    assert response.status_code == 200, response.body
@@ -0,0 +1,336 @@
+"""EXPLAIN every query the services build and fail on bad plans.
+
+Plans only mean something on realistic row counts, so this suite expects the
+scaled dataset from benchmarks/synthetic_data.py and skips on the small seed
+in SmartSales.sql, where the planner rightly prefers sequential scans.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable
+import pytest
+from sqlalchemy import event, text
+from app import database
+from app.core.sql_metrics import EXPLAINABLE
+from app.schemas.change import ChangeResource
+from app.schemas.order import OrderFilterQuery, OrderInclude
+from app.schemas.order_export import OrderExportFilter
+from app.schemas.pagination import PaginationQuery
+from app.services import change, customer, item, order, order_export, price
+from app.services import product, status, user
+from app.services.partition import PARTITION_NAME
+
+MIN_ORDERS = 100_000
+
+# Tables that grow with the business; status is a fixed lookup table.
+LARGE_TABLES = {
+    "customer",
+    "product",
+    "price",
+    "users",
+    "orders",
+    "item",
+    "orders_archive",
+    "item_archive",
+    "tombstone",
+}
+
+# Planner cost units; index lookups and keyset pages stay far below this.
+DEFAULT_COST_BUDGET = 10_000
+
+
+@dataclass
+class Sample:
+    customer_id: uuid.UUID
+    product_id: uuid.UUID
+    price_id: uuid.UUID
+    user_id: uuid.UUID
+    order_id: uuid.UUID
+    order_date: date
+    customer_name: str
+    product_name: str
+
+
+@dataclass
+class Case:
+    run: Callable
+    cost_budget: float | None = DEFAULT_COST_BUDGET
+    # Large tables a full scan is the right plan for, with the reason.
+    allow_seq_scan: dict[str, str] = field(default_factory=dict)
+
+
+def _orders(**filters) -> OrderFilterQuery:
+    return OrderFilterQuery.model_validate(filters)
+
+
+def _export(db, s, **filters):
+    return list(order_export.stream_export_rows(db, OrderExportFilter(**filters)))
+
+
+SEARCH_JOIN = {
+    "orders": "search ORs over customer, user and status columns after the "
+    "join, so no single orders index applies"
+}
+WHOLE_YEAR = {"orders": "aggregates every order of the last 12 months"}
+
+ORDER_FILTERS = {
+    "none": {},
+    "user_id": {"user_id": "{user_id}"},
+    "customer_id": {"customer_id": "{customer_id}"},
+    "status_code": {"status_code": "PENDING"},
+    "order_date": {"order_date": "{order_date}"},
+    "search": {"search": "{customer_name}"},
+}
+
+
+def _since(days: int) -> list:
+    # An incremental sync token: reads both the changed rows and tombstones.
+    start = datetime.now() - timedelta(days=days)
+    return [start, change.MIN_ROW_ID, start, change.MIN_TOMBSTONE_ID]
+
+
+def _fill(filters: dict, s: Sample) -> dict:
+    return {key: value.format(**vars(s)) for key, value in filters.items()}
+
+
+CASES: dict[str, Case] = {
+    # customers
+    "customer.get_customer": Case(
+        lambda db, s: customer.get_customer(db, s.customer_id)
+    ),
+    "customer.get_customer_by_email": Case(
+        lambda db, s: customer.get_customer_by_email(db, "nobody@example.com")
+    ),
+    "customer.get_customer_fingerprint": Case(
+        lambda db, s: customer.get_customer_fingerprint(db, s.customer_id)
+    ),
+    "customer.get_customers_fingerprint": Case(
+        lambda db, s: customer.get_customers_fingerprint(db)
+    ),
+    "customer.get_all_customers": Case(
+        lambda db, s: customer.get_all_customers(db, PaginationQuery())
+    ),
+    "customer.search_customers": Case(
+        lambda db, s: customer.search_customers(db, s.customer_name, PaginationQuery())
+    ),
+    "customer.autocomplete_customers": Case(
+        lambda db, s: customer.autocomplete_customers(db, s.customer_name[:3], 10)
+    ),
+    # products and prices
+    "product.get_product": Case(lambda db, s: product.get_product(db, s.product_id)),
+    "product.get_product_fingerprint": Case(
+        lambda db, s: product.get_product_fingerprint(db, s.product_id)
+    ),
+    "product.get_products_fingerprint": Case(
+        lambda db, s: product.get_products_fingerprint(db)
+    ),
+    "product.get_all_products": Case(
+        lambda db, s: product.get_all_products(db, PaginationQuery())
+    ),
+    "product.search_products": Case(
+        lambda db, s: product.search_products(db, s.product_name, PaginationQuery())
+    ),
+    "product.autocomplete_products": Case(
+        lambda db, s: product.autocomplete_products(db, s.product_name[:3], 10)
+    ),
+    "price.get_price": Case(lambda db, s: price.get_price(db, s.price_id)),
+    "price.get_prices_by_product": Case(
+        lambda db, s: price.get_prices_by_product(db, s.product_id)
+    ),
+    "price.get_all_prices": Case(
+        lambda db, s: price.get_all_prices(db, PaginationQuery())
+    ),
+    "item.get_current_prices": Case(
+        lambda db, s: item.get_current_prices(db, [s.product_id], date.today())
+    ),
+    # users and statuses
+    "user.get_user": Case(lambda db, s: user.get_user(db, s.user_id)),
+    "user.get_user_by_account": Case(
+        lambda db, s: user.get_user_by_account(db, "nobody")
+    ),
+    "user.get_user_by_email": Case(
+        lambda db, s: user.get_user_by_email(db, "nobody@example.com")
+    ),
+    "user.get_all_users": Case(lambda db, s: user.get_all_users(db, PaginationQuery())),
+    "status.get_status_by_code": Case(
+        lambda db, s: status.get_status_by_code(db, "PENDING")
+    ),
+    # orders and items
+    "order.get_order": Case(
+        lambda db, s: order.get_order(
+            db, s.order_id, frozenset(OrderInclude), include_archived=False
+        )
+    ),
+    "order.get_order_archived": Case(
+        lambda db, s: order.get_order(db, uuid.uuid4(), frozenset(OrderInclude))
+    ),
+    "order.get_order_fingerprint": Case(
+        lambda db, s: order.get_order_fingerprint(
+            db, s.order_id, frozenset(OrderInclude)
+        )
+    ),
+    "item.get_item": Case(lambda db, s: item.get_item(db, s.order_id, s.product_id)),
+    "item.get_items_by_order": Case(
+        lambda db, s: item.get_items_by_order(db, s.order_id)
+    ),
+    "item.get_all_items": Case(lambda db, s: item.get_all_items(db, PaginationQuery())),
+    "order.get_total_orders_in_7_days": Case(
+        lambda db, s: order.get_total_orders_in_7_days(db), cost_budget=None
+    ),
+    "order.get_total_revenue_in_7_days": Case(
+        lambda db, s: order.get_total_revenue_in_7_days(db), cost_budget=None
+    ),
+    "order.get_total_revenue_in_12_months": Case(
+        lambda db, s: order.get_total_revenue_in_12_months(db),
+        cost_budget=None,
+        allow_seq_scan=WHOLE_YEAR,
+    ),
+    "item.get_top_product_summary": Case(
+        lambda db, s: item.get_top_product_summary(db), cost_budget=None
+    ),
+    **{
+        f"order.get_orders[{name}]": Case(
+            # The handler passes the fingerprint's count in as total_count.
+            lambda db, s, filters=filters: order.get_orders(
+                db, _orders(**_fill(filters, s)), total_count=0
+            ),
+            cost_budget=None if name == "search" else DEFAULT_COST_BUDGET,
+            allow_seq_scan=SEARCH_JOIN if name == "search" else {},
+        )
+        for name, filters in ORDER_FILTERS.items()
+    },
+    **{
+        f"order.get_orders_fingerprint[{name}]": Case(
+            lambda db, s, filters=filters: order.get_orders_fingerprint(
+                db, _orders(**_fill(filters, s))
+            ),
+            # Counting every match is the point of the fingerprint.
+            cost_budget=None,
+            allow_seq_scan=SEARCH_JOIN if name == "search" else {},
+        )
+        for name, filters in ORDER_FILTERS.items()
+        if name != "none"
+    },
+    "order.get_orders_fingerprint[none]": Case(
+        lambda db, s: order.get_orders_fingerprint(db, _orders()),
+        cost_budget=None,
+        allow_seq_scan={"orders": "counts every order"},
+    ),
+    "order_export.stream_export_rows[customer_id]": Case(
+        lambda db, s: _export(db, s, customer_id=s.customer_id), cost_budget=None
+    ),
+    # change feed
+    **{
+        f"change.get_changes[{resource.value}]": Case(
+            lambda db, s, resource=resource: change.get_changes(
+                db, resource, _since(days=1), 100
+            )
+        )
+        for resource in ChangeResource
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def sample(connection) -> Sample:
+    orders = connection.execute(
+        text(
+            "SELECT coalesce(sum(c.reltuples), 0) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'orders'::regclass"
+        )
+    ).scalar_one()
+    if orders < MIN_ORDERS:
+        pytest.skip(
+            f"{int(orders)} orders; load benchmarks/synthetic_data.py "
+            f"(at least {MIN_ORDERS}) for meaningful plans"
+        )
+
+    row = connection.execute(
+        text(
+            """
+            SELECT o.order_id, o.order_date, o.customer_id, o.user_id,
+                   i.product_id, p.price_id, c.customer_name, pr.product_name
+            FROM orders o
+            JOIN item i ON i.order_id = o.order_id
+            JOIN price p ON p.product_id = i.product_id
+            JOIN customer c ON c.customer_id = o.customer_id
+            JOIN product pr ON pr.product_id = i.product_id
+            WHERE o.order_date >= CURRENT_DATE - 30
+            LIMIT 1
+            """
+        )
+    ).one()
+    return Sample(
+        customer_id=row.customer_id,
+        product_id=row.product_id,
+        price_id=row.price_id,
+        user_id=row.user_id,
+        order_id=row.order_id,
+        order_date=row.order_date.date(),
+        customer_name=row.customer_name.split()[0],
+        product_name=row.product_name.split()[0],
+    )
+
+
+def _capture(run: Callable) -> list[tuple[str, object]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(EXPLAINABLE):
+            statements.append((statement, parameters))
+
+    event.listen(database.engine, "before_cursor_execute", record)
+    try:
+        run()
+    finally:
+        event.remove(database.engine, "before_cursor_execute", record)
+    return statements
+
+
+def _nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _table(relation: str) -> str:
+    return "orders" if PARTITION_NAME.match(relation) else relation
+
+
+def _explain(db, statement: str, parameters) -> dict:
+    result = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_query_plan(db, sample, name):
+    case = CASES[name]
+    customer.autocomplete_cache.clear()
+    product.autocomplete_cache.clear()
+
+    statements = _capture(lambda: case.run(db, sample))
+    assert statements, f"{name} ran no SQL"
+
+    problems = []
+    for statement, parameters in statements:
+        plan = _explain(db, statement, parameters)
+        for node in _nodes(plan):
+            table = _table(node.get("Relation Name", ""))
+            if (
+                node["Node Type"] == "Seq Scan"
+                and table in LARGE_TABLES
+                and table not in case.allow_seq_scan
+            ):
+                problems.append(f"Seq Scan on {node['Relation Name']}:\n{statement}")
+        if case.cost_budget is not None and plan["Total Cost"] > case.cost_budget:
+            problems.append(
+                f"cost {plan['Total Cost']} > {case.cost_budget}:\n{statement}"
+            )
+
+    assert not problems, "\n\n".join(problems)
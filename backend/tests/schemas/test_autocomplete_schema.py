@@ -0,0 +1,35 @@
+import pytest
+from app.schemas.autocomplete import AutocompleteQuery
+from pydantic import ValidationError
+
+
+# Basic valid case
+def test_autocomplete_query_valid() -> None:
+    query = AutocompleteQuery.model_validate({"query": " Jo ", "limit": "5"})
+    assert query.query == "Jo"
+    assert query.limit == 5
+
+
+# Default limit
+def test_autocomplete_query_default_limit() -> None:
+    query = AutocompleteQuery.model_validate({"query": "Jo"})
+    assert query.limit == 10
+
+
+# Missing query
+def test_autocomplete_query_missing_query() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        AutocompleteQuery.model_validate({})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("query",)
+    assert error["type"] == "missing"
+
+
+# Limit above the maximum
+def test_autocomplete_query_limit_too_large() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        AutocompleteQuery.model_validate({"query": "Jo", "limit": "50"})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("limit",)
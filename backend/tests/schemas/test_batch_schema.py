@@ -0,0 +1,71 @@
+import pytest
+from app.schemas.batch import BatchMethod, BatchRequest, MAX_BATCH_SIZE
+from pydantic import ValidationError
+
+
+# Basic valid case
+def test_batch_request_valid() -> None:
+    batch = BatchRequest.model_validate(
+        {
+            "requests": [
+                {"id": "1", "method": "get", "path": "/orders?limit=5"},
+                {"method": "POST", "path": "/customers", "body": {"a": 1}},
+            ]
+        }
+    )
+    assert batch.requests[0].method == BatchMethod.GET
+    assert batch.requests[0].path == "/orders?limit=5"
+    assert batch.requests[1].id is None
+    assert batch.requests[1].body == {"a": 1}
+
+
+# Empty batch
+def test_batch_request_empty() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        BatchRequest.model_validate({"requests": []})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("requests",)
+    assert error["type"] == "too_short"
+
+
+# Too many sub-requests
+def test_batch_request_too_large() -> None:
+    requests = [{"method": "GET", "path": "/orders"}] * (MAX_BATCH_SIZE + 1)
+    with pytest.raises(ValidationError) as exc_info:
+        BatchRequest.model_validate({"requests": requests})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("requests",)
+    assert error["type"] == "too_long"
+
+
+# Unsupported method
+def test_batch_request_invalid_method() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        BatchRequest.model_validate({"requests": [{"method": "HEAD", "path": "/"}]})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("requests", 0, "method")
+    assert error["type"] == "enum"
+
+
+# Relative path
+def test_batch_request_relative_path() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        BatchRequest.model_validate({"requests": [{"method": "GET", "path": "orders"}]})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("requests", 0, "path")
+    assert error["type"] == "value_error"
+
+
+# Nested batch
+@pytest.mark.parametrize("path", ["/batch", "/batch/", "/batch?x=1"])
+def test_batch_request_nested_batch(path: str) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        BatchRequest.model_validate({"requests": [{"method": "POST", "path": path}]})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("requests", 0, "path")
+    assert "nested" in error["msg"]
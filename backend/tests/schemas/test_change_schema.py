@@ -0,0 +1,48 @@
+import pytest
+from app.core.pagination import encode_cursor
+from app.schemas.change import ChangeQuery, ChangeResource, MAX_CHANGES_LIMIT
+from pydantic import ValidationError
+
+
+# First sync: no token
+def test_change_query_without_since() -> None:
+    query = ChangeQuery.model_validate({"resource": "products"})
+    assert query.resource == ChangeResource.PRODUCTS
+    assert query.since is None
+
+
+# Token is decoded
+def test_change_query_with_since() -> None:
+    token = encode_cursor(["2025-01-01T00:00:00", "a", "2025-01-01T00:00:00", 3])
+    query = ChangeQuery.model_validate({"resource": "orders", "since": token})
+    assert query.since == ["2025-01-01T00:00:00", "a", "2025-01-01T00:00:00", 3]
+
+
+# Unknown resource
+def test_change_query_invalid_resource() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        ChangeQuery.model_validate({"resource": "items"})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("resource",)
+    assert error["type"] == "enum"
+
+
+# Limit above the maximum
+def test_change_query_limit_too_large() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        ChangeQuery.model_validate(
+            {"resource": "users", "limit": str(MAX_CHANGES_LIMIT + 1)}
+        )
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("limit",)
+
+
+# Malformed token
+def test_change_query_invalid_since() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        ChangeQuery.model_validate({"resource": "users", "since": "not-a-token"})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("since",)
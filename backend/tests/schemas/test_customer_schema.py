@@ -1,5 +1,11 @@
 import pytest
-from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerIdPath
+from app.schemas.customer import (
+    CustomerBulkCreate,
+    CustomerCreate,
+    CustomerImportRow,
+    CustomerUpdate,
+    CustomerIdPath,
+)
 from pydantic import ValidationError
 import uuid
 
@@ -182,3 +188,79 @@ def test_customer_id_path_invalid(customer_id: str) -> None:
 
     assert error["loc"] == ("customer_id",)
     assert "input should be a valid uuid" in error["msg"].lower()
+
+
+def test_customer_import_row_valid() -> None:
+    row = CustomerImportRow.model_validate(
+        {
+            "customerName": "Alice Peterson",
+            "customerEmail": "alice.peterson@gmail.com",
+            "customerPhone": "12025550107",
+        }
+    )
+
+    assert row.customer_phone == "+12025550107"
+
+
+# Values that would not fit the customer columns are row errors, not COPY errors
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("customer_name", ""),
+        ("customer_name", "A" * 51),
+        ("customer_email", ("a" * 30) + "@example.com"),
+        ("customer_phone", "123456789012345"),
+    ],
+)
+def test_customer_import_row_too_long(field: str, value: str) -> None:
+    data = {
+        "customer_name": "Alice Peterson",
+        "customer_email": "alice.peterson@gmail.com",
+        "customer_phone": "+12025550107",
+        field: value,
+    }
+
+    with pytest.raises(ValidationError) as exc_info:
+        CustomerImportRow.model_validate(data)
+
+    assert exc_info.value.errors()[0]["loc"] == (field,)
+
+
+@pytest.mark.parametrize("customers", [[], [{}] * 20001])
+def test_customer_bulk_create_size_limits(customers: list) -> None:
+    with pytest.raises(ValidationError):
+        CustomerBulkCreate(customers=customers)
+
+
+# The cached-domain fast path must agree with EmailStr on every address
+@pytest.mark.parametrize(
+    "email",
+    [
+        "a@Example.COM",
+        "John.Doe@gmail.com",
+        "a+tag@sub.domain.io",
+        "a@xn--bcher-kva.de",
+        "ü@example.com",
+        " a@example.com",
+        "a..b@example.com",
+        ".a@example.com",
+        "a@example.local",
+        "a@localhost",
+        "a@-x.com",
+        "a@b@example.com",
+        '"quoted"@example.com',
+    ],
+)
+def test_customer_import_row_email_matches_customer_create(email: str) -> None:
+    def validate(model):
+        data = {
+            "customer_name": "Alice Peterson",
+            "customer_email": email,
+            "customer_phone": "+12025550107",
+        }
+        try:
+            return model.model_validate(data).customer_email
+        except ValidationError:
+            return None
+
+    assert validate(CustomerImportRow) == validate(CustomerCreate)
@@ -1,5 +1,10 @@
 import pytest
-from app.schemas.order import OrderCreate, OrderIdPath
+from app.schemas.order import (
+    OrderCreate,
+    OrderIdPath,
+    OrderDetailQuery,
+    OrderInclude,
+)
 from pydantic import ValidationError
 import uuid
 
@@ -78,3 +83,28 @@ def test_order_id_path_invalid(order_id: str) -> None:
 
     assert error["loc"] == ("order_id",)
     assert "input should be a valid uuid" in error["msg"].lower()
+
+
+# include= is split on commas and expands implied relations
+def test_order_detail_query_include_expansion() -> None:
+    query = OrderDetailQuery.model_validate({"include": "prices"})
+    assert query.include == {
+        OrderInclude.ITEMS,
+        OrderInclude.PRODUCTS,
+        OrderInclude.PRICES,
+    }
+
+
+# No include means only the order and its direct relations
+def test_order_detail_query_default_include() -> None:
+    query = OrderDetailQuery.model_validate({})
+    assert query.include == frozenset()
+
+
+# Unknown include value
+def test_order_detail_query_invalid_include() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        OrderDetailQuery.model_validate({"include": "items,payments"})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"][0] == "include"
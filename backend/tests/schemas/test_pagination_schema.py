@@ -0,0 +1,65 @@
+import pytest
+from app.core.pagination import encode_cursor
+from app.schemas.pagination import PaginationQuery, SearchQuery
+from pydantic import ValidationError
+import uuid
+
+
+# Defaults when no pagination params are given
+def test_pagination_query_defaults() -> None:
+    query = PaginationQuery.model_validate({})
+    assert query.limit == 20
+    assert query.cursor is None
+    assert query.direction == "next"
+
+
+# Opaque cursor is decoded into its key values
+def test_pagination_query_decodes_cursor() -> None:
+    customer_id = uuid.uuid4()
+    cursor = encode_cursor(("Alice Peterson", customer_id))
+
+    query = PaginationQuery.model_validate({"cursor": cursor, "direction": "prev"})
+
+    assert query.cursor == ["Alice Peterson", str(customer_id)]
+    assert query.direction == "prev"
+
+
+# Limit must stay within bounds
+@pytest.mark.parametrize("limit", ["0", "101"])
+def test_pagination_query_invalid_limit(limit: str) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        PaginationQuery.model_validate({"limit": limit})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("limit",)
+
+
+# Garbage cursor is rejected
+def test_pagination_query_invalid_cursor() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        PaginationQuery.model_validate({"cursor": "not-a-cursor"})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("cursor",)
+
+
+# Unknown direction is rejected
+def test_pagination_query_invalid_direction() -> None:
+    with pytest.raises(ValidationError):
+        PaginationQuery.model_validate({"direction": "sideways"})
+
+
+# Search keyword is stripped
+def test_search_query_strips_keyword() -> None:
+    query = SearchQuery.model_validate({"query": "  Peterson ", "limit": "5"})
+    assert query.query == "Peterson"
+    assert query.limit == 5
+
+
+# Blank search keyword is rejected
+def test_search_query_blank_keyword() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        SearchQuery.model_validate({"query": "   "})
+    error = exc_info.value.errors()[0]
+
+    assert error["loc"] == ("query",)
@@ -0,0 +1,200 @@
+import pytest
+
+# pyarrow is in requirements-analytics.txt, not the shared requirements.
+pytest.importorskip("pyarrow")
+
+from app.analytics import queries
+from app.analytics import snapshot
+from app.analytics.summary import read_dashboard_summary
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy.dialects import postgresql
+from unittest.mock import MagicMock
+import uuid
+
+SnapshotRow = namedtuple(
+    "SnapshotRow",
+    [
+        "order_id",
+        "order_date",
+        "status_code",
+        "order_total",
+        "customer_id",
+        "customer_name",
+        "user_id",
+        "user_name",
+        "updated_at",
+        "product_id",
+        "product_name",
+        "item_quantity",
+        "item_price",
+        "item_updated_at",
+    ],
+)
+
+TODAY = date(2025, 3, 10)
+LAPTOP = uuid.uuid4()
+PHONE = uuid.uuid4()
+
+
+def _rows(
+    order_id: uuid.UUID,
+    day: date,
+    status_code: str,
+    items: list[tuple[uuid.UUID, str, int, str]],
+    customer: str = "Jane",
+) -> list[SnapshotRow]:
+    order_date = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+    total = sum(Decimal(price) * quantity for _, _, quantity, price in items)
+    base = dict(
+        order_id=order_id,
+        order_date=order_date,
+        status_code=status_code,
+        order_total=total,
+        customer_id=uuid.uuid5(uuid.NAMESPACE_DNS, customer),
+        customer_name=customer,
+        user_id=uuid.uuid4(),
+        user_name="Sam",
+        updated_at=order_date,
+    )
+    if not items:
+        return [
+            SnapshotRow(
+                **base,
+                product_id=None,
+                product_name=None,
+                item_quantity=None,
+                item_price=None,
+                item_updated_at=None,
+            )
+        ]
+    return [
+        SnapshotRow(
+            **base,
+            product_id=product_id,
+            product_name=name,
+            item_quantity=quantity,
+            item_price=Decimal(price),
+            item_updated_at=order_date,
+        )
+        for product_id, name, quantity, price in items
+    ]
+
+
+def _db(rows: list[SnapshotRow], now: datetime) -> MagicMock:
+    db = MagicMock()
+    clock = MagicMock()
+    clock.scalar_one.return_value = now
+    db.execute.side_effect = [clock, iter(rows)]
+    return db
+
+
+@pytest.fixture
+def first_order() -> uuid.UUID:
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def uri(tmp_path, first_order) -> str:
+    uri = str(tmp_path / "analytics")
+    rows = (
+        _rows(first_order, TODAY - timedelta(days=1), "PAID", [(LAPTOP, "Laptop", 2, "500.00")])
+        + _rows(
+            uuid.uuid4(),
+            TODAY - timedelta(days=1),
+            "PENDING",
+            [(PHONE, "Phone", 1, "300.00"), (LAPTOP, "Laptop", 1, "500.00")],
+            customer="John",
+        )
+        + _rows(uuid.uuid4(), TODAY, "CANCELLED", [(PHONE, "Phone", 5, "300.00")])
+        + _rows(uuid.uuid4(), TODAY, "PENDING", [])
+    )
+    snapshot.run_snapshot(_db(rows, datetime(2025, 3, 10, 12)), uri)
+    return uri
+
+
+def test_run_snapshot_writes_partitions(uri) -> None:
+    fs, root = snapshot.get_filesystem(uri)
+
+    assert snapshot.read_watermark(fs, root) == datetime(2025, 3, 10, 12) - snapshot.SNAPSHOT_LAG
+    for table in (snapshot.ORDERS_TABLE, snapshot.ITEMS_TABLE):
+        for day in (TODAY - timedelta(days=1), TODAY):
+            path = snapshot.partition_path(root, table, day)
+            assert fs.get_file_info(path).is_file
+
+
+def test_orders_and_revenue_by_day_exclude_cancelled(uri) -> None:
+    yesterday = TODAY - timedelta(days=1)
+
+    assert queries.orders_by_day(yesterday, TODAY, uri) == {yesterday: 2, TODAY: 1}
+    assert queries.revenue_by_day(yesterday, TODAY, uri) == {yesterday: 1800.0, TODAY: 0.0}
+    assert queries.revenue_by_month(yesterday, TODAY, uri) == {"2025-03": 1800.0}
+
+
+def test_top_products_and_customers(uri) -> None:
+    products = queries.top_products(TODAY - timedelta(days=6), TODAY, uri=uri)
+    customers = queries.top_customers(TODAY - timedelta(days=6), TODAY, uri=uri)
+
+    assert [(p["product_name"], p["revenue"], p["quantity"]) for p in products] == [
+        ("Laptop", 1500.0, 3),
+        ("Phone", 300.0, 1),
+    ]
+    assert [(c["customer_name"], c["revenue"], c["orders"]) for c in customers] == [
+        ("Jane", 1000.0, 2),
+        ("John", 800.0, 1),
+    ]
+
+
+def test_dashboard_summary(uri) -> None:
+    summary = queries.dashboard_summary(TODAY, uri)
+
+    assert len(summary.total_orders) == queries.DAYS_RANGE + 1
+    assert summary.total_orders[-2].total == 2
+    assert summary.total_revenue[-2].total == 1800.0
+    assert summary.monthly_revenue[-1].key == "2025-03"
+    assert summary.top_products[0].key == "Laptop"
+
+
+def test_written_dashboard_summary_reads_back_without_pyarrow(uri) -> None:
+    summary = queries.dashboard_summary(TODAY, uri)
+
+    queries.write_dashboard_summary(summary, uri)
+
+    assert read_dashboard_summary(uri) == summary
+
+
+def test_incremental_run_replaces_changed_orders(uri, first_order) -> None:
+    # The order lost its laptop and gained phones since the first run.
+    changed = _rows(
+        first_order, TODAY - timedelta(days=1), "PAID", [(PHONE, "Phone", 2, "300.00")]
+    )
+    snapshot.run_snapshot(_db(changed, datetime(2025, 3, 10, 13)), uri)
+
+    products = queries.top_products(TODAY - timedelta(days=6), TODAY, uri=uri)
+    assert [(p["product_name"], p["quantity"]) for p in products] == [
+        ("Phone", 3),
+        ("Laptop", 1),
+    ]
+    assert queries.orders_by_day(TODAY - timedelta(days=1), TODAY, uri)[
+        TODAY - timedelta(days=1)
+    ] == 2
+
+
+def test_queries_without_snapshot(tmp_path) -> None:
+    uri = str(tmp_path / "missing")
+
+    assert queries.orders_by_day(TODAY, TODAY, uri) == {}
+    assert queries.top_products(TODAY, TODAY, uri=uri) == []
+
+
+# Item-only changes still select the whole order
+def test_snapshot_statement_incremental() -> None:
+    sql = str(
+        snapshot._snapshot_statement(datetime(2025, 3, 1)).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "orders.updated_at >" in sql
+    assert "EXISTS (SELECT" in sql
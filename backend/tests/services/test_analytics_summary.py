@@ -0,0 +1,80 @@
+from datetime import date
+from unittest.mock import MagicMock
+from botocore.exceptions import ClientError
+import pytest
+from app.analytics import summary
+from app.handlers import order as order_handler
+from app.schemas.order import (
+    DashboardSummaryResponse,
+    TopProductSummaryResponse,
+    TotalOrdersSummaryResponse,
+)
+
+SUMMARY = DashboardSummaryResponse(
+    total_orders=[TotalOrdersSummaryResponse(key=date(2025, 1, 2), total=3)],
+    total_revenue=[],
+    monthly_revenue=[],
+    top_products=[TopProductSummaryResponse(key="Widget", total=12.5)],
+)
+
+
+@pytest.fixture
+def snapshot_source(monkeypatch, tmp_path):
+    monkeypatch.setattr(order_handler, "DASHBOARD_SOURCE", "snapshot")
+    monkeypatch.setattr(
+        order_handler,
+        "read_dashboard_summary",
+        lambda: summary.read_dashboard_summary(str(tmp_path)),
+    )
+    return tmp_path / summary.SUMMARY_FILE
+
+
+def test_dashboard_is_served_from_the_snapshot(snapshot_source, monkeypatch):
+    snapshot_source.write_text(SUMMARY.model_dump_json(by_alias=True))
+    database = MagicMock()
+    monkeypatch.setattr(order_handler, "get_total_orders_in_7_days_handler", database)
+
+    response = order_handler.get_dashboard_summary_handler()
+
+    assert response.status_code == 200
+    assert response.body["totalOrders"] == [{"key": "2025-01-02", "total": 3}]
+    assert response.body["topProducts"] == [{"key": "Widget", "total": 12.5}]
+    database.assert_not_called()
+
+
+def test_dashboard_falls_back_to_the_database_before_the_first_snapshot(
+    snapshot_source, monkeypatch
+):
+    for name in (
+        "get_total_orders_in_7_days_handler",
+        "get_total_revenue_in_7_days_handler",
+        "get_total_revenue_in_12_months_handler",
+        "get_top_product_summary_handler",
+    ):
+        monkeypatch.setattr(order_handler, name, lambda: [])
+
+    response = order_handler.get_dashboard_summary_handler()
+
+    assert response.status_code == 200
+    assert response.body["totalOrders"] == []
+
+
+def test_unreadable_snapshot_is_an_internal_error(snapshot_source):
+    snapshot_source.write_text("not json")
+
+    response = order_handler.get_dashboard_summary_handler()
+
+    assert response.status_code == 500
+
+
+def test_missing_s3_summary_reads_as_none(monkeypatch):
+    client = MagicMock()
+    client.get_object.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+    )
+    monkeypatch.setattr(summary, "get_s3_client", lambda: client)
+
+    assert summary.read_dashboard_summary("s3://bucket/analytics") is None
+    client.get_object.assert_called_once_with(
+        Bucket="bucket", Key="analytics/dashboard.json"
+    )
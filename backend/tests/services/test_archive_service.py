@@ -0,0 +1,73 @@
+from app.services import archive as service
+from app.services.item import get_items_by_order, NotFoundError
+from app.models import ArchivedItem
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from tests.conftest import MagicMock
+import pytest
+import uuid
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_archive_batch_moves_items_then_orders(mock_session: MagicMock):
+    order_ids = [uuid.uuid4(), uuid.uuid4()]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = order_ids
+    mock_session.execute.return_value.rowcount = 2
+
+    orders, items = service.archive_batch(mock_session, NOW, 100)
+
+    statements = [call.args[0] for call in mock_session.execute.call_args_list]
+    assert "FOR UPDATE OF orders SKIP LOCKED" in _sql(statements[0])
+    assert "smart_sales.archiving" in str(statements[1])
+    assert "DELETE FROM item" in _sql(statements[2])
+    assert "INSERT INTO item_archive" in _sql(statements[2])
+    assert "DELETE FROM orders" in _sql(statements[3])
+    assert "INSERT INTO orders_archive" in _sql(statements[3])
+    assert (orders, items) == (2, 2)
+    mock_session.commit.assert_called_once()
+
+
+def test_archive_batch_without_candidates(mock_session: MagicMock):
+    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+
+    assert service.archive_batch(mock_session, NOW, 100) == (0, 0)
+    mock_session.execute.assert_called_once()
+    mock_session.commit.assert_not_called()
+
+
+def test_run_archive_stops_on_partial_batch(monkeypatch, mock_session: MagicMock):
+    batches = iter([(100, 250), (40, 90), (0, 0)])
+    monkeypatch.setattr(
+        service, "archive_batch", lambda db, cutoff, size: next(batches)
+    )
+
+    result = service.run_archive(mock_session, now=NOW, after_days=30, batch_size=100)
+
+    assert result.cutoff == datetime(2025, 5, 2, 12, 0)
+    assert (result.orders, result.items, result.batches) == (140, 340, 2)
+
+
+def test_get_items_by_order_reads_through_to_archive(mock_session: MagicMock):
+    archived = [ArchivedItem(order_id=uuid.uuid4(), product_id=uuid.uuid4())]
+    mock_session.execute.return_value.scalars.return_value.all.side_effect = [
+        [],
+        archived,
+    ]
+    mock_session.execute.return_value.scalar.return_value = False
+
+    assert get_items_by_order(mock_session, archived[0].order_id) == archived
+
+
+def test_get_items_by_order_missing_everywhere(mock_session: MagicMock):
+    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+    mock_session.execute.return_value.scalar.return_value = False
+
+    with pytest.raises(NotFoundError):
+        get_items_by_order(mock_session, uuid.uuid4())
+
+    assert mock_session.execute.call_count == 4
@@ -0,0 +1,155 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import uuid
+from passlib.context import CryptContext
+import pytest
+from app.core import auth
+from app.main import app as api
+from app.services import user as user_service
+
+
+@pytest.fixture(autouse=True)
+def secret(monkeypatch):
+    monkeypatch.setenv("AUTH_TOKEN_SECRET", "test-secret")
+    auth.signing_key.cache_clear()
+    yield
+    auth.signing_key.cache_clear()
+
+
+def _app(method="GET", resource="/customers", headers=None):
+    app = MagicMock()
+    app.current_event = SimpleNamespace(
+        http_method=method, resource=resource, headers=headers or {}
+    )
+    return app
+
+
+def test_token_round_trip():
+    user_id = uuid.uuid4()
+
+    claims = auth.verify_token(auth.issue_token(user_id, now=1000), now=1001)
+
+    assert claims.user_id == user_id
+    assert claims.expires_at == 1000 + auth.AUTH_TOKEN_TTL_SECONDS
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    [
+        lambda token: token[:-2] + ("AA" if token[-2:] != "AA" else "BB"),
+        lambda token: "e30" + token[token.index(".") :],
+        lambda token: token.split(".")[0],
+        lambda token: "not a token",
+    ],
+)
+def test_tampered_tokens_are_rejected(tamper):
+    token = auth.issue_token(uuid.uuid4())
+
+    with pytest.raises(auth.InvalidTokenError, match="Invalid token"):
+        auth.verify_token(tamper(token))
+
+
+def test_expired_token_is_rejected():
+    token = auth.issue_token(uuid.uuid4(), now=1000)
+
+    with pytest.raises(auth.InvalidTokenError, match="expired"):
+        auth.verify_token(token, now=1000 + auth.AUTH_TOKEN_TTL_SECONDS)
+
+
+def test_token_from_another_key_is_rejected(monkeypatch):
+    token = auth.issue_token(uuid.uuid4())
+    monkeypatch.setenv("AUTH_TOKEN_SECRET", "rotated")
+    auth.signing_key.cache_clear()
+
+    with pytest.raises(auth.InvalidTokenError):
+        auth.verify_token(token)
+
+
+def test_middleware_attaches_user_id_for_a_valid_token():
+    user_id = uuid.uuid4()
+    app = _app(headers={"authorization": f"Bearer {auth.issue_token(user_id)}"})
+    next_middleware = MagicMock(return_value="response")
+
+    assert auth.authenticate(app, next_middleware) == "response"
+    app.append_context.assert_called_once_with(user_id=user_id)
+
+
+def test_middleware_rejects_an_invalid_token():
+    app = _app(headers={"Authorization": "Bearer forged.token"})
+    next_middleware = MagicMock()
+
+    response = auth.authenticate(app, next_middleware)
+
+    assert response.status_code == 401
+    next_middleware.assert_not_called()
+
+
+@pytest.mark.parametrize("required, status", [(False, "response"), (True, 401)])
+def test_middleware_without_a_token(monkeypatch, required, status):
+    monkeypatch.setattr(auth, "AUTH_REQUIRED", required)
+    next_middleware = MagicMock(return_value="response")
+
+    response = auth.authenticate(_app(), next_middleware)
+
+    assert getattr(response, "status_code", response) == status
+
+
+def test_requests_without_a_token_are_logged_until_auth_is_required(monkeypatch):
+    monkeypatch.setattr(auth, "AUTH_REQUIRED", False)
+
+    with patch.object(auth.logger, "info") as info:
+        auth.authenticate(_app(), MagicMock())
+
+    assert info.call_args.args[0] == "Unauthenticated request"
+
+
+def test_api_does_not_print_raw_events():
+    # Debug mode would print login bodies and Authorization headers.
+    assert api._debug is False
+
+
+def test_login_route_is_public_when_auth_is_required(monkeypatch):
+    monkeypatch.setattr(auth, "AUTH_REQUIRED", True)
+    next_middleware = MagicMock(return_value="response")
+
+    app = _app(method="POST", resource="/auth/login")
+
+    assert auth.authenticate(app, next_middleware) == "response"
+
+
+def test_authenticate_user_rehashes_below_current_cost(mock_session, monkeypatch):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password1")
+    user = SimpleNamespace(user_password=old_hash)
+    monkeypatch.setattr(
+        user_service,
+        "pwd_context",
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=5, bcrypt__min_rounds=5),
+    )
+
+    with patch.object(user_service, "get_user_by_account", return_value=user):
+        assert user_service.authenticate_user(mock_session, "ada", "password1")
+
+    assert user.user_password != old_hash
+    assert "$05$" in user.user_password
+    mock_session.commit.assert_called_once()
+
+
+def test_authenticate_user_rejects_wrong_password(mock_session, monkeypatch):
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    user = SimpleNamespace(user_password=context.hash("password1"))
+    monkeypatch.setattr(user_service, "pwd_context", context)
+
+    with patch.object(user_service, "get_user_by_account", return_value=user):
+        assert user_service.authenticate_user(mock_session, "ada", "wrong") is None
+
+    mock_session.commit.assert_not_called()
+
+
+def test_unknown_account_still_pays_for_a_verify(mock_session, monkeypatch):
+    context = MagicMock()
+    monkeypatch.setattr(user_service, "pwd_context", context)
+
+    with patch.object(user_service, "get_user_by_account", return_value=None):
+        assert user_service.authenticate_user(mock_session, "nobody", "x") is None
+
+    context.dummy_verify.assert_called_once()
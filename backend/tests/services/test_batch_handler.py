@@ -0,0 +1,160 @@
+import json
+from types import SimpleNamespace
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler.api_gateway import BaseRouter
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+import pytest
+from app import database
+from app.handlers import batch as batch_module
+from app.handlers.batch import batch_handler
+from app.schemas.batch import BATCH_PATH
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(batch_module, "time", clock)
+    monkeypatch.setattr(batch_module, "BATCH_TIME_BUDGET_MS", 10_000)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def sqlite_database(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE note (body TEXT)"))
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(
+        database, "SessionLocal", sessionmaker(autoflush=False, bind=engine)
+    )
+
+
+@pytest.fixture
+def resolver(clock):
+    app = APIGatewayRestResolver()
+    seen_events = []
+
+    @app.post("/notes")
+    def add_note():
+        with database.get_db() as db:
+            db.execute(text("INSERT INTO note VALUES ('kept')"))
+            db.commit()
+        return {"added": True}
+
+    @app.post("/broken")
+    def broken():
+        with database.get_db() as db:
+            # Left uncommitted: the batch must roll it back.
+            db.execute(text("INSERT INTO note VALUES ('lost')"))
+        raise RuntimeError("boom")
+
+    @app.get("/notes")
+    def list_notes():
+        with database.get_db() as db:
+            notes = db.execute(text("SELECT body FROM note")).scalars().all()
+        return {"notes": notes}
+
+    @app.post("/slow")
+    def slow():
+        clock.now += 60
+        return {"slow": True}
+
+    @app.post(BATCH_PATH)
+    def batch():
+        response = batch_handler(
+            app,
+            app.current_event.raw_event,
+            app.lambda_context,
+            app.current_event.json_body,
+        )
+        seen_events.append(app.current_event.path)
+        return response
+
+    app.seen_events = seen_events
+    return app
+
+
+def _outer_event(requests: list[dict]) -> dict:
+    return {
+        "resource": BATCH_PATH,
+        "path": BATCH_PATH,
+        "httpMethod": "POST",
+        "headers": {"Content-Type": "application/json"},
+        "multiValueHeaders": {"Content-Type": ["application/json"]},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": None,
+        "requestContext": {"requestId": "outer", "stage": "Prod"},
+        "body": json.dumps({"requests": requests}),
+        "isBase64Encoded": False,
+    }
+
+
+def _context(remaining_ms: int = 30_000):
+    return SimpleNamespace(get_remaining_time_in_millis=lambda: remaining_ms)
+
+
+def _run(resolver, requests: list[dict]) -> tuple[dict, list[dict]]:
+    result = resolver.resolve(_outer_event(requests), _context())
+    return result, json.loads(result["body"])["responses"]
+
+
+def test_failed_sub_request_does_not_poison_the_next_one(resolver):
+    result, responses = _run(
+        resolver,
+        [
+            {"id": "broken", "method": "POST", "path": "/broken"},
+            {"id": "add", "method": "POST", "path": "/notes"},
+            {"id": "list", "method": "GET", "path": "/notes"},
+            {"id": "missing", "method": "GET", "path": "/nowhere"},
+        ],
+    )
+
+    assert result["statusCode"] == 200
+    assert [(item["id"], item["status"]) for item in responses] == [
+        ("broken", 500),
+        ("add", 200),
+        ("list", 200),
+        ("missing", 404),
+    ]
+    assert responses[2]["body"] == {"notes": ["kept"]}
+
+
+def test_sub_requests_past_the_time_budget_get_504(resolver):
+    _, responses = _run(
+        resolver,
+        [
+            {"id": "slow", "method": "POST", "path": "/slow"},
+            {"id": "late", "method": "GET", "path": "/notes"},
+        ],
+    )
+
+    assert [(item["id"], item["status"]) for item in responses] == [
+        ("slow", 200),
+        ("late", 504),
+    ]
+    assert responses[1]["body"]["message"] == "Batch time budget exceeded"
+
+
+def test_outer_response_is_built_from_the_outer_event(resolver):
+    context = _context()
+
+    resolver.resolve(
+        _outer_event([{"method": "GET", "path": "/notes?limit=1"}]), context
+    )
+
+    assert resolver.seen_events == [BATCH_PATH]
+    assert BaseRouter.current_event.path == BATCH_PATH
+    assert BaseRouter.lambda_context is context
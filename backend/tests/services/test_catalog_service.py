@@ -0,0 +1,133 @@
+import uuid
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.schemas.catalog import CatalogPriceRow
+from app.services import catalog
+
+
+def _product(name: str = "Laptop", product_id: str | None = None) -> dict:
+    return {
+        "product_id": product_id,
+        "product_name": name,
+        "product_description": None,
+        "product_quantity": "10",
+    }
+
+
+def _price(product_id: uuid.UUID, days: int = 1) -> dict:
+    return {
+        "product_id": str(product_id),
+        "price_amount": "19.99",
+        "price_date": (date.today() + timedelta(days=days)).isoformat(),
+    }
+
+
+def _upserted(db, batch):
+    return len(batch), 0
+
+
+def test_read_csv_turns_empty_cells_into_none(tmp_path) -> None:
+    path = tmp_path / "products.csv"
+    path.write_text(
+        "\ufeffproduct_id,product_name,product_quantity\n,Laptop,3\n",
+        encoding="utf-8",
+    )
+
+    assert catalog.read_csv(str(path)) == [
+        {"product_id": None, "product_name": "Laptop", "product_quantity": "3"}
+    ]
+
+
+def test_import_commits_each_batch_and_reports_progress(
+    mock_session: MagicMock,
+) -> None:
+    progress = MagicMock()
+
+    with patch.object(catalog, "upsert_products", side_effect=_upserted):
+        result = catalog.import_catalog(
+            mock_session,
+            [_product(f"Product {i}") for i in range(5)],
+            [],
+            batch_size=2,
+            progress=progress,
+        )
+
+    assert mock_session.commit.call_count == 3
+    assert [call.args[1:3] for call in progress.call_args_list] == [
+        (2, 5),
+        (4, 5),
+        (5, 5),
+    ]
+    assert (result.products_created, result.batches) == (5, 3)
+
+
+def test_invalid_and_repeated_rows_are_rejected_with_their_line(
+    mock_session: MagicMock,
+) -> None:
+    product_id = str(uuid.uuid4())
+    products = [
+        _product(product_id=product_id),
+        _product(name=""),
+        _product(product_id=product_id),
+        _product("Tablet"),
+    ]
+
+    with patch.object(catalog, "upsert_products", side_effect=_upserted) as upsert:
+        result = catalog.import_catalog(mock_session, products, [])
+
+    assert [(row.sheet, row.line) for row in result.rejected] == [
+        ("products", 3),
+        ("products", 4),
+    ]
+    assert result.rejected[1].errors[0]["type"] == "duplicate"
+    assert len(upsert.call_args.args[1]) == 2
+
+
+def test_prices_for_unknown_products_are_rejected(mock_session: MagicMock) -> None:
+    known, unknown = uuid.uuid4(), uuid.uuid4()
+    prices = [_price(known), _price(unknown), _price(known, days=2)]
+
+    with patch.object(catalog, "insert_prices", return_value=(1, {1})):
+        result = catalog.import_catalog(mock_session, [], prices)
+
+    assert (result.prices_created, result.prices_existing) == (1, 1)
+    [rejected] = result.rejected
+    assert (rejected.sheet, rejected.line) == ("prices", 3)
+    assert rejected.errors[0]["input"] == str(unknown)
+
+
+@pytest.mark.parametrize(
+    "amount, days",
+    [("0", 1), ("123456789.00", 1), ("1.999", 1), ("10.00", -1)],
+)
+def test_price_rows_that_the_database_would_refuse_are_invalid(
+    mock_session: MagicMock, amount: str, days: int
+) -> None:
+    row = {**_price(uuid.uuid4(), days), "price_amount": amount}
+
+    with patch.object(catalog, "insert_prices") as insert_prices:
+        result = catalog.import_catalog(mock_session, [], [row])
+
+    assert len(result.rejected) == 1
+    insert_prices.assert_not_called()
+
+
+def test_prices_are_checked_and_inserted_in_one_statement(
+    mock_session: MagicMock,
+) -> None:
+    mock_session.execute.return_value.one.return_value = (2, None)
+    prices = [
+        CatalogPriceRow.model_validate(_price(uuid.uuid4(), days)) for days in (1, 2)
+    ]
+
+    created, unknown = catalog.insert_prices(mock_session, prices)
+
+    assert (created, unknown) == (2, set())
+    mock_session.execute.assert_called_once()
+    sql = str(
+        mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    assert "LEFT OUTER JOIN product" in sql
+    assert "INSERT INTO price (product_id, price_amount, price_date)" in sql
@@ -0,0 +1,81 @@
+from app.services import change as service
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.models import Product, Tombstone
+from app.schemas.change import ChangeResource
+from datetime import datetime
+from unittest.mock import MagicMock
+import pytest
+import uuid
+
+NOW = datetime(2025, 3, 10, 12, 0, 0)
+HORIZON = NOW - service.CHANGES_LAG
+
+
+def _result(value=None, rows=None) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one.return_value = value
+    result.all.return_value = rows or []
+    return result
+
+
+def _product_row(updated_at: datetime) -> tuple:
+    product = Product(product_id=uuid.uuid4(), updated_at=updated_at)
+    return (product, product.updated_at, product.product_id)
+
+
+def _tombstone_row(tombstone_id: int) -> tuple:
+    tombstone = Tombstone(
+        tombstone_id=tombstone_id, row_id=uuid.uuid4(), deleted_at=NOW
+    )
+    return (tombstone, tombstone.deleted_at, tombstone.tombstone_id)
+
+
+# First sync returns rows and skips tombstones
+def test_get_changes_first_sync(mock_session) -> None:
+    rows = [_product_row(datetime(2025, 1, 1)), _product_row(datetime(2025, 2, 1))]
+    mock_session.execute.side_effect = [_result(NOW), _result(rows=rows)]
+
+    change_set = service.get_changes(mock_session, ChangeResource.PRODUCTS, None, 10)
+
+    assert change_set.changes == [rows[0][0], rows[1][0]]
+    assert change_set.deleted == []
+    assert change_set.has_more is False
+    assert decode_cursor(change_set.next_token) == [
+        HORIZON.isoformat(),
+        str(service.MIN_ROW_ID),
+        HORIZON.isoformat(),
+        service.MIN_TOMBSTONE_ID,
+    ]
+    assert mock_session.execute.call_count == 2
+
+
+# A full page resumes after the last row seen
+def test_get_changes_has_more(mock_session) -> None:
+    rows = [_product_row(datetime(2025, 1, day)) for day in (1, 2, 3)]
+    tombstones = [_tombstone_row(7)]
+    since = encode_cursor([datetime(2024, 1, 1), uuid.uuid4(), datetime(2024, 1, 1), 0])
+    mock_session.execute.side_effect = [
+        _result(NOW),
+        _result(rows=rows),
+        _result(rows=tombstones),
+    ]
+
+    change_set = service.get_changes(
+        mock_session, ChangeResource.PRODUCTS, decode_cursor(since), 2
+    )
+
+    assert len(change_set.changes) == 2
+    assert change_set.deleted == [tombstones[0][0]]
+    assert change_set.has_more is True
+    assert decode_cursor(change_set.next_token) == [
+        rows[1][1].isoformat(),
+        str(rows[1][2]),
+        HORIZON.isoformat(),
+        service.MIN_TOMBSTONE_ID,
+    ]
+
+
+# Tokens must carry both positions
+def test_get_changes_invalid_token(mock_session) -> None:
+    with pytest.raises(InvalidCursorError):
+        service.get_changes(mock_session, ChangeResource.PRODUCTS, ["x"], 10)
@@ -4,6 +4,15 @@ import pytest
 from unittest.mock import patch
 import uuid
 from app.services.customer import DuplicateEmailError
+from app.schemas.pagination import PaginationQuery
+from app.core.cache import TTLCache
+from app.core.etag import (
+    ETAG_SETTLE,
+    compute_etag,
+    etag_matches,
+    fingerprint_headers,
+)
+from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from tests.conftest import MagicMock
 
@@ -134,23 +143,50 @@ def test_get_customer_by_email_not_found(mock_session) -> None:
 
 
 def test_get_all_customers(mock_session: MagicMock, existing_customer: Customer) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = [
-        existing_customer
+    mock_session.execute.return_value.all.return_value = [
+        (existing_customer, existing_customer.customer_name, existing_customer.customer_id)
     ]
 
-    customers = service.get_all_customers(mock_session)
+    page = service.get_all_customers(mock_session, PaginationQuery())
 
     mock_session.execute.assert_called_once()
-    assert customers == [existing_customer]
+    assert page.items == [existing_customer]
+    assert page.next_cursor is None
+    assert page.prev_cursor is None
+
+
+def test_get_all_customers_has_next_page(
+    mock_session: MagicMock,
+    existing_customer: Customer,
+    existing_customer_2: Customer,
+) -> None:
+    mock_session.execute.return_value.all.return_value = [
+        (existing_customer, existing_customer.customer_name, existing_customer.customer_id),
+        (
+            existing_customer_2,
+            existing_customer_2.customer_name,
+            existing_customer_2.customer_id,
+        ),
+    ]
+
+    page = service.get_all_customers(mock_session, PaginationQuery(limit=1))
+
+    assert page.items == [existing_customer]
+    assert page.prev_cursor is None
+    assert PaginationQuery(cursor=page.next_cursor).cursor == [
+        existing_customer.customer_name,
+        str(existing_customer.customer_id),
+    ]
 
 
 def test_get_all_customers_empty(mock_session: MagicMock) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+    mock_session.execute.return_value.all.return_value = []
 
-    customers = service.get_all_customers(mock_session)
+    page = service.get_all_customers(mock_session, PaginationQuery())
 
     mock_session.execute.assert_called_once()
-    assert customers == []
+    assert page.items == []
+    assert page.next_cursor is None
 
 
 def test_update_customer(
@@ -245,76 +281,167 @@ def test_delete_customer_not_found(mock_session: MagicMock) -> None:
     assert deleted_id is None
 
 
-def search_customers_by_name(
-    mock_session: MagicMock, existing_customer: Customer, existing_customer_2: Customer
+def test_search_customers(
+    mock_session: MagicMock,
+    existing_customer: Customer,
+    existing_customer_2: Customer,
 ) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = [
-        existing_customer,
-        existing_customer_2,
+    mock_session.execute.return_value.all.return_value = [
+        (existing_customer, 1, existing_customer.customer_name, existing_customer.customer_id),
+        (
+            existing_customer_2,
+            2,
+            existing_customer_2.customer_name,
+            existing_customer_2.customer_id,
+        ),
     ]
 
-    customers = service.search_customers_by_name(mock_session, name_query="Peterson")
+    page = service.search_customers(
+        mock_session, keyword="Peterson", query=PaginationQuery(limit=1)
+    )
 
     mock_session.execute.assert_called_once()
-    assert customers == [existing_customer, existing_customer_2]
+    assert page.items == [existing_customer]
+    assert PaginationQuery(cursor=page.next_cursor).cursor == [
+        1,
+        existing_customer.customer_name,
+        str(existing_customer.customer_id),
+    ]
 
 
-def test_search_customers_by_name_no_results(mock_session: MagicMock) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+def test_search_customers_no_results(mock_session: MagicMock) -> None:
+    mock_session.execute.return_value.all.return_value = []
 
-    customers = service.search_customers_by_name(mock_session, name_query="Nonexistent")
+    page = service.search_customers(
+        mock_session, keyword="Nonexistent", query=PaginationQuery()
+    )
 
     mock_session.execute.assert_called_once()
-    assert customers == []
+    assert page.items == []
+    assert page.next_cursor is None
 
 
-def test_search_customers_by_email(
+def test_autocomplete_customers_uses_cache(
     mock_session: MagicMock, existing_customer: Customer
 ) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = [
-        existing_customer
-    ]
+    row = (existing_customer.customer_id, existing_customer.customer_name)
+    mock_session.execute.return_value.all.return_value = [row]
 
-    customers = service.search_customers_by_email(
-        mock_session, email_query="bob.peterson@"
-    )
+    with patch.object(service, "autocomplete_cache", TTLCache(8, 60)):
+        first = service.autocomplete_customers(mock_session, prefix="Bob", limit=5)
+        second = service.autocomplete_customers(mock_session, prefix="bob", limit=5)
 
     mock_session.execute.assert_called_once()
-    assert customers == [existing_customer]
+    assert first == second == [row]
+
+
+def test_autocomplete_customers_cache_disabled(
+    mock_session: MagicMock, existing_customer: Customer
+) -> None:
+    mock_session.execute.return_value.all.return_value = []
+
+    with patch.object(service, "autocomplete_cache", TTLCache(0, 60)):
+        service.autocomplete_customers(mock_session, prefix="Bob", limit=5)
+        service.autocomplete_customers(mock_session, prefix="Bob", limit=5)
 
+    assert mock_session.execute.call_count == 2
 
-def test_search_customers_by_email_no_results(mock_session: MagicMock) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = []
 
-    customers = service.search_customers_by_email(
-        mock_session, email_query="nonexistent@"
+def test_get_customer_fingerprint(mock_session: MagicMock) -> None:
+    updated_at = datetime(2025, 1, 1, 9, 30)
+    mock_session.execute.return_value.one_or_none.return_value = (updated_at,)
+
+    assert service.get_customer_fingerprint(mock_session, uuid.uuid4()) == (
+        updated_at,
     )
 
-    mock_session.execute.assert_called_once()
-    assert customers == []
 
+def test_get_customer_fingerprint_not_found(mock_session: MagicMock) -> None:
+    mock_session.execute.return_value.one_or_none.return_value = None
 
-def test_search_customers_by_phone(
-    mock_session: MagicMock, existing_customer: Customer
+    assert service.get_customer_fingerprint(mock_session, uuid.uuid4()) is None
+
+
+def test_etag_changes_with_fingerprint() -> None:
+    customer_id = uuid.uuid4()
+    before = compute_etag(customer_id, datetime(2025, 1, 1))
+    after = compute_etag(customer_id, datetime(2025, 1, 2))
+
+    assert before.startswith('W/"')
+    assert before != after
+    assert before == compute_etag(customer_id, datetime(2025, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"other", W/"abc"', True),
+        ("*", True),
+        ('W/"other"', False),
+    ],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(header, 'W/"abc"') is expected
+
+
+
+def test_settled_list_fingerprint_gets_an_etag() -> None:
+    now = datetime(2025, 1, 1, 12)
+    newest = now - ETAG_SETTLE
+
+    headers = fingerprint_headers((newest, 3, now), {"limit": 20})
+
+    assert headers["ETag"] == compute_etag({"limit": 20}, newest, 3)
+
+
+def test_recent_list_fingerprint_is_not_cached() -> None:
+    # A write that started before `newest` may still commit under an older
+    # updated_at without moving max or count.
+    now = datetime(2025, 1, 1, 12)
+    headers = fingerprint_headers((now, 3, now), {"limit": 20})
+
+    assert "ETag" not in headers
+    assert not etag_matches("*", headers.get("ETag"))
+
+def test_import_customers_copies_rows_and_upserts_once(
+    mock_session: MagicMock, new_customer: Customer
 ) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = [
-        existing_customer
+    customer_id = uuid.uuid4()
+    mock_session.execute.return_value.all.return_value = [
+        MagicMock(row_number=3, customer_id=customer_id, status="created")
     ]
+    cursor = mock_session.connection.return_value.connection.cursor.return_value
+    cache = TTLCache(10, 60)
+    cache.set("a", [])
 
-    customers = service.search_customers_by_phone(
-        mock_session, phone_query="+12025550108"
-    )
+    with patch("app.services.customer.autocomplete_cache", cache):
+        rows = service.import_customers(mock_session, {3: new_customer})
 
-    mock_session.execute.assert_called_once()
-    assert customers == [existing_customer]
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql.startswith("COPY customer_import")
+    assert buffer.getvalue() == (
+        "3,Alice Peterson,alice.peterson@gmail.com,+12025550107\r\n"
+    )
+    cursor.close.assert_called_once()
+    assert mock_session.execute.call_count == 3
+    mock_session.commit.assert_called_once()
+    assert rows[0].customer_id == customer_id
+    assert cache.get("a") is None
 
 
-def test_search_customers_by_phone_no_results(mock_session: MagicMock) -> None:
-    mock_session.execute.return_value.scalars.return_value.all.return_value = []
+def test_import_customers_keeps_cache_when_nothing_changed(
+    mock_session: MagicMock, new_customer: Customer
+) -> None:
+    mock_session.execute.return_value.all.return_value = [
+        MagicMock(row_number=0, customer_id=uuid.uuid4(), status="unchanged")
+    ]
+    cache = TTLCache(10, 60)
+    cache.set("a", [])
 
-    customers = service.search_customers_by_phone(
-        mock_session, phone_query="+19999999999"
-    )
+    with patch("app.services.customer.autocomplete_cache", cache):
+        service.import_customers(mock_session, {0: new_customer})
 
-    mock_session.execute.assert_called_once()
-    assert customers == []
+    assert cache.get("a") == []
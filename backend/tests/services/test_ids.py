@@ -0,0 +1,49 @@
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.core.ids import uuid7, uuid7_at, uuid7_timestamp
+from app.models import Order, Price
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_monotonic_within_process():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_timestamp_round_trips():
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    created_at = uuid7_timestamp(uuid7())
+    after = datetime.now(timezone.utc) + timedelta(milliseconds=1)
+
+    assert before <= created_at <= after
+
+
+def test_uuid7_timestamp_ignores_other_versions():
+    assert uuid7_timestamp(uuid.uuid4()) is None
+
+
+def test_order_and_price_ids_default_to_uuid7():
+    for column in (Order.__table__.c.order_id, Price.__table__.c.price_id):
+        assert column.default.arg.__name__ == "uuid7"
+        assert "uuid_generate_v7" in str(column.server_default.arg)
+
+
+def test_uuid7_at_is_reproducible_and_carries_timestamp():
+    when = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    first = uuid7_at(when, random.Random(7))
+    second = uuid7_at(when, random.Random(7))
+
+    assert first == second
+    assert first.version == 7
+    assert uuid7_timestamp(first) == when
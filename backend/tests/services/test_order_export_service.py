@@ -0,0 +1,190 @@
+from app.services import order_export as service
+from app.schemas.order_export import (
+    ExportFormat,
+    ExportStatus,
+    OrderExportFilter,
+)
+from app import s3_client
+from botocore.exceptions import ClientError
+from collections import namedtuple
+from types import SimpleNamespace
+from datetime import datetime
+from decimal import Decimal
+import csv
+import io
+import json
+import pytest
+import uuid
+
+ExportRow = namedtuple("ExportRow", service.CSV_COLUMNS)
+
+
+class FakeS3:
+    """In-memory stand-in for the handful of S3 calls the export makes."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, list[bytes]] = {}
+        self.aborted: list[str] = []
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[Key] = Body
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def create_multipart_upload(self, Bucket, Key, ContentType=None):
+        self.uploads[Key] = []
+        return {"UploadId": Key}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        assert len(parts) == len(MultipartUpload["Parts"])
+        self.objects[Key] = b"".join(parts)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(Key)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch) -> FakeS3:
+    s3 = FakeS3()
+    monkeypatch.setattr(s3_client, "get_s3_client", lambda: s3)
+    return s3
+
+
+def _row(order_id: uuid.UUID, product_id: uuid.UUID | None = None) -> ExportRow:
+    return ExportRow(
+        order_id=order_id,
+        order_date=datetime(2025, 1, 2, 3, 4, 5),
+        status_code="PAID",
+        order_total=Decimal("30.00"),
+        customer_id=uuid.uuid4(),
+        customer_name="Jane",
+        customer_email="jane@example.com",
+        user_id=uuid.uuid4(),
+        user_name="Sam",
+        product_id=product_id,
+        product_name="Laptop" if product_id else None,
+        item_quantity=2 if product_id else None,
+        item_price=Decimal("15.00") if product_id else None,
+    )
+
+
+@pytest.fixture
+def rows() -> list[ExportRow]:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    return [
+        _row(first, uuid.uuid4()),
+        _row(first, uuid.uuid4()),
+        _row(second),
+    ]
+
+
+# Parts are flushed once the buffer reaches the part size
+def test_multipart_upload_splits_parts(fake_s3) -> None:
+    with s3_client.MultipartUpload("k", "text/csv", part_size=4) as out:
+        out.write(b"abc")
+        out.write(b"def")
+        out.write(b"g")
+        assert fake_s3.uploads["k"] == [b"abcdef"]
+
+    assert fake_s3.objects["k"] == b"abcdefg"
+    assert out.bytes_written == 7
+
+
+# Small objects skip the multipart API
+def test_multipart_upload_small_object(fake_s3) -> None:
+    with s3_client.MultipartUpload("k", "text/csv", part_size=100) as out:
+        out.write(b"abc")
+
+    assert fake_s3.objects["k"] == b"abc"
+    assert fake_s3.uploads == {}
+
+
+# Errors abort the upload
+def test_multipart_upload_aborts_on_error(fake_s3) -> None:
+    with pytest.raises(RuntimeError):
+        with s3_client.MultipartUpload("k", "text/csv", part_size=1) as out:
+            out.write(b"abc")
+            raise RuntimeError("boom")
+
+    assert fake_s3.aborted == ["k"]
+    assert "k" not in fake_s3.objects
+
+
+def test_write_csv(fake_s3, rows) -> None:
+    with s3_client.MultipartUpload("k", "text/csv") as out:
+        counts = service.write_csv(iter(rows), out)
+
+    lines = fake_s3.objects["k"].decode().splitlines()
+    assert counts == (2, 2)
+    assert lines[0] == ",".join(service.CSV_COLUMNS)
+    assert len(lines) == 4
+
+
+# The flush threshold counts encoded bytes, not characters
+def test_write_csv_flushes_by_encoded_size(monkeypatch) -> None:
+    row = _row(uuid.uuid4())._replace(customer_name="é" * 200)
+    expected = io.StringIO()
+    csv.writer(expected).writerows([service.CSV_COLUMNS, row])
+    text = expected.getvalue()
+    monkeypatch.setattr(service, "CSV_FLUSH_BYTES", len(text) + 1)
+    chunks = []
+
+    service.write_csv(iter([row]), SimpleNamespace(write=chunks.append))
+
+    assert chunks == [text.encode(), b""]
+
+
+def test_write_ndjson_groups_items_per_order(fake_s3, rows) -> None:
+    with s3_client.MultipartUpload("k", "application/x-ndjson") as out:
+        counts = service.write_ndjson(iter(rows), out)
+
+    documents = [json.loads(line) for line in fake_s3.objects["k"].splitlines()]
+    assert counts == (2, 2)
+    assert [len(document["items"]) for document in documents] == [2, 0]
+    assert documents[0]["order_total"] == "30.00"
+    assert documents[0]["items"][0]["product_name"] == "Laptop"
+
+
+def test_run_export_completes(fake_s3, rows, mock_session, monkeypatch) -> None:
+    monkeypatch.setattr(service, "stream_export_rows", lambda db, filters: iter(rows))
+    manifest = service.create_export(ExportFormat.NDJSON, OrderExportFilter())
+
+    result = service.run_export(mock_session, manifest)
+
+    assert result.status == ExportStatus.COMPLETED
+    assert result.order_count == 2
+    assert result.item_count == 2
+    assert result.size_bytes == len(fake_s3.objects[result.key])
+    assert service.get_export(result.export_id).status == ExportStatus.COMPLETED
+
+
+def test_run_export_records_failure(fake_s3, mock_session, monkeypatch) -> None:
+    def fail(db, filters):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(service, "stream_export_rows", fail)
+    manifest = service.create_export(ExportFormat.CSV, OrderExportFilter())
+
+    result = service.run_export(mock_session, manifest)
+
+    assert result.status == ExportStatus.FAILED
+    assert result.error == "database went away"
+    assert result.key not in fake_s3.objects
+    mock_session.rollback.assert_called_once()
+
+
+def test_get_export_missing(fake_s3, monkeypatch) -> None:
+    def missing(Bucket, Key):
+        raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+    monkeypatch.setattr(fake_s3, "get_object", missing)
+
+    assert service.get_export(uuid.uuid4()) is None
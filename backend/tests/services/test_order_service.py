@@ -1,5 +1,5 @@
 from app.services import order as service
-from app.models import Order, User, Customer, Status
+from app.models import Order, User, Customer, Status, ArchivedOrder
 import pytest
 import uuid
 from app.services.order import NotFoundError
@@ -121,6 +121,32 @@ def test_get_order_not_found(mock_session: MagicMock) -> None:
 
     order = service.get_order(db=mock_session, order_id=uuid.uuid4())
 
+    # Hot table, then the archive.
+    assert mock_session.execute.call_count == 2
+    assert order is None
+
+
+def test_get_order_falls_back_to_archive(mock_session: MagicMock) -> None:
+    archived = ArchivedOrder(order_id=uuid.uuid4())
+    mock_session.execute.return_value.scalar_one_or_none.side_effect = [
+        None,
+        archived,
+    ]
+
+    order = service.get_order(db=mock_session, order_id=archived.order_id)
+
+    assert order is archived
+    archive_stmt = mock_session.execute.call_args_list[1].args[0]
+    assert "orders_archive" in str(archive_stmt)
+
+
+def test_get_order_without_archive(mock_session: MagicMock) -> None:
+    mock_session.execute.return_value.scalar_one_or_none.return_value = None
+
+    order = service.get_order(
+        db=mock_session, order_id=uuid.uuid4(), include_archived=False
+    )
+
     mock_session.execute.assert_called_once()
     assert order is None
 
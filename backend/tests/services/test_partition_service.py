@@ -0,0 +1,102 @@
+from app.services import partition as service
+from app.services.order import _apply_filters
+from app.schemas.order import OrderFilterQuery
+from app.models import Order
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects import postgresql
+from tests.conftest import MagicMock
+
+
+def test_partition_name_round_trips():
+    name = service.partition_name(date(2025, 3, 1))
+
+    assert name == "orders_2025_03"
+    assert service.partition_month(name) == date(2025, 3, 1)
+
+
+def test_partition_month_ignores_unrelated_tables():
+    assert service.partition_month("orders") is None
+    assert service.partition_month("orders_default") is None
+
+
+def test_months_to_create_covers_current_and_ahead():
+    months = service.months_to_create(date(2025, 11, 17), months_ahead=3)
+
+    assert months == [
+        date(2025, 11, 1),
+        date(2025, 12, 1),
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+    ]
+
+
+def test_partitions_to_detach_respects_retention():
+    partitions = ["orders_2024_12", "orders_2025_01", "orders_2025_02", "orders_x"]
+
+    assert service.partitions_to_detach(partitions, date(2025, 3, 10), 2) == [
+        "orders_2024_12"
+    ]
+    assert service.partitions_to_detach(partitions, date(2025, 3, 10), 0) == []
+
+
+def test_run_maintenance_creates_missing_and_detaches_old(mock_session: MagicMock):
+    mock_session.execute.return_value.scalars.return_value = [
+        "orders_2024_12",
+        "orders_2025_03",
+    ]
+    mock_session.execute.return_value.scalar_one.side_effect = [
+        "orders_2025_04",
+        "orders_2025_05",
+        False,
+    ]
+
+    result = service.run_maintenance(
+        mock_session, today=date(2025, 3, 10), months_ahead=2, retain_months=2
+    )
+
+    assert result.created == ["orders_2025_04", "orders_2025_05"]
+    assert result.detached == ["orders_2024_12"]
+    assert result.kept == []
+    detach = str(mock_session.execute.call_args_list[-1].args[0])
+    assert detach == 'ALTER TABLE orders DETACH PARTITION "orders_2024_12"'
+    assert mock_session.commit.call_count == 2
+
+
+def test_partition_still_holding_orders_is_kept(mock_session: MagicMock):
+    mock_session.execute.return_value.scalar_one.return_value = True
+
+    assert not service.detach_partition(mock_session, "orders_2024_12")
+
+    statements = [str(call.args[0]) for call in mock_session.execute.call_args_list]
+    assert statements[0] == "SET LOCAL lock_timeout = '5s'"
+    assert not any("DETACH" in statement for statement in statements)
+    mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_not_called()
+
+
+def test_partition_locked_by_other_work_is_kept(mock_session: MagicMock):
+    mock_session.execute.side_effect = [
+        None,
+        OperationalError("LOCK TABLE", {}, Exception("lock timeout")),
+    ]
+
+    assert not service.detach_partition(mock_session, "orders_2024_12")
+    mock_session.rollback.assert_called_once()
+
+
+def test_order_date_filter_is_half_open_range_on_partition_key(
+    mock_session: MagicMock,
+):
+    query = OrderFilterQuery(order_date=date(2025, 3, 31))
+
+    stmt = _apply_filters(select(Order), mock_session, query)
+    compiled = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+
+    sql = str(compiled)
+    assert "orders.order_date >= '2025-03-31 00:00:00'" in sql
+    assert "orders.order_date < '2025-04-01 00:00:00'" in sql
+    assert "date(" not in sql.lower()
@@ -0,0 +1,62 @@
+from app.core import profiling
+from unittest.mock import patch
+import pytest
+
+
+def _busy_work():
+    return [str(i) * 10 for i in range(20_000)]
+
+
+def _profile(monkeypatch, **settings):
+    for name, value in settings.items():
+        monkeypatch.setattr(profiling, name, value)
+    with patch.object(profiling.logger, "info") as info:
+        with profiling.profile_request("GET /orders", "request-1"):
+            _busy_work()
+    return info.call_args.kwargs["extra"]
+
+
+@pytest.mark.parametrize(
+    "mode, headers, expected",
+    [
+        ("off", {"X-Debug-Profile": "1"}, False),
+        ("header", {"X-Debug-Profile": "1"}, True),
+        ("header", {"x-debug-profile": "true"}, True),
+        ("header", {}, False),
+        ("header", None, False),
+        ("always", None, True),
+    ],
+)
+def test_should_profile(monkeypatch, mode, headers, expected):
+    monkeypatch.setattr(profiling, "PROFILE_REQUESTS", mode)
+
+    assert profiling.should_profile({"headers": headers}) is expected
+
+
+def test_profile_logs_hot_functions_and_allocations(monkeypatch):
+    extra = _profile(monkeypatch, PROFILE_S3_PREFIX="")
+
+    assert extra["route"] == "GET /orders"
+    assert any("_busy_work" in row["function"] for row in extra["functions"])
+    cumulative = [row["cumtime_ms"] for row in extra["functions"]]
+    assert cumulative == sorted(cumulative, reverse=True)
+    assert any("test_profiling.py" in row["site"] for row in extra["allocations"])
+    assert extra["peak_memory_kb"] > 0
+    assert "profile_key" not in extra
+
+
+def test_profile_is_stored_in_s3_when_prefix_is_set(monkeypatch):
+    with patch.object(profiling, "put_bytes_object") as put:
+        extra = _profile(monkeypatch, PROFILE_S3_PREFIX="profiles")
+
+    key, body, _ = put.call_args.args
+    assert key == extra["profile_key"]
+    assert key.startswith("profiles/") and key.endswith("/request-1.prof")
+    assert body
+
+
+def test_failed_upload_does_not_fail_the_request(monkeypatch):
+    with patch.object(profiling, "put_bytes_object", side_effect=RuntimeError("s3")):
+        extra = _profile(monkeypatch, PROFILE_S3_PREFIX="profiles")
+
+    assert extra["profile_error"] == "s3"
@@ -0,0 +1,78 @@
+from app.core import compression
+import base64
+import brotli
+import gzip
+import json
+import pytest
+
+BODY = json.dumps({"orders": [{"orderId": str(i), "status": "PAID"} for i in range(200)]})
+
+
+def _response(body: str = BODY) -> dict:
+    return {
+        "statusCode": 200,
+        "body": body,
+        "isBase64Encoded": False,
+        "multiValueHeaders": {"Content-Type": ["application/json"]},
+    }
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("br;q=0.5, gzip;q=0.9", "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("*", "br"),
+    ],
+)
+def test_negotiate_encoding(header: str | None, expected: str | None) -> None:
+    assert compression.negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_without_brotli(monkeypatch) -> None:
+    monkeypatch.setattr(compression, "brotli", None)
+
+    assert compression.negotiate_encoding("br, gzip") == "gzip"
+    assert compression.negotiate_encoding("br") is None
+
+
+def test_compress_response_gzip() -> None:
+    response = compression.compress_response(_response(), "gzip")
+
+    assert response["isBase64Encoded"] is True
+    assert response["multiValueHeaders"]["Content-Encoding"] == ["gzip"]
+    assert response["multiValueHeaders"]["Vary"] == ["Accept-Encoding"]
+    assert gzip.decompress(base64.b64decode(response["body"])).decode() == BODY
+
+
+def test_compress_response_brotli() -> None:
+    response = compression.compress_response(_response(), "br, gzip")
+
+    assert response["multiValueHeaders"]["Content-Encoding"] == ["br"]
+    assert brotli.decompress(base64.b64decode(response["body"])).decode() == BODY
+
+
+def test_compress_response_below_threshold() -> None:
+    response = compression.compress_response(_response('{"ok":true}'), "gzip")
+
+    assert response["body"] == '{"ok":true}'
+    assert response["isBase64Encoded"] is False
+    assert "Content-Encoding" not in response["multiValueHeaders"]
+
+
+def test_compress_response_not_accepted() -> None:
+    response = compression.compress_response(_response(), None)
+
+    assert response["body"] == BODY
+    assert response["multiValueHeaders"]["Vary"] == ["Accept-Encoding"]
+
+
+def test_compress_response_skips_empty_body() -> None:
+    response = {"statusCode": 304, "body": None, "multiValueHeaders": {}}
+
+    assert compression.compress_response(response, "gzip") == response
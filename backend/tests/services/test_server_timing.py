@@ -0,0 +1,91 @@
+import json
+from types import SimpleNamespace
+from app.core.response import error, success
+from app.core.server_timing import add_server_timing, phase, track_request
+from app.core.sql_metrics import QueryStats
+from app.main import lambda_handler
+from app.schemas.base_schema import validate_request
+from app.schemas.customer import CustomerCreate, CustomerResponse
+
+
+def _metrics(header: str) -> dict[str, str]:
+    return {part.split(";")[0]: part for part in header.split(", ")}
+
+
+def test_responses_do_not_carry_the_header_themselves():
+    with track_request(QueryStats()):
+        response = error("Not found", status_code=404)
+
+    assert "Server-Timing" not in response.headers
+    assert response.headers["Timing-Allow-Origin"]
+
+
+def test_header_breaks_down_validation_db_serialize_and_cold_start():
+    queries = QueryStats(statements=3, db_time_ms=12.5)
+
+    with track_request(queries, cold_start_ms=850.0) as timing:
+        customer = validate_request(
+            CustomerCreate,
+            {
+                "customerName": "Ada",
+                "customerEmail": "ada@example.com",
+                "customerPhone": "+61400000000",
+            },
+        )
+        success(customer)
+
+    response = add_server_timing({"multiValueHeaders": {}}, timing)
+
+    metrics = _metrics(response["multiValueHeaders"]["Server-Timing"][0])
+    assert set(metrics) == {"validation", "serialize", "db", "coldstart", "total"}
+    assert metrics["db"] == 'db;dur=12.5;desc="3 queries"'
+    assert metrics["coldstart"] == "coldstart;dur=850.0"
+
+
+def test_building_a_response_model_is_not_validation():
+    with track_request(QueryStats()) as timing:
+        CustomerResponse.model_validate(
+            SimpleNamespace(
+                customer_id="7a3f9bc2-0b8e-4a57-9d8b-2a3c1d5e6f70",
+                customer_name="Ada",
+                customer_email="ada@example.com",
+                customer_phone="+61400000000",
+                updated_at="2025-01-02T03:04:05",
+            )
+        )
+
+    assert "validation" not in timing.phases
+
+
+def test_lambda_handler_times_encoding_and_compression():
+    event = {
+        "resource": "/batch",
+        "path": "/batch",
+        "httpMethod": "POST",
+        "headers": {"Content-Type": "application/json"},
+        "multiValueHeaders": {"Content-Type": ["application/json"]},
+        "requestContext": {"requestId": "1", "stage": "Prod"},
+        "body": json.dumps({"requests": []}),
+        "isBase64Encoded": False,
+    }
+    context = SimpleNamespace(
+        function_name="api",
+        memory_limit_in_mb=512,
+        invoked_function_arn="arn:aws:lambda:ap-southeast-2:0:function:api",
+        aws_request_id="1",
+    )
+
+    response = lambda_handler(event, context)
+
+    assert response["statusCode"] == 400
+    metrics = _metrics(response["multiValueHeaders"]["Server-Timing"][0])
+    assert {"validation", "serialize", "compress", "total"} <= set(metrics)
+
+
+def test_nested_phase_of_the_same_name_is_counted_once():
+    with track_request(QueryStats()) as timing:
+        with phase("validation"):
+            with phase("validation"):
+                pass
+
+    assert list(timing.phases) == ["validation"]
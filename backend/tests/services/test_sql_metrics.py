@@ -0,0 +1,102 @@
+from app.core import sql_metrics
+from sqlalchemy import create_engine, text
+from unittest.mock import MagicMock, patch
+import pytest
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    sql_metrics.install_query_hooks(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE customer (email TEXT)"))
+    return engine
+
+
+def test_track_queries_counts_statements_and_time(engine):
+    with sql_metrics.track_queries() as stats:
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO customer VALUES (:email)"), {"email": "a"})
+            conn.execute(text("SELECT * FROM customer")).all()
+
+    assert stats.statements == 2
+    assert stats.db_time_ms > 0
+    assert stats.slow_statements == 0
+
+
+def test_nested_scopes_both_see_inner_statements(engine):
+    with sql_metrics.track_queries() as outer:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with sql_metrics.track_queries() as inner:
+                conn.execute(text("SELECT 2"))
+
+    assert (outer.statements, inner.statements) == (2, 1)
+
+
+def test_statements_outside_a_scope_are_not_counted(engine):
+    with sql_metrics.track_queries() as stats:
+        pass
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert stats.statements == 0
+
+
+def test_failed_statement_does_not_leak_start_time(engine):
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.info[sql_metrics._START_TIMES] == []
+
+
+def test_slow_statement_is_logged_with_redacted_parameters(engine, monkeypatch):
+    monkeypatch.setattr(sql_metrics, "SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(sql_metrics, "SLOW_QUERY_EXPLAIN", True)
+
+    with patch.object(sql_metrics.logger, "warning") as warning:
+        with sql_metrics.track_queries() as stats:
+            with engine.connect() as conn:
+                conn.execute(
+                    text("SELECT * FROM customer WHERE email = :email"),
+                    {"email": "secret@example.com"},
+                )
+
+    assert stats.slow_statements == 1
+    extra = warning.call_args.kwargs["extra"]
+    assert "secret@example.com" not in str(extra["parameters"])
+    assert extra["parameters"] == ["str"]
+    assert extra["plan"]
+
+
+def test_failed_explain_rolls_back_to_savepoint_and_closes_cursor():
+    explain_cursor = MagicMock()
+
+    def execute(statement, parameters=None):
+        if statement.startswith("EXPLAIN"):
+            raise RuntimeError("syntax error")
+
+    explain_cursor.execute.side_effect = execute
+    cursor = MagicMock()
+    cursor.connection.cursor.return_value = explain_cursor
+
+    plan = sql_metrics._explain(cursor, "SELECT 1", {})
+
+    assert plan == ["EXPLAIN failed: syntax error"]
+    assert [call.args[0] for call in explain_cursor.execute.call_args_list] == [
+        "SAVEPOINT slow_query_explain",
+        "EXPLAIN SELECT 1",
+        "ROLLBACK TO SAVEPOINT slow_query_explain",
+        "RELEASE SAVEPOINT slow_query_explain",
+    ]
+    explain_cursor.close.assert_called_once()
+
+
+def test_redact_parameters_shapes():
+    assert sql_metrics.redact_parameters({"email": "x", "limit": 5}) == {
+        "email": "str",
+        "limit": "int",
+    }
+    assert sql_metrics.redact_parameters([{}, {}], executemany=True) == (
+        "<2 parameter sets>"
+    )
@@ -0,0 +1,82 @@
+from app.core import tracing
+from app.services import user
+from sqlalchemy import create_engine, text
+import pytest
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    tracing.install_sql_tracing(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE customer (email TEXT)"))
+    return engine
+
+
+def test_trace_functions_wraps_public_functions_only():
+    namespace = {"__name__": __name__}
+    exec(
+        "def get_thing():\n    return _helper() + 1\n" "def _helper():\n    return 1\n",
+        namespace,
+    )
+    helper = namespace["_helper"]
+
+    tracing.trace_functions(namespace)
+    with tracing.record_spans() as spans:
+        assert namespace["get_thing"]() == 2
+
+    assert [span.name for span in spans] == ["test_tracing.get_thing"]
+    assert namespace["_helper"] is helper
+
+
+def test_sql_spans_nest_under_service_spans(engine):
+    @tracing.traced("customer.count")
+    def count():
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT count(*) FROM customer")).scalar()
+
+    with tracing.record_spans() as spans:
+        count()
+
+    sql, service = spans
+    assert (service.name, service.depth) == ("customer.count", 0)
+    assert (sql.name, sql.depth) == ("sql", 1)
+    assert sql.annotations["operation"] == "SELECT"
+    assert service.duration_ms >= sql.duration_ms
+
+
+def test_statement_fingerprint_ignores_parameter_values_and_list_length():
+    one = "SELECT * FROM item WHERE product_id IN (%(p_1)s)"
+    three = "SELECT * FROM item WHERE product_id IN (%(p_1)s, %(p_2)s, %(p_3)s)"
+    other = "SELECT * FROM price WHERE product_id IN (%(p_1)s)"
+
+    assert tracing.statement_fingerprint(one) == tracing.statement_fingerprint(three)
+    assert tracing.statement_fingerprint(one) != tracing.statement_fingerprint(other)
+
+
+def test_failed_statement_closes_its_span(engine):
+    with tracing.record_spans() as spans:
+        with engine.connect() as conn:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.info[tracing._SQL_SPANS] == []
+
+    assert spans[0].error == "OperationalError"
+
+
+def test_no_spans_without_a_recorder_when_tracing_is_disabled(engine):
+    assert tracing.tracer.disabled
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert conn.info.get(tracing._SQL_SPANS, []) == []
+
+
+def test_password_hashing_is_traced():
+    with tracing.record_spans() as spans:
+        user.verify_password("secret", user.hash_password("secret"))
+
+    assert [span.name for span in spans] == [
+        "user.hash_password",
+        "user.verify_password",
+    ]
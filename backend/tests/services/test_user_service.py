@@ -0,0 +1,144 @@
+import threading
+import uuid
+from contextlib import nullcontext
+from datetime import datetime
+from unittest.mock import MagicMock
+from passlib.context import CryptContext
+import pytest
+from app.handlers import user as user_handler
+from app.schemas.user import MAX_BULK_USERS, UserCreate
+from app.services import user as user_service
+
+
+@pytest.fixture(autouse=True)
+def cheap_bcrypt(monkeypatch):
+    monkeypatch.setattr(
+        user_service, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    )
+
+
+def _user(i: int) -> UserCreate:
+    return UserCreate(
+        user_name=f"User {i}",
+        user_email=f"user{i}@example.com",
+        user_phone="+61400000000",
+        user_account=f"user{i}",
+        user_password=f"password-{i}",
+    )
+
+
+def _no_existing(mock_session):
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
+
+
+def test_hash_passwords_keeps_input_order():
+    passwords = [f"password-{i}" for i in range(6)]
+
+    hashes = user_service.hash_passwords(passwords)
+
+    assert len(set(hashes)) == len(passwords)
+    for password, password_hash in zip(passwords, hashes):
+        assert user_service.verify_password(password, password_hash)
+
+
+def test_hashing_is_refused_when_the_pool_is_full(monkeypatch):
+    monkeypatch.setattr(user_service, "_hash_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(user_service, "PASSWORD_HASH_WAIT_SECONDS", 0)
+    release = threading.Event()
+    blocked = user_service._submit_all(release.wait, [(), ()])
+
+    with pytest.raises(user_service.HashingBusyError):
+        user_service.hash_password("password1")
+
+    release.set()
+    for future in blocked:
+        future.result()
+    assert user_service.hash_password("password1")
+
+
+def test_a_refused_batch_gives_its_slots_back(monkeypatch):
+    monkeypatch.setattr(user_service, "_hash_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(user_service, "PASSWORD_HASH_WAIT_SECONDS", 0)
+
+    with pytest.raises(user_service.HashingBusyError):
+        user_service.hash_passwords(["a", "b", "c"])
+
+    assert len(user_service.hash_passwords(["a", "b"])) == 2
+
+
+def test_a_batch_waits_for_slots_held_by_other_hashes(monkeypatch):
+    monkeypatch.setattr(user_service, "_hash_slots", threading.BoundedSemaphore(2))
+    release = threading.Event()
+    blocked = user_service._submit_all(release.wait, [()])
+    threading.Timer(0.1, release.set).start()
+
+    assert len(user_service.hash_passwords(["a", "b"])) == 2
+    blocked[0].result()
+
+
+def test_create_users_hashes_every_password(mock_session):
+    _no_existing(mock_session)
+    users = [_user(i) for i in range(3)]
+
+    created = user_service.create_users(mock_session, users)
+
+    assert [user.user_account for user in created] == ["user0", "user1", "user2"]
+    for user, data in zip(created, users):
+        assert user_service.verify_password(data.user_password, user.user_password)
+    mock_session.add_all.assert_called_once_with(created)
+    mock_session.flush.assert_called_once()
+    mock_session.commit.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "field, error",
+    [
+        ("user_account", user_service.DuplicateAccountError),
+        ("user_email", user_service.DuplicateEmailError),
+    ],
+)
+def test_create_users_rejects_repeats_within_the_request(mock_session, field, error):
+    first, second = _user(1), _user(2)
+    setattr(second, field, getattr(first, field))
+
+    with pytest.raises(error):
+        user_service.create_users(mock_session, [first, second])
+
+    mock_session.add_all.assert_not_called()
+
+
+def test_create_users_rejects_existing_accounts_before_hashing(
+    mock_session, monkeypatch
+):
+    mock_session.execute.return_value.scalars.return_value.first.return_value = "user1"
+    hash_passwords = MagicMock()
+    monkeypatch.setattr(user_service, "hash_passwords", hash_passwords)
+
+    with pytest.raises(user_service.DuplicateAccountError, match="user1"):
+        user_service.create_users(mock_session, [_user(1)])
+
+    hash_passwords.assert_not_called()
+
+
+def test_bulk_handler_accepts_the_configured_maximum(mock_session, monkeypatch):
+    # The whole request must fit the hashing queue even with a login in flight.
+    assert MAX_BULK_USERS <= user_service.PASSWORD_HASH_QUEUE
+    _no_existing(mock_session)
+
+    def flush():
+        for user in mock_session.add_all.call_args.args[0]:
+            user.user_id = uuid.uuid4()
+            user.updated_at = datetime.now()
+
+    mock_session.flush.side_effect = flush
+    monkeypatch.setattr(user_handler, "get_db", lambda: nullcontext(mock_session))
+    login = user_service._submit_all(threading.Event().wait, [(0.1,)])
+
+    body = {
+        "users": [_user(i).model_dump(by_alias=True) for i in range(MAX_BULK_USERS)]
+    }
+    response = user_handler.create_users_bulk_handler(body)
+
+    assert response.status_code == 201
+    assert len(response.body) == MAX_BULK_USERS
+    login[0].result()
@@ -38,7 +38,7 @@ const CustomerSelect = ({
       try {
         setIsLoading(true);
         const res = await searchCustomers(debouncedKeyword);
-        setCustomers(res.data);
+        setCustomers(res.data.customers);
       } finally {
         setIsLoading(false);
       }
@@ -38,7 +38,7 @@ const ProductSelect = ({
       try {
         setIsLoading(true);
         const res = await searchProducts(debouncedKeyword);
-        setProducts(res.data);
+        setProducts(res.data.products);
       } finally {
         setIsLoading(false);
       }
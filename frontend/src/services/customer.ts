@@ -2,7 +2,7 @@ import { axiosInstance } from "@/lib/axios";
 import type { Customer } from "@orders/types/order";
 
 export const searchCustomers = async (query: string) => {
-  const res = await axiosInstance.get<Customer[]>(`/customers`, {
+  const res = await axiosInstance.get<{ customers: Customer[] }>(`/customers`, {
     params: {
       query,
     },
@@ -2,7 +2,7 @@ import { axiosInstance } from "@/lib/axios";
 import type { Product } from "@orders/types/product";
 
 export const searchProducts = async (query: string) => {
-  const res = await axiosInstance.get<Product[]>(`/products`, {
+  const res = await axiosInstance.get<{ products: Product[] }>(`/products`, {
     params: {
       query,
     },